@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Benchmark the infobox parameter parser against the former char-by-char one.
+
+Usage: ``python dev/bench_infobox_parser.py [--rounds N]``.  Both parsers must
+return identical results on the corpus, otherwise the script fails.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import pathlib
+import sys
+import timeit
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "fax_portal.settings")
+
+
+def reference_parse_params(raw: str) -> dict[str, str]:
+    """Original parser walking the body one character at a time."""
+    from wiki.infoboxes.parser import _normalize_key
+
+    params: dict[str, str] = {}
+    key: list[str] | str | None = None
+    val: list[str] = []
+    quote: str | None = None
+    for ch in raw:
+        if key is None:
+            if ch == "|":
+                key, val = [], []
+            continue
+        if quote:
+            if ch == quote:
+                quote = None
+            else:
+                val.append(ch)
+            continue
+        if ch in ('"', "'"):
+            quote = ch
+            continue
+        if ch == "=" and not val:
+            key = _normalize_key("".join(key))
+            continue
+        if ch == "|":
+            if isinstance(key, str):
+                params[key] = "".join(val).strip()
+            key, val = [], []
+            continue
+        if isinstance(key, list):
+            key.append(ch)
+        else:
+            val.append(ch)
+    if isinstance(key, str):
+        params[key] = "".join(val).strip()
+    return params
+
+
+def corpus() -> list[str]:
+    city = (
+        "\n| name = Praha\n| native_name = 'Hlavní město Praha'\n| country = Česko\n"
+        "| population = 1 357 326\n| area_km2 = 496,21\n| coords = 50°05′N 14°25′E\n"
+        '| motto = "Praga | caput rei publicae"\n| website = https://praha.eu/?a=1\n'
+    )
+    return [city, city * 20, "| a=1 | b = 2 " * 200, "no params at all"]
+
+
+def main() -> None:
+    import django
+
+    django.setup()
+    from wiki.infoboxes.parser import parse_params
+
+    args = argparse.ArgumentParser(description=__doc__)
+    args.add_argument("--rounds", type=int, default=2000)
+    rounds = args.parse_args().rounds
+
+    for raw in corpus():
+        if parse_params(raw) != reference_parse_params(raw):
+            raise SystemExit(f"parsers disagree on {raw[:40]!r}")
+    for raw in corpus():
+        old = timeit.timeit(lambda raw=raw: reference_parse_params(raw), number=rounds)
+        new = timeit.timeit(lambda raw=raw: parse_params(raw), number=rounds)
+        print(
+            f"{len(raw):>6} chars  char-by-char {old:.3f}s  tokenizer {new:.3f}s  ×{old / new:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -8,15 +8,16 @@ def woorld_date(request):
 
 
 def woorld_calendar_meta(request):
-    """Expose calendar metadata for the current session year.
+    """Expose URL and content hash of the calendar metadata bundle.
 
-    The year is taken from the stored session date if present; otherwise
-    year 1 is assumed.
+    The bundle covers the block of years around the stored session date (year 1
+    when none is set); the picker fetches it lazily, so pages only embed the
+    reference instead of serialized month data.
     """
 
-    import json
+    from django.urls import reverse
 
-    from . import core
+    from .meta import bundle_hash, bundle_range
     from .utils import parse_woorld_date
 
     date_str = request.session.get("woorld_current_date", "")
@@ -26,16 +27,11 @@ def woorld_calendar_meta(request):
             raise ValueError
     except Exception:
         year = 1
-    meta = {
-        "year": year,
-        "E": core.E(year),
-        "month_lengths": core.month_lengths(year),
-        "anchors": core.anchors(year),
-        "weekday_names": core.WEEKDAY_NAMES,
-    }
+    start, end = bundle_range(year)
+    digest = bundle_hash(start, end)
+    url = reverse("fax_calendar:meta_bundle", kwargs={"start": start, "end": end})
     return {
-        "WOORLD_CALENDAR_META": meta,
-        "WOORLD_CALENDAR_MONTH_LENGTHS_JSON": json.dumps(meta["month_lengths"]),
-        "WOORLD_CALENDAR_ANCHORS_JSON": json.dumps(meta["anchors"]),
+        "WOORLD_CALENDAR_META_URL": f"{url}?v={digest}",
+        "WOORLD_CALENDAR_META_HASH": digest,
         "WOORLD_TODAY": request.session.get("woorld_today"),
     }
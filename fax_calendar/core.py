@@ -9,6 +9,8 @@ The calendar starts on Monday (weekday 0) on 1/1/1.
 
 from __future__ import annotations
 
+import threading
+
 TROPICAL_YEAR: float = 428.5646875
 PROMOTED_START: int = 303
 PROTO_V3_YEARS: set[int] = {689, 1067, 1433, 1657}
@@ -138,6 +140,20 @@ def to_ordinal(y: int, m: int, d: int) -> int:
     return sum(lengths[: m - 1]) + d
 
 
+# Rozestup roků v řadicím klíči; žádný rok nemá víc než 999 dní.
+ORDINAL_YEAR_STRIDE: int = 1000
+
+
+def ordinal_key(y: int, m: int, d: int) -> int:
+    """Return a sortable integer key ``y * 1000 + to_ordinal(y, m, d)``.
+
+    The key orders exactly like the normalized ``YYYY-MM-DD`` strings and is
+    used for the indexed companion columns of ``WoorldDateField``.
+    """
+
+    return y * ORDINAL_YEAR_STRIDE + to_ordinal(y, m, d)
+
+
 def from_ordinal(y: int, doy: int) -> tuple[int, int, int]:
     """Return (y, m, d) for given day-of-year ``doy``."""
 
@@ -154,11 +170,27 @@ def from_ordinal(y: int, doy: int) -> tuple[int, int, int]:
     raise ValueError("day-of-year out of range")  # pragma: no cover
 
 
+# _YEAR_STARTS[y] = počet dní před rokem y (roste líně, sdílené v procesu);
+# prodlužuje se jen pod zámkem, čtení už spočtených roků zámek nepotřebuje
+_YEAR_STARTS: list[int] = [0, 0]
+_YEAR_STARTS_LOCK = threading.Lock()
+
+
+def days_before_year(y: int) -> int:
+    """Return the number of days between 1/1/1 and 1/1/``y``."""
+
+    if y < 1:
+        return 0
+    if y >= len(_YEAR_STARTS):
+        with _YEAR_STARTS_LOCK:
+            while len(_YEAR_STARTS) <= y:
+                prev = len(_YEAR_STARTS) - 1
+                _YEAR_STARTS.append(_YEAR_STARTS[prev] + year_length(prev))
+    return _YEAR_STARTS[y]
+
+
 def weekday(y: int, m: int, d: int) -> int:
     """Return weekday index (0=Mon .. 6=Sun)."""
 
-    total = 0
-    for year in range(1, y):
-        total += year_length(year)
-    total += to_ordinal(y, m, d) - 1
+    total = days_before_year(y) + to_ordinal(y, m, d) - 1
     return total % 7
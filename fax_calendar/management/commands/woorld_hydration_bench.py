@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from fax_calendar import core
+from fax_calendar.model_fields import WoorldDateField
+from fax_calendar.values import WoorldDate, clear_intern_caches
+
+
+def _sample_dates(rows: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    out = []
+    for _ in range(rows):
+        y = rng.randint(2020, 2030)
+        m = rng.randint(1, 15)
+        d = rng.randint(1, core.month_lengths(y)[m - 1])
+        out.append(f"{y:04d}-{m:02d}-{d:02d}")
+    return out
+
+
+def _timed(fn) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+class Command(BaseCommand):
+    help = "Benchmark hydrating WoorldDateField values (legacy parse vs. fast path)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100_000)
+        parser.add_argument("--seed", type=int, default=1)
+
+    def handle(self, *args, **opts):
+        rows = _sample_dates(opts["rows"], opts["seed"])
+        field = WoorldDateField(null=True)
+        clear_intern_caches()
+
+        legacy, legacy_out = _timed(lambda: [field._normalize(v) for v in rows])
+        fast, fast_out = _timed(lambda: [field.from_db_value(v, None, None) for v in rows])
+        if legacy_out != fast_out:
+            raise AssertionError("fast path differs from legacy normalization")
+        values, _ = _timed(lambda: [WoorldDate.from_iso(v).weekday for v in fast_out])
+
+        distinct = len({id(v) for v in fast_out})
+        self.stdout.write(
+            f"rows={len(rows)} legacy={legacy:.3f}s fast={fast:.3f}s "
+            f"speedup={legacy / fast if fast else float('inf'):.1f}x "
+            f"distinct_objects={distinct} weekday_values={values:.3f}s"
+        )
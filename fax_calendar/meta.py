@@ -0,0 +1,66 @@
+"""Precomputed, content-hashed calendar metadata bundles for the frontend."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from functools import lru_cache
+
+from . import core
+
+# Zvyš při změně tvaru bundle nebo pravidel kalendáře → změní se hash i URL.
+META_BUNDLE_VERSION = 1
+# Bundle pokrývá zarovnaný blok let, aby stránky ve stejném období sdílely URL.
+META_BUNDLE_SPAN = 10
+# Horní mez rozsahu, který endpoint ochotně spočítá.
+META_BUNDLE_MAX_YEARS = 200
+
+
+def bundle_range(year: int) -> tuple[int, int]:
+    """Return the aligned ``(start, end)`` block of years containing ``year``."""
+
+    start = max(1, year - (year - 1) % META_BUNDLE_SPAN)
+    return start, start + META_BUNDLE_SPAN - 1
+
+
+def _year_meta(y: int) -> dict:
+    return {
+        "E": core.E(y),
+        "month_lengths": core.month_lengths(y),
+        "anchors": core.anchors(y),
+        "year_length": core.year_length(y),
+    }
+
+
+@lru_cache(maxsize=64)
+def meta_bundle(start: int, end: int) -> tuple[bytes, str]:
+    """Serialized bundle for years ``start..end`` and its content hash.
+
+    Raises ``ValueError`` for empty or oversized ranges.
+    """
+
+    if start < 1 or end < start or end - start + 1 > META_BUNDLE_MAX_YEARS:
+        raise ValueError("invalid year range")
+    payload = {
+        "version": META_BUNDLE_VERSION,
+        "start": start,
+        "end": end,
+        "weekday_names": list(core.WEEKDAY_NAMES),
+        "years": {str(y): _year_meta(y) for y in range(start, end + 1)},
+    }
+    body = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode()
+    return body, hashlib.sha256(body).hexdigest()[:16]
+
+
+def bundle_hash(start: int, end: int) -> str:
+    return meta_bundle(start, end)[1]
+
+
+__all__ = [
+    "META_BUNDLE_VERSION",
+    "META_BUNDLE_SPAN",
+    "META_BUNDLE_MAX_YEARS",
+    "bundle_range",
+    "meta_bundle",
+    "bundle_hash",
+]
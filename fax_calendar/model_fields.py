@@ -4,9 +4,36 @@ from __future__ import annotations
 
 from datetime import date, datetime
 
+from django.core.exceptions import FieldDoesNotExist
 from django.db import models
+from django.db.models import lookups
+from django.db.models.expressions import Col
 
+from . import core
 from .forms import WoorldDateFormField, format_woorld_date, parse_woorld_date
+from .values import WoorldDate, intern_canonical, is_canonical
+
+
+def woorld_ordinal(value) -> int | None:
+    """Return :func:`fax_calendar.core.ordinal_key` for a stored/raw date value.
+
+    Empty or unparsable values map to ``None``.
+    """
+
+    if value in (None, ""):
+        return None
+    try:
+        if isinstance(value, str) and is_canonical(value):
+            return WoorldDate.from_iso(value).ordinal
+        if isinstance(value, date | datetime):
+            y, m, d = value.year, value.month, value.day
+        else:
+            y, m, d = parse_woorld_date(str(value))
+        if None in (y, m, d):
+            return None
+        return core.ordinal_key(int(y), int(m), int(d))
+    except Exception:
+        return None
 
 
 class WoorldDateField(models.CharField):
@@ -14,14 +41,29 @@ class WoorldDateField(models.CharField):
 
     All parsing and validation delegates to :mod:`fax_calendar.forms` which in
     turn relies on :mod:`fax_calendar.core` for month lengths and leap rules.
+
+    With ``ordinal_field="<name>"`` the field keeps an integer companion column
+    (declared on the model right after it) filled on save with
+    :func:`woorld_ordinal`; range lookups (``lt``/``lte``/``gt``/``gte``/``range``)
+    are then compiled against that indexed column.  Models should inherit
+    :class:`WoorldOrdinalsMixin` so ``save(update_fields=...)`` also writes the
+    companion; ``QuerySet.update()`` bypasses it – use :func:`backfill_ordinals`
+    afterwards.
     """
 
     description = "Woorld calendar date"
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, ordinal_field: str | None = None, **kwargs):
         kwargs.setdefault("max_length", 16)
+        self.ordinal_field = ordinal_field
         super().__init__(*args, **kwargs)
 
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.ordinal_field:
+            kwargs["ordinal_field"] = self.ordinal_field
+        return name, path, args, kwargs
+
     # ------------------------------------------------------------------
     # Normalization helpers
     # ------------------------------------------------------------------
@@ -42,12 +84,141 @@ class WoorldDateField(models.CharField):
         return v or None if self.null else v
 
     def from_db_value(self, value, expression, connection):  # pragma: no cover - Django API
+        # rychlá cesta: uložené hodnoty už jsou normalizované – bez regexu a validace,
+        # stejné datum sdílí jeden objekt str
+        if isinstance(value, str) and is_canonical(value):
+            return intern_canonical(value)
         return self._normalize(value)
 
+    def pre_save(self, model_instance, add):
+        value = super().pre_save(model_instance, add)
+        if self.ordinal_field:
+            setattr(model_instance, self.ordinal_field, woorld_ordinal(value))
+        return value
+
     def formfield(self, **kwargs):
         defaults = {"form_class": WoorldDateFormField}
         defaults.update(kwargs)
         return models.Field.formfield(self, **defaults)
 
 
-__all__ = ["WoorldDateField"]
+class _OrdinalLookupMixin:
+    """Přepíše porovnání na celočíselný stínový sloupec, pokud ho pole má."""
+
+    def as_sql(self, compiler, connection):
+        ordinal = self._ordinal_lookup()
+        if ordinal is not None:
+            return ordinal.as_sql(compiler, connection)
+        return super().as_sql(compiler, connection)
+
+    def _ordinal_lookup(self):
+        lhs = self.lhs
+        field = getattr(lhs, "target", None)
+        name = getattr(field, "ordinal_field", None)
+        if not (isinstance(lhs, Col) and name) or hasattr(self.rhs, "resolve_expression"):
+            return None
+        values = self.rhs if isinstance(self.rhs, list | tuple) else [self.rhs]
+        ordinals = [woorld_ordinal(v) for v in values]
+        if any(o is None for o in ordinals):
+            return None
+        companion = Col(lhs.alias, field.model._meta.get_field(name))
+        rhs = ordinals if isinstance(self.rhs, list | tuple) else ordinals[0]
+        return self.ordinal_lookup_class(companion, rhs)
+
+
+@WoorldDateField.register_lookup
+class OrdinalGreaterThan(_OrdinalLookupMixin, lookups.GreaterThan):
+    ordinal_lookup_class = lookups.GreaterThan
+
+
+@WoorldDateField.register_lookup
+class OrdinalGreaterThanOrEqual(_OrdinalLookupMixin, lookups.GreaterThanOrEqual):
+    ordinal_lookup_class = lookups.GreaterThanOrEqual
+
+
+@WoorldDateField.register_lookup
+class OrdinalLessThan(_OrdinalLookupMixin, lookups.LessThan):
+    ordinal_lookup_class = lookups.LessThan
+
+
+@WoorldDateField.register_lookup
+class OrdinalLessThanOrEqual(_OrdinalLookupMixin, lookups.LessThanOrEqual):
+    ordinal_lookup_class = lookups.LessThanOrEqual
+
+
+@WoorldDateField.register_lookup
+class OrdinalRange(_OrdinalLookupMixin, lookups.Range):
+    ordinal_lookup_class = lookups.Range
+
+
+def with_ordinal_fields(model, update_fields) -> list[str] | None:
+    """``update_fields`` doplněné o stínové sloupce uvedených datových polí."""
+
+    if update_fields is None:
+        return None
+    names = list(update_fields)
+    for name in list(names):
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            continue  # neznámé jméno ohlásí až Model.save
+        companion = getattr(field, "ordinal_field", None)
+        if companion and companion not in names:
+            names.append(companion)
+    return names
+
+
+class WoorldOrdinalsMixin:
+    """Model mixin: ``save(update_fields=[...])`` writes ordinal companions too.
+
+    ``pre_save`` of :class:`WoorldDateField` recomputes the companion, but
+    Django writes only the listed columns – without the mixin a partial save
+    of the date leaves a stale ordinal behind.
+    """
+
+    def save(self, *args, **kwargs):
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = with_ordinal_fields(type(self), kwargs["update_fields"])
+        return super().save(*args, **kwargs)
+
+
+def backfill_ordinals(model, *field_names: str, batch_size: int = 1000) -> int:
+    """Dopočítá stínové ordinály pro ``field_names`` modelu ``model``.
+
+    Použitelné v ``RunPython`` migracích (s historickým modelem) i po hromadných
+    ``update()``; vrací počet přepsaných řádků.
+    """
+
+    fields = [model._meta.get_field(name) for name in field_names]
+    fields = [f for f in fields if getattr(f, "ordinal_field", None)]
+    if not fields:
+        return 0
+    only = ["pk", *(f.name for f in fields), *(f.ordinal_field for f in fields)]
+    changed = []
+    total = 0
+    for obj in model._default_manager.only(*only).iterator(chunk_size=batch_size):
+        dirty = False
+        for f in fields:
+            ordinal = woorld_ordinal(getattr(obj, f.attname))
+            if getattr(obj, f.ordinal_field) != ordinal:
+                setattr(obj, f.ordinal_field, ordinal)
+                dirty = True
+        if dirty:
+            changed.append(obj)
+        if len(changed) >= batch_size:
+            model._default_manager.bulk_update(changed, [f.ordinal_field for f in fields])
+            total += len(changed)
+            changed = []
+    if changed:
+        model._default_manager.bulk_update(changed, [f.ordinal_field for f in fields])
+        total += len(changed)
+    return total
+
+
+__all__ = [
+    "WoorldDateField",
+    "WoorldOrdinalsMixin",
+    "backfill_ordinals",
+    "with_ordinal_fields",
+    "woorld_ordinal",
+]
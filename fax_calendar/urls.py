@@ -7,4 +7,5 @@ app_name = "fax_calendar"
 urlpatterns = [
     path("date/set/", views.set_woorld_date, name="set_woorld_date"),
     path("year/<int:y>/meta/", views.year_meta, name="year_meta"),
+    path("meta/<int:start>-<int:end>.json", views.meta_bundle, name="meta_bundle"),
 ]
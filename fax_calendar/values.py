@@ -0,0 +1,136 @@
+"""Compact immutable value type for Woorld dates and hydration helpers."""
+
+from __future__ import annotations
+
+from functools import lru_cache, total_ordering
+
+from . import core
+
+# Kolik různých dat si proces pamatuje (interning stringů i hodnot WoorldDate).
+INTERN_CACHE_SIZE = 65536
+
+
+def is_canonical(value: str) -> bool:
+    """Return True for already-normalized storage strings ``YYYY-MM-DD``.
+
+    Only the shape is checked (no month/day ranges) – values written through
+    ``WoorldDateField`` were validated on the way in, so reads can trust them.
+    """
+
+    return (
+        len(value) == 10
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[:4].isdigit()
+        and value[5:7].isdigit()
+        and value[8:].isdigit()
+    )
+
+
+@lru_cache(maxsize=INTERN_CACHE_SIZE)
+def intern_canonical(value: str) -> str:
+    """Return one shared ``str`` object per distinct canonical date."""
+
+    return value
+
+
+@total_ordering
+class WoorldDate:
+    """Immutable Woorld date with lazily cached ordinal key and weekday.
+
+    Instances are interned per process via :meth:`from_iso`; compare and hash
+    by value, ``str()`` gives the storage format ``YYYY-MM-DD``.
+    """
+
+    __slots__ = ("year", "month", "day", "_iso", "_ordinal", "_weekday")
+
+    def __init__(self, year: int, month: int, day: int):
+        if not 1 <= month <= 15:
+            raise ValueError("month out of range")
+        if not 1 <= day <= core.month_lengths(year)[month - 1]:
+            raise ValueError("day out of range")
+        setter = object.__setattr__
+        setter(self, "year", year)
+        setter(self, "month", month)
+        setter(self, "day", day)
+        setter(self, "_iso", f"{year:04d}-{month:02d}-{day:02d}")
+        setter(self, "_ordinal", None)
+        setter(self, "_weekday", None)
+
+    @classmethod
+    def from_iso(cls, value: str) -> WoorldDate:
+        """Parse (and intern) a canonical ``YYYY-MM-DD`` string."""
+
+        return _from_iso(value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("WoorldDate is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("WoorldDate is immutable")
+
+    def __reduce__(self):
+        return (WoorldDate.from_iso, (self._iso,))
+
+    @property
+    def ordinal(self) -> int:
+        """Sortable key, see :func:`fax_calendar.core.ordinal_key`."""
+
+        if self._ordinal is None:
+            object.__setattr__(self, "_ordinal", core.ordinal_key(self.year, self.month, self.day))
+        return self._ordinal
+
+    @property
+    def day_of_year(self) -> int:
+        return self.ordinal - self.year * core.ORDINAL_YEAR_STRIDE
+
+    @property
+    def weekday(self) -> int:
+        """Weekday index (0=Mon .. 6=Sun)."""
+
+        if self._weekday is None:
+            object.__setattr__(self, "_weekday", core.weekday(self.year, self.month, self.day))
+        return self._weekday
+
+    def isoformat(self) -> str:
+        return self._iso
+
+    def __str__(self) -> str:
+        return self._iso
+
+    def __repr__(self) -> str:
+        return f"WoorldDate({self.year}, {self.month}, {self.day})"
+
+    def __hash__(self) -> int:
+        return hash(self._iso)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, WoorldDate):
+            return self._iso == other._iso
+        return NotImplemented
+
+    def __lt__(self, other) -> bool:
+        if isinstance(other, WoorldDate):
+            return self._iso < other._iso
+        return NotImplemented
+
+
+@lru_cache(maxsize=INTERN_CACHE_SIZE)
+def _from_iso(value: str) -> WoorldDate:
+    if not is_canonical(value):
+        raise ValueError(f"Not a canonical Woorld date: {value!r}")
+    return WoorldDate(int(value[:4]), int(value[5:7]), int(value[8:]))
+
+
+def clear_intern_caches() -> None:
+    intern_canonical.cache_clear()
+    _from_iso.cache_clear()
+
+
+__all__ = [
+    "INTERN_CACHE_SIZE",
+    "WoorldDate",
+    "is_canonical",
+    "intern_canonical",
+    "clear_intern_caches",
+]
@@ -1,13 +1,17 @@
 """Views for Woorld calendar utilities."""
 
 from django.http import (
+    HttpResponse,
     HttpResponseBadRequest,
+    HttpResponseNotModified,
     HttpResponseRedirect,
     JsonResponse,
 )
-from django.views.decorators.http import require_POST
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import require_GET, require_POST
 
 from . import core
+from .meta import meta_bundle as build_meta_bundle
 from .utils import format_woorld_date, parse_woorld_date
 
 
@@ -39,3 +43,31 @@ def year_meta(request, y: int) -> JsonResponse:
         "year_length": core.year_length(y),
     }
     return JsonResponse(data)
+
+
+# Odkaz s aktuálním ?v=<hash> se nikdy nezmění → lze cachovat „navždy“.
+META_BUNDLE_IMMUTABLE_MAX_AGE = 60 * 60 * 24 * 365
+META_BUNDLE_MAX_AGE = 60 * 60
+
+
+@require_GET
+def meta_bundle(request, start: int, end: int) -> HttpResponse:
+    """Return precomputed metadata for years ``start..end`` with a content ETag."""
+
+    try:
+        body, digest = build_meta_bundle(start, end)
+    except ValueError as exc:
+        return HttpResponseBadRequest(str(exc))
+    etag = f'"{digest}"'
+    if etag in request.headers.get("If-None-Match", ""):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(body, content_type="application/json")
+    response["ETag"] = etag
+    if request.GET.get("v") == digest:
+        patch_cache_control(
+            response, public=True, max_age=META_BUNDLE_IMMUTABLE_MAX_AGE, immutable=True
+        )
+    else:
+        patch_cache_control(response, public=True, max_age=META_BUNDLE_MAX_AGE)
+    return response
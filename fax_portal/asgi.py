@@ -5,3 +5,7 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "fax_portal.settings")
 
 application = get_asgi_application()
+
+from search.warmup import warm_indexes  # noqa: E402
+
+warm_indexes()
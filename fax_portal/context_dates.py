@@ -4,6 +4,9 @@ from msa.utils.dates import get_active_date
 
 
 def active_date_ctx(request):
-    """Expose active_date and ISO representation to templates."""
+    """Expose active_date and ISO representation to templates.
+
+    The date is memoized on the request, so this does not re-parse sources.
+    """
     d = get_active_date(request)
     return {"active_date": d, "active_date_iso": d.isoformat()}
@@ -29,6 +29,7 @@ INSTALLED_APPS = [
     "sports",
     "mma",
     "msa",
+    "search",
 ]
 
 # Ensure apps are unique while preserving order
@@ -40,6 +41,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "msa.middleware.ActiveDateMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -114,10 +116,41 @@ OFM_STYLE_URL = os.getenv("OFM_STYLE_URL", "")
 # Draw engine feature flag
 MSA_DRAW_ENGINE = os.getenv("MSA_DRAW_ENGINE", "v1")
 
+# Cache – bez externích služeb: locmem, nebo sdílený souborový backend přes FAX_CACHE_DIR
+# (více worker procesů pak vidí stejné purge tagů).
+FAX_CACHE_DIR = os.getenv("FAX_CACHE_DIR", "")
+if FAX_CACHE_DIR:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": FAX_CACHE_DIR,
+            "OPTIONS": {"MAX_ENTRIES": 10000},
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "fax-default",
+            "OPTIONS": {"MAX_ENTRIES": 5000},
+        }
+    }
+
 # MSA
 MSA_ADMIN_MODE = True
+MSA_RESPONSE_CACHE_ENABLED = os.getenv("MSA_RESPONSE_CACHE_ENABLED", "1") == "1"
+MSA_RESPONSE_CACHE_TIMEOUT = int(os.getenv("MSA_RESPONSE_CACHE_TIMEOUT", "300"))
 MSA_ARCHIVE_LIMIT_COUNT = int(os.getenv("MSA_ARCHIVE_LIMIT_COUNT", "50"))
 MSA_ARCHIVE_LIMIT_MB = int(os.getenv("MSA_ARCHIVE_LIMIT_MB", "50"))
+# SSE live feed: pod WSGI nechte 0 (klient se znovu připojí s Last-Event-ID)
+MSA_LIVE_STREAM_SECONDS = float(os.getenv("MSA_LIVE_STREAM_SECONDS", "0"))
+MSA_LIVE_FEED_RETENTION_DAYS = int(os.getenv("MSA_LIVE_FEED_RETENTION_DAYS", "14"))
+
+# Search
+SEARCH_RESULT_CACHE_ENABLED = os.getenv("SEARCH_RESULT_CACHE_ENABLED", "1") == "1"
+SEARCH_RESULT_CACHE_TIMEOUT = int(os.getenv("SEARCH_RESULT_CACHE_TIMEOUT", "300"))
+SEARCH_TIME_BUDGET = float(os.getenv("SEARCH_TIME_BUDGET", "2.0"))
+SEARCH_POOL_SIZE = int(os.getenv("SEARCH_POOL_SIZE", "4"))
 
 if "rest_framework" in INSTALLED_APPS:
     REST_FRAMEWORK = {
@@ -50,6 +50,16 @@ urlpatterns = [
         msa_views.tournament_history_api,
         name="msa-tournament-history-api",
     ),
+    path(
+        "api/msa/tournament/<int:tournament_id>/changes",
+        msa_views.tournament_changes_api,
+        name="msa-tournament-changes-api",
+    ),
+    path(
+        "api/msa/tournament/<int:tournament_id>/changes/stream",
+        msa_views.tournament_changes_stream,
+        name="msa-tournament-changes-stream",
+    ),
     # pouze nový MSA mount s namespace "msa"
     path("msa/", include("msa.urls", namespace="msa")),
     path("status/live-badge", msa_views.nav_live_badge, name="nav_live_badge"),
@@ -0,0 +1,59 @@
+from datetime import datetime
+
+from search.registry import SearchSource, register
+
+from .models import Event, Fighter, Organization
+
+
+def _fighter_title(f) -> str:
+    return " ".join(filter(None, [f.first_name, f.last_name])) or f.slug
+
+
+register(
+    SearchSource(
+        name="mma.fighter",
+        model=Fighter,
+        type="MMA",
+        source="mma",
+        queryset=lambda: Fighter.objects.all(),
+        title=_fighter_title,
+        url=lambda f: f"/mma/fighters/{f.slug}/",
+        snippet=lambda f: f.nickname or f.country or "",
+        search_fields=("first_name", "last_name", "nickname"),
+        slug_field="slug",
+        ordering=("-id",),
+    )
+)
+
+register(
+    SearchSource(
+        name="mma.event",
+        model=Event,
+        type="MMA",
+        source="mma",
+        queryset=lambda: Event.objects.select_related("organization"),
+        title=lambda e: e.name,
+        url=lambda e: f"/mma/events/{e.slug}/",
+        snippet=lambda e: getattr(e.organization, "name", ""),
+        date=lambda e: datetime.combine(e.date_start, datetime.min.time()),
+        search_fields=("name",),
+        slug_field="slug",
+        ordering=("-date_start",),
+    )
+)
+
+register(
+    SearchSource(
+        name="mma.organization",
+        model=Organization,
+        type="MMA",
+        source="mma",
+        queryset=lambda: Organization.objects.all(),
+        title=lambda o: o.name,
+        url=lambda o: f"/mma/organizations/{o.slug}/",
+        snippet=lambda o: o.short_name or "",
+        search_fields=("name", "short_name"),
+        slug_field="slug",
+        ordering=("-id",),
+    )
+)
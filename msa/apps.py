@@ -5,3 +5,12 @@ class MsaConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "msa"
     verbose_name = "MSA — Men’s Squash"
+
+    def ready(self) -> None:
+        from msa.services import (
+            live_state,  # noqa: F401 - registruje signály počítadel
+            view_cache,  # noqa: F401 - registruje signály verzí view-modelů
+        )
+        from msa.utils.dates import warm_converters
+
+        warm_converters()
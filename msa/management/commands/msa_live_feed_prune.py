@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from msa.services.live_feed import prune_changes
+
+
+class Command(BaseCommand):
+    help = "Delete live feed match changes older than the retention window"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=None)
+
+    def handle(self, *args, **opts):
+        deleted = prune_changes(opts.get("days"))
+        self.stdout.write(f"deleted={deleted}")
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from msa.services.live_state import reconcile_live_states
+
+
+class Command(BaseCommand):
+    help = "Recount live match counters used by the navigation live badge"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tournament", type=int, action="append", dest="tournaments")
+
+    def handle(self, *args, **opts):
+        result = reconcile_live_states(opts.get("tournaments"))
+        live = sum(v[0] for v in result.values())
+        partial = sum(v[1] for v in result.values())
+        self.stdout.write(f"tournaments={len(result)} live={live} partial={partial}")
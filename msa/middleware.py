@@ -0,0 +1,24 @@
+# msa/middleware.py
+from __future__ import annotations
+
+from django.utils.functional import SimpleLazyObject
+
+from msa.utils.dates import get_active_date, get_active_season
+
+
+class ActiveDateMiddleware:
+    """Vyřeší aktivní datum jednou za request a sezónu k němu líně.
+
+    ``request.active_date`` je ``date``, ``request.active_season`` líný objekt
+    (dotaz do indexu sezón až při prvním přístupu).  Views i context procesory
+    čtou stejnou hodnotu přes :func:`msa.utils.dates.get_active_date` /
+    :func:`msa.utils.dates.get_active_season`.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.active_date = get_active_date(request)
+        request.active_season = SimpleLazyObject(lambda: get_active_season(request))
+        return self.get_response(request)
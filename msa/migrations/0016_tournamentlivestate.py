@@ -0,0 +1,92 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def _flags(state, score):
+    # zmrazená kopie live_flags/match_status_and_sets z doby migrace
+    state = (state or "").upper()
+    if state == "LIVE":
+        return 1, 0
+    if state == "DONE":
+        return 0, 0
+    if not isinstance(score, dict):
+        return 0, 0
+    meta = score.get("meta")
+    if isinstance(meta, dict) and str(meta.get("status") or "").strip().lower() == "live":
+        return 0, 1
+    raw_sets = score.get("sets") or []
+    if not isinstance(raw_sets, list):
+        return 0, 0
+    sets, partial = 0, False
+    for item in raw_sets:
+        if isinstance(item, dict):
+            raw_a = item.get("a", item.get("top"))
+            raw_b = item.get("b", item.get("bottom"))
+            status = str(item.get("status") or "").strip().lower()
+        elif isinstance(item, list | tuple) and len(item) >= 2:
+            raw_a, raw_b, status = item[0], item[1], ""
+        else:
+            partial = True
+            continue
+        if raw_a in (None, "", "-") or raw_b in (None, "", "-"):
+            partial = True
+        try:
+            int(raw_a), int(raw_b)
+        except (TypeError, ValueError):
+            partial = True
+            continue
+        if status and status not in {"finished", "done", "completed"}:
+            partial = True
+        sets += 1
+    status = {"SCHEDULED": "scheduled", "PENDING": "scheduled", "": "scheduled"}.get(state)
+    if partial and (status != "scheduled" or sets):
+        return 0, 1
+    return 0, 0
+
+
+def count_live(apps, schema_editor):
+    Match = apps.get_model("msa", "Match")
+    TournamentLiveState = apps.get_model("msa", "TournamentLiveState")
+    counts = {}
+    rows = Match.objects.exclude(state="DONE").values_list("tournament_id", "state", "score")
+    for tournament_id, state, score in rows.iterator(chunk_size=2000):
+        explicit, partial = _flags(state, score)
+        if tournament_id and (explicit or partial):
+            live = counts.setdefault(tournament_id, [0, 0])
+            live[0] += explicit
+            live[1] += partial
+    TournamentLiveState.objects.bulk_create(
+        TournamentLiveState(tournament_id=tid, live_count=live, partial_count=partial)
+        for tid, (live, partial) in counts.items()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("msa", "0015_matchchange"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TournamentLiveState",
+            fields=[
+                (
+                    "tournament",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="live_state",
+                        serialize=False,
+                        to="msa.tournament",
+                    ),
+                ),
+                ("live_count", models.PositiveIntegerField(db_index=True, default=0)),
+                ("partial_count", models.PositiveIntegerField(db_index=True, default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(count_live, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("msa", "0016_tournamentlivestate"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TournamentViewVersion",
+            fields=[
+                (
+                    "tournament",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="view_version",
+                        serialize=False,
+                        to="msa.tournament",
+                    ),
+                ),
+                ("version", models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+    ]
@@ -0,0 +1,112 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:23
+
+from django.db import migrations, models
+
+import fax_calendar.model_fields
+
+ORDINAL_FIELDS = {
+    "Season": ("start_date", "end_date"),
+    "Tournament": ("start_date", "end_date"),
+    "Schedule": ("play_date",),
+    "RankingSnapshot": ("monday_date",),
+}
+
+
+def backfill(apps, schema_editor):
+    for model_name, fields in ORDINAL_FIELDS.items():
+        fax_calendar.model_fields.backfill_ordinals(apps.get_model("msa", model_name), *fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("msa", "0017_tournamentviewversion"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="schedule",
+            options={"ordering": ["play_ordinal", "order"]},
+        ),
+        migrations.AlterModelOptions(
+            name="season",
+            options={"ordering": ["start_ordinal"]},
+        ),
+        migrations.AlterModelOptions(
+            name="tournament",
+            options={"ordering": ["-start_ordinal", "name"]},
+        ),
+        migrations.AddField(
+            model_name="rankingsnapshot",
+            name="monday_ordinal",
+            field=models.IntegerField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="schedule",
+            name="play_ordinal",
+            field=models.IntegerField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="season",
+            name="end_ordinal",
+            field=models.IntegerField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="season",
+            name="start_ordinal",
+            field=models.IntegerField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="tournament",
+            name="end_ordinal",
+            field=models.IntegerField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="tournament",
+            name="start_ordinal",
+            field=models.IntegerField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.AlterField(
+            model_name="rankingsnapshot",
+            name="monday_date",
+            field=fax_calendar.model_fields.WoorldDateField(
+                db_index=True, max_length=16, ordinal_field="monday_ordinal"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="schedule",
+            name="play_date",
+            field=fax_calendar.model_fields.WoorldDateField(
+                blank=True, max_length=16, null=True, ordinal_field="play_ordinal"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="season",
+            name="end_date",
+            field=fax_calendar.model_fields.WoorldDateField(
+                blank=True, max_length=16, null=True, ordinal_field="end_ordinal"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="season",
+            name="start_date",
+            field=fax_calendar.model_fields.WoorldDateField(
+                blank=True, max_length=16, null=True, ordinal_field="start_ordinal"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="tournament",
+            name="end_date",
+            field=fax_calendar.model_fields.WoorldDateField(
+                blank=True, max_length=16, null=True, ordinal_field="end_ordinal"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="tournament",
+            name="start_date",
+            field=fax_calendar.model_fields.WoorldDateField(
+                blank=True, max_length=16, null=True, ordinal_field="start_ordinal"
+            ),
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
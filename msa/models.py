@@ -5,7 +5,7 @@ from django.core.validators import MinValueValidator, RegexValidator
 from django.db import models
 from django.utils import timezone
 
-from fax_calendar.model_fields import WoorldDateField
+from fax_calendar.model_fields import WoorldDateField, WoorldOrdinalsMixin
 from msa.services.scoring_skeleton import build_md_skeleton, build_qual_skeleton
 
 
@@ -72,7 +72,7 @@ class RankingScope(models.TextChoices):
     BOTH = "BOTH", "Both"
 
 
-class Season(models.Model):
+class Season(WoorldOrdinalsMixin, models.Model):
     name = models.CharField(
         max_length=32,
         unique=True,
@@ -80,16 +80,36 @@ class Season(models.Model):
         blank=True,
         validators=[RegexValidator(r"^\d{4}/\d{2}$", message="Season name must be YYYY/NN")],
     )
-    start_date = WoorldDateField(null=True, blank=True)
-    end_date = WoorldDateField(null=True, blank=True)
+    start_date = WoorldDateField(null=True, blank=True, ordinal_field="start_ordinal")
+    end_date = WoorldDateField(null=True, blank=True, ordinal_field="end_ordinal")
+    start_ordinal = models.IntegerField(null=True, blank=True, editable=False, db_index=True)
+    end_ordinal = models.IntegerField(null=True, blank=True, editable=False, db_index=True)
     best_n = models.PositiveSmallIntegerField(default=16, null=True, blank=True)
 
     class Meta:
-        ordering = ["start_date"]
+        ordering = ["start_ordinal"]
 
     def __str__(self):
         return self.name or "<Season>"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        from msa.services.response_cache import ALL_TOURNAMENTS_TAG, purge_tags, season_tag
+        from msa.utils.dates import invalidate_season_index
+
+        purge_tags(season_tag(self.pk), ALL_TOURNAMENTS_TAG)
+        invalidate_season_index()
+
+    def delete(self, *args, **kwargs):
+        from msa.services.response_cache import ALL_TOURNAMENTS_TAG, purge_tags, season_tag
+        from msa.utils.dates import invalidate_season_index
+
+        pk = self.pk
+        result = super().delete(*args, **kwargs)
+        purge_tags(season_tag(pk), ALL_TOURNAMENTS_TAG)
+        invalidate_season_index()
+        return result
+
 
 class Tour(models.Model):
     name = models.CharField(max_length=64, unique=True)
@@ -265,7 +285,7 @@ class PlayerLicense(models.Model):
         return f"{self.player or '?'} @ {self.season or '?'}"
 
 
-class Tournament(models.Model):
+class Tournament(WoorldOrdinalsMixin, models.Model):
     season = models.ForeignKey(Season, on_delete=models.PROTECT, null=True, blank=True)
     category = models.ForeignKey(Category, on_delete=models.PROTECT, null=True, blank=True)
     category_season = models.ForeignKey(
@@ -274,8 +294,10 @@ class Tournament(models.Model):
 
     name = models.CharField(max_length=120, null=True, blank=True)
     slug = models.SlugField(max_length=140, unique=True, null=True, blank=True)
-    start_date = WoorldDateField(null=True, blank=True)
-    end_date = WoorldDateField(null=True, blank=True)
+    start_date = WoorldDateField(null=True, blank=True, ordinal_field="start_ordinal")
+    end_date = WoorldDateField(null=True, blank=True, ordinal_field="end_ordinal")
+    start_ordinal = models.IntegerField(null=True, blank=True, editable=False, db_index=True)
+    end_ordinal = models.IntegerField(null=True, blank=True, editable=False, db_index=True)
     draw_size = models.PositiveSmallIntegerField(null=True, blank=True)
 
     qualifiers_count = models.PositiveSmallIntegerField(null=True, blank=True)
@@ -323,7 +345,7 @@ class Tournament(models.Model):
     updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
 
     class Meta:
-        ordering = ["-start_date", "name"]
+        ordering = ["-start_ordinal", "name"]
 
     def __str__(self):
         return self.name or self.slug or "<Tournament>"
@@ -345,6 +367,14 @@ class Tournament(models.Model):
                         tp = getattr(cs, name, None)
                 self.third_place_enabled = bool(tp)
         super().save(*args, **kwargs)
+        from msa.services.response_cache import (
+            ALL_TOURNAMENTS_TAG,
+            purge_tags,
+            season_tag,
+            tournament_tag,
+        )
+
+        purge_tags(tournament_tag(self.pk), season_tag(self.season_id), ALL_TOURNAMENTS_TAG)
 
     @property
     def qualifiers_count_effective(self) -> int:
@@ -503,10 +533,37 @@ class Match(models.Model):
     def __str__(self):
         return f"{getattr(self.tournament, 'slug', None) or '?'}:{self.phase or '?'}:{self.round_name or '?'}"
 
+    # pole, na kterých závisí live počítadla (TournamentLiveState)
+    LIVE_FIELDS = frozenset({"state", "score", "tournament", "tournament_id"})
+
+    def save(self, *args, **kwargs):
+        # každý zápis (služby, admin, import) promítne změnu live stavu do počítadel
+        from msa.services.live_state import note_live_transition
+
+        update_fields = kwargs.get("update_fields")
+        tracked = update_fields is None or bool(self.LIVE_FIELDS & set(update_fields))
+        before = None
+        if tracked:
+            before = (None, (0, 0)) if self._state.adding else self._loaded_live_state()
+        super().save(*args, **kwargs)
+        if tracked:
+            self._live_before = note_live_transition(self, before)
 
-class Schedule(models.Model):
+    def _loaded_live_state(self):
+        # stav po posledním save() této instance; jinak jeden dotaz (čtení nic nepočítá)
+        cached = getattr(self, "_live_before", None)
+        if cached is not None:
+            return cached
+        from msa.services.live_state import live_flags
+
+        row = type(self).objects.filter(pk=self.pk).only("tournament", "state", "score").first()
+        return (row.tournament_id, live_flags(row)) if row else (None, (0, 0))
+
+
+class Schedule(WoorldOrdinalsMixin, models.Model):
     tournament = models.ForeignKey(Tournament, on_delete=models.CASCADE, null=True, blank=True)
-    play_date = WoorldDateField(null=True, blank=True)
+    play_date = WoorldDateField(null=True, blank=True, ordinal_field="play_ordinal")
+    play_ordinal = models.IntegerField(null=True, blank=True, editable=False, db_index=True)
     order = models.PositiveIntegerField(null=True, blank=True)
     match = models.OneToOneField(
         Match, on_delete=models.CASCADE, related_name="schedule", null=True, blank=True
@@ -518,7 +575,7 @@ class Schedule(models.Model):
                 fields=["tournament", "play_date", "order"], name="uniq_tournament_day_order"
             )
         ]
-        ordering = ["play_date", "order"]
+        ordering = ["play_ordinal", "order"]
 
 
 class Snapshot(models.Model):
@@ -575,14 +632,15 @@ class RankingAdjustment(models.Model):
         ordering = ["-start_monday", "-duration_weeks"]
 
 
-class RankingSnapshot(models.Model):
+class RankingSnapshot(WoorldOrdinalsMixin, models.Model):
     class Type(models.TextChoices):
         ROLLING = "ROLLING"
         SEASON = "SEASON"
         RTF = "RTF"
 
     type = models.CharField(max_length=16, choices=Type.choices, db_index=True)
-    monday_date = WoorldDateField(db_index=True)
+    monday_date = WoorldDateField(db_index=True, ordinal_field="monday_ordinal")
+    monday_ordinal = models.IntegerField(null=True, blank=True, editable=False, db_index=True)
     hash = models.CharField(max_length=64, db_index=True)
     payload = models.JSONField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -599,3 +657,55 @@ class RankingSnapshot(models.Model):
     class Meta:
         unique_together = (("type", "monday_date"),)
         indexes = [models.Index(fields=["type", "hash"])]
+
+
+class MatchChange(models.Model):
+    """Append-only log změn zápasů pro live feed (cursor = id)."""
+
+    class Kind(models.TextChoices):
+        STATE = "STATE", "State"
+        SCORE = "SCORE", "Score"
+        SCHEDULE = "SCHEDULE", "Schedule"
+
+    tournament = models.ForeignKey(
+        Tournament, on_delete=models.CASCADE, related_name="match_changes"
+    )
+    match = models.ForeignKey(
+        Match, on_delete=models.SET_NULL, null=True, blank=True, related_name="changes"
+    )
+    kind = models.CharField(max_length=16, choices=Kind.choices)
+    payload = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ["id"]
+        indexes = [models.Index(fields=["tournament", "id"], name="msa_matchchange_cursor")]
+
+    def __str__(self):
+        return f"{self.tournament_id}:{self.match_id}:{self.kind}#{self.pk}"
+
+
+class TournamentLiveState(models.Model):
+    """Čítače živých zápasů per turnaj (udržují služby, srovnává msa_live_reconcile)."""
+
+    tournament = models.OneToOneField(
+        Tournament, on_delete=models.CASCADE, primary_key=True, related_name="live_state"
+    )
+    live_count = models.PositiveIntegerField(default=0, db_index=True)
+    partial_count = models.PositiveIntegerField(default=0, db_index=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.tournament_id}: live={self.live_count} partial={self.partial_count}"
+
+
+class TournamentViewVersion(models.Model):
+    """Verze view-modelů turnaje; zvyšují ji signály modelů (klíč cache = turnaj + verze)."""
+
+    tournament = models.OneToOneField(
+        Tournament, on_delete=models.CASCADE, primary_key=True, related_name="view_version"
+    )
+    version = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.tournament_id}@v{self.version}"
@@ -0,0 +1,45 @@
+from django.urls import reverse
+
+from search.registry import SearchSource, recency, register
+
+from .models import Player, Tournament
+
+
+def _player_title(p) -> str:
+    return p.full_name or p.name or " ".join(filter(None, [p.first_name, p.last_name]))
+
+
+register(
+    SearchSource(
+        name="msa.player",
+        model=Player,
+        type="MSA",
+        source="msa",
+        queryset=lambda: Player.objects.select_related("country"),
+        title=_player_title,
+        url=lambda p: f"{reverse('msa:players_list')}#player-{p.pk}",
+        snippet=lambda p: getattr(p.country, "name", None) or getattr(p.country, "iso3", "") or "",
+        search_fields=("name", "full_name", "first_name", "last_name"),
+        ordering=("-id",),
+    )
+)
+
+register(
+    SearchSource(
+        name="msa.tournament",
+        model=Tournament,
+        type="MSA",
+        source="msa",
+        queryset=lambda: Tournament.objects.select_related("season", "category"),
+        title=lambda t: t.name or t.slug or f"#{t.pk}",
+        url=lambda t: reverse("msa:tournament_info", args=[t.pk]),
+        snippet=lambda t: ", ".join(
+            filter(None, [getattr(t.category, "name", ""), getattr(t.season, "name", "")])
+        ),
+        date=lambda t: t.updated_at,
+        search_fields=("name",),
+        slug_field="slug",
+        ordering=("-updated_at",),
+        popularity=lambda t: recency(t.updated_at),
+    )
+)
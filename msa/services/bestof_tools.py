@@ -7,12 +7,14 @@ from typing import Literal
 from msa.models import Match, Phase, Tournament
 from msa.services.admin_gate import require_admin_mode
 from msa.services.tx import atomic
+from msa.services.view_cache import bumps_view_version
 
 Mode = Literal["BO3", "BO5"]
 
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def bulk_set_best_of(
     tournament: Tournament,
     *,
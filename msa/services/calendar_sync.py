@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from typing import Protocol
 
@@ -8,6 +9,9 @@ from django.conf import settings
 
 from msa.models import Match, Schedule, Tournament
 
+# Velikost dávky pro QuerySet.iterator() při streamování exportů.
+ICS_CHUNK_SIZE = 500
+
 
 class _MatchLike(Protocol):
     id: int
@@ -39,12 +43,28 @@ def escape_ics(text: str) -> str:
     return text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
 
 
-def build_dayorder_vevent(tournament: Tournament, play_date: str) -> str:
-    """Build one VEVENT block for the given tournament day."""
+def _calendar_header(prodid: str) -> list[str]:
+    return [
+        "BEGIN:VCALENDAR",
+        f"PRODID:{prodid}",
+        "VERSION:2.0",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+    ]
 
-    matches = Match.objects.filter(tournament=tournament, schedule__play_date=play_date).order_by(
-        "schedule__order"
-    )
+
+def build_dayorder_vevent(
+    tournament: Tournament, play_date: str, matches: Iterable[_MatchLike] | None = None
+) -> str:
+    """Build one VEVENT block for the given tournament day.
+
+    ``matches`` (already ordered) can be passed in to skip the per-day query.
+    """
+
+    if matches is None:
+        matches = Match.objects.filter(
+            tournament=tournament, schedule__play_date=play_date
+        ).order_by("schedule__order")
     description = escape_ics(day_order_description(matches))
     dtstamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
     dtstart = play_date.replace("-", "")
@@ -61,25 +81,33 @@ def build_dayorder_vevent(tournament: Tournament, play_date: str) -> str:
     return "\n".join(lines)
 
 
+def iter_ics_for_days(tournament: Tournament, days: list[str]) -> Iterator[str]:
+    """Streamuj řádky VCALENDAR po dnech; zápasy všech dnů jedním dotazem."""
+
+    if not is_enabled(tournament):
+        return
+    by_day: dict[str, list[Match]] = defaultdict(list)
+    matches = (
+        Match.objects.filter(tournament=tournament, schedule__play_date__in=days)
+        .select_related("schedule")
+        .only("id", "round_name", "slot_top", "slot_bottom", "schedule__play_date")
+        .order_by("schedule__play_date", "schedule__order")
+    )
+    for m in matches.iterator(chunk_size=ICS_CHUNK_SIZE):
+        by_day[str(m.schedule.play_date)].append(m)
+    yield from _calendar_header("-//MSA//Day Order//EN")
+    for d in days:
+        yield build_dayorder_vevent(tournament, d, by_day.get(str(d), []))
+    yield "END:VCALENDAR"
+
+
 def build_ics_for_days(tournament: Tournament, days: list[str]) -> str:
     """Return full VCALENDAR string with VEVENTs for all provided days."""
 
-    if not is_enabled(tournament):
-        return ""
-    events = [build_dayorder_vevent(tournament, d) for d in days]
-    lines = [
-        "BEGIN:VCALENDAR",
-        "PRODID:-//MSA//Day Order//EN",
-        "VERSION:2.0",
-        "CALSCALE:GREGORIAN",
-        "METHOD:PUBLISH",
-        *events,
-        "END:VCALENDAR",
-    ]
-    return "\n".join(lines)
+    return "\n".join(iter_ics_for_days(tournament, days))
 
 
-def build_match_vevent(match: Match, play_date: str) -> str:
+def build_match_vevent(match: Match, play_date: str, order: int | None = None) -> str:
     """
     VEVENT pro jeden zápas (all-day):
       - UID: f"msa-match-{match.id}"
@@ -87,7 +115,7 @@ def build_match_vevent(match: Match, play_date: str) -> str:
       - DTSTART;VALUE=DATE:{YYYYMMDD}  # all-day (čas neřeš)
       - SUMMARY: "<round> – <Ptop> vs <Pbot>"  (P… = jméno nebo 'TBD')
       - DESCRIPTION: "Slot: [<slot_top> vs <slot_bottom>], Order: <order>"
-    Všechny texty escapuj escape_ics().
+    Všechny texty escapuj escape_ics(). Známé ``order`` přeskočí dohledání v Schedule.
     """
 
     dtstamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
@@ -99,18 +127,8 @@ def build_match_vevent(match: Match, play_date: str) -> str:
 
     st = match.slot_top if match.slot_top is not None else "-"
     sb = match.slot_bottom if match.slot_bottom is not None else "-"
-    # Prefer attached schedule order; otherwise try to resolve by (match, play_date); fallback to "-"
-    order = "-"
-    try:
-        sch = getattr(match, "schedule", None)
-        if sch is not None and getattr(sch, "order", None) is not None:
-            order = sch.order
-        else:
-            sch2 = Schedule.objects.filter(match=match, play_date=play_date).first()
-            if sch2 and sch2.order is not None:
-                order = sch2.order
-    except Exception:
-        order = "-"
+    if order is None:
+        order = _resolve_order(match, play_date)
     description = escape_ics(f"Slot: [{st} vs {sb}], Order: {order}")
 
     lines = [
@@ -125,31 +143,51 @@ def build_match_vevent(match: Match, play_date: str) -> str:
     return "\n".join(lines)
 
 
-def build_ics_for_matches(tournament: Tournament, days: list[str]) -> str:
+def _resolve_order(match: Match, play_date: str):
+    # Prefer attached schedule order; otherwise try to resolve by (match, play_date); fallback to "-"
+    order = "-"
+    try:
+        sch = getattr(match, "schedule", None)
+        if sch is not None and getattr(sch, "order", None) is not None:
+            order = sch.order
+        else:
+            sch2 = Schedule.objects.filter(match=match, play_date=play_date).first()
+            if sch2 and sch2.order is not None:
+                order = sch2.order
+    except Exception:
+        order = "-"
+    return order
+
+
+def iter_ics_for_matches(tournament: Tournament, days: list[str]) -> Iterator[str]:
     """
-    Vrátí VCALENDAR s VEVENT pro všechny zápasy, které mají záznam v Schedule
-    na některý z 'days'. Respektuj is_enabled() – pokud False, vrať "".
+    Streamuj VCALENDAR s VEVENT pro všechny zápasy, které mají záznam v Schedule
+    na některý z 'days'. Jeden dotaz (hráči i plán přes select_related) čtený po dávkách.
+    Respektuj is_enabled() – pokud False, negeneruj nic.
     """
 
     if not is_enabled(tournament):
-        return ""
+        return
 
     matches = (
         Match.objects.filter(tournament=tournament, schedule__play_date__in=days)
         .select_related("player_top", "player_bottom", "schedule")
         .order_by("schedule__play_date", "schedule__order")
     )
-    events = [build_match_vevent(m, m.schedule.play_date) for m in matches]
-    lines = [
-        "BEGIN:VCALENDAR",
-        "PRODID:-//MSA//Matches//EN",
-        "VERSION:2.0",
-        "CALSCALE:GREGORIAN",
-        "METHOD:PUBLISH",
-        *events,
-        "END:VCALENDAR",
-    ]
-    return "\n".join(lines)
+    yield from _calendar_header("-//MSA//Matches//EN")
+    for m in matches.iterator(chunk_size=ICS_CHUNK_SIZE):
+        order = m.schedule.order if m.schedule.order is not None else "-"
+        yield build_match_vevent(m, m.schedule.play_date, order=order)
+    yield "END:VCALENDAR"
+
+
+def build_ics_for_matches(tournament: Tournament, days: list[str]) -> str:
+    """
+    Vrátí VCALENDAR s VEVENT pro všechny zápasy, které mají záznam v Schedule
+    na některý z 'days'. Respektuj is_enabled() – pokud False, vrať "".
+    """
+
+    return "\n".join(iter_ics_for_matches(tournament, days))
 
 
 __all__ = [
@@ -158,6 +196,8 @@ __all__ = [
     "escape_ics",
     "build_dayorder_vevent",
     "build_ics_for_days",
+    "iter_ics_for_days",
     "build_match_vevent",
     "build_ics_for_matches",
+    "iter_ics_for_matches",
 ]
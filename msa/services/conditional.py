@@ -0,0 +1,102 @@
+# msa/services/conditional.py
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime
+
+from django.db import OperationalError
+from django.db.models import Count, Max, Sum
+
+from msa.models import Tournament
+
+# Zvyš při změně tvaru JSON odpovědí, aby klienti nedostali 304 na starý formát.
+ETAG_SCHEMA = 1
+
+
+def _digest(*parts) -> str:
+    raw = ":".join(str(p) for p in (ETAG_SCHEMA, *parts))
+    return hashlib.sha1(raw.encode()).hexdigest()[:20]
+
+
+def _memo(request, key: str, compute):
+    """Django ``condition`` volá etag_func i last_modified_func – agregát spočti jen jednou."""
+    store = request.__dict__.setdefault("_msa_conditional", {})
+    if key not in store:
+        store[key] = compute()
+    return store[key]
+
+
+def tournaments_list_state(request) -> tuple[str | None, datetime | None]:
+    """(etag, last_modified) seznamu turnajů pro filtr ?season= – jeden agregační dotaz.
+
+    Součet verzí view-modelů zachytí i úpravy kategorií, tour a category-season (jejich
+    signály verze dotčených turnajů zvyšují a zároveň posunou ``updated_at``).
+    """
+    season_id = request.GET.get("season") or ""
+
+    def compute():
+        qs = Tournament.objects.all()
+        try:
+            if season_id:
+                qs = qs.filter(season_id=season_id)
+            agg = qs.aggregate(
+                n=Count("id"), last=Max("updated_at"), versions=Sum("view_version__version")
+            )
+        except (ValueError, OperationalError):
+            # bez validátoru view proběhne normálně (a případnou chybu ohlásí samo)
+            return None, None
+        last = agg["last"]
+        stamp = last.isoformat() if last else ""
+        digest = _digest(
+            "tournaments", request.get_full_path(), agg["n"], stamp, agg["versions"] or 0
+        )
+        return digest, last
+
+    return _memo(request, f"tournaments:{season_id}", compute)
+
+
+def tournaments_list_etag(request, *args, **kwargs) -> str | None:
+    return tournaments_list_state(request)[0]
+
+
+def tournaments_list_last_modified(request, *args, **kwargs) -> datetime | None:
+    return tournaments_list_state(request)[1]
+
+
+def tournament_etag(request, tournament_id: int, *args, **kwargs) -> str | None:
+    """ETag dat turnaje z verze view-modelů (mění ji každá mutující služba i úprava
+    kategorie, tour nebo category-season) a ``updated_at``.
+
+    Last-Modified se neposílá: služby nemění ``updated_at``, takže by lhalo.
+    """
+
+    def compute():
+        try:
+            row = (
+                Tournament.objects.filter(pk=tournament_id)
+                .values_list("updated_at", "view_version__version")
+                .first()
+            )
+        except OperationalError:
+            return None
+        if row is None:
+            return None
+        updated_at, version = row
+        return _digest(
+            "tournament",
+            tournament_id,
+            updated_at.isoformat() if updated_at else "",
+            version or 0,
+            request.get_full_path(),
+        )
+
+    return _memo(request, f"tournament:{tournament_id}", compute)
+
+
+__all__ = [
+    "ETAG_SCHEMA",
+    "tournaments_list_state",
+    "tournaments_list_etag",
+    "tournaments_list_last_modified",
+    "tournament_etag",
+]
@@ -14,6 +14,7 @@ from msa.models import (
     TournamentEntry,
 )
 from msa.services.admin_gate import require_admin_mode
+from msa.services.view_cache import bumps_view_version
 
 
 @dataclass(frozen=True)
@@ -71,6 +72,7 @@ def assert_all_licensed_or_raise(t: Tournament) -> None:
 
 
 @require_admin_mode
+@bumps_view_version
 def grant_license_for_tournament_season(t: Tournament, player_id: int) -> PlayerLicense:
     """
     Rychlá inline akce: vytvoří licenci hráči pro sezónu turnaje (idempotentně).
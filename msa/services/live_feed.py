@@ -0,0 +1,169 @@
+# msa/services/live_feed.py
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Iterable, Iterator
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from msa.models import Match, MatchChange, Schedule, Tournament
+
+DEFAULT_LIMIT = 200
+MAX_LIMIT = 1000
+
+
+def _stream_settings() -> tuple[float, float]:
+    poll = float(getattr(settings, "MSA_LIVE_POLL_SECONDS", 2))
+    # výchozí 0 = jeden dotaz na spojení; delší držení má smysl jen pod ASGI
+    duration = float(getattr(settings, "MSA_LIVE_STREAM_SECONDS", 0))
+    return max(poll, 0.1), max(duration, 0.0)
+
+
+def score_payload(m: Match) -> dict:
+    return {
+        "state": m.state,
+        "winner_id": m.winner_id,
+        "score": m.score or {},
+        "needs_review": bool(m.needs_review),
+    }
+
+
+def state_payload(m: Match) -> dict:
+    return {
+        "state": m.state,
+        "player_top_id": m.player_top_id,
+        "player_bottom_id": m.player_bottom_id,
+        "needs_review": bool(m.needs_review),
+    }
+
+
+def record_match_change(m: Match, kind: str, payload: dict | None = None) -> MatchChange:
+    """Zapiš jednu změnu zápasu do logu (volat uvnitř transakce služby)."""
+    if payload is None:
+        payload = score_payload(m) if kind == MatchChange.Kind.SCORE else state_payload(m)
+    return MatchChange.objects.create(
+        tournament_id=m.tournament_id, match=m, kind=kind, payload=payload
+    )
+
+
+def schedule_state(t: Tournament) -> dict[int, tuple[str | None, int | None]]:
+    """Aktuální plán turnaje jako {match_id: (play_date, order)} – jeden dotaz."""
+    return {
+        match_id: (str(play_date) if play_date else None, order)
+        for match_id, play_date, order in Schedule.objects.filter(tournament=t).values_list(
+            "match_id", "play_date", "order"
+        )
+        if match_id is not None
+    }
+
+
+def record_schedule_diff(t: Tournament, before: dict[int, tuple[str | None, int | None]]) -> int:
+    """Porovná plán se stavem ``before`` a zapíše SCHEDULE změny pro dotčené zápasy."""
+    after = schedule_state(t)
+    changed = sorted(
+        mid for mid in before.keys() | after.keys() if before.get(mid) != after.get(mid)
+    )
+    if not changed:
+        return 0
+    existing = set(Match.objects.filter(pk__in=changed).values_list("pk", flat=True))
+    rows = []
+    for mid in changed:
+        play_date, order = after.get(mid, (None, None))
+        rows.append(
+            MatchChange(
+                tournament=t,
+                match_id=mid if mid in existing else None,
+                kind=MatchChange.Kind.SCHEDULE,
+                payload={"match_id": mid, "play_date": play_date, "order": order},
+            )
+        )
+    MatchChange.objects.bulk_create(rows)
+    return len(rows)
+
+
+def serialize_change(change: MatchChange) -> dict:
+    payload = dict(change.payload or {})
+    payload.setdefault("match_id", change.match_id)
+    return {
+        "id": change.id,
+        "match_id": payload["match_id"],
+        "kind": change.kind,
+        "ts": change.created_at.isoformat() if change.created_at else None,
+        "data": payload,
+    }
+
+
+def changes_since(tournament_id: int, cursor: int = 0, limit: int = DEFAULT_LIMIT) -> list[dict]:
+    """Vrať změny s id > cursor (jeden indexovaný dotaz přes (tournament, id))."""
+    limit = min(max(int(limit), 1), MAX_LIMIT)
+    qs = MatchChange.objects.filter(tournament_id=tournament_id, id__gt=max(int(cursor), 0))
+    return [serialize_change(c) for c in qs.order_by("id")[:limit]]
+
+
+def latest_cursor(tournament_id: int) -> int:
+    last = (
+        MatchChange.objects.filter(tournament_id=tournament_id)
+        .order_by("-id")
+        .values_list("id", flat=True)
+        .first()
+    )
+    return int(last or 0)
+
+
+def sse_events(changes: Iterable[dict]) -> Iterator[str]:
+    for change in changes:
+        data = json.dumps(change, ensure_ascii=False, separators=(",", ":"))
+        yield f"id: {change['id']}\nevent: match\ndata: {data}\n\n"
+
+
+def stream_changes(tournament_id: int, cursor: int = 0) -> Iterator[str]:
+    """SSE generátor: posílá nové změny, mezi dotazy keepalive; po MSA_LIVE_STREAM_SECONDS
+    se ukončí a klient se znovu připojí s Last-Event-ID (každá smyčka = jeden dotaz).
+
+    Pod WSGI drží každé otevřené spojení jeden worker (``time.sleep``), proto je výchozí
+    délka 0: odpověď pošle jen čekající změny a EventSource se znovu připojí po
+    ``retry`` = MSA_LIVE_POLL_SECONDS. Delší streamy nastavujte jen při nasazení pod ASGI.
+    """
+    poll, duration = _stream_settings()
+    deadline = time.monotonic() + duration
+    yield f"retry: {int(poll * 1000)}\n\n"
+    while True:
+        changes = changes_since(tournament_id, cursor)
+        if changes:
+            cursor = changes[-1]["id"]
+            yield from sse_events(changes)
+        else:
+            yield ": keepalive\n\n"
+        if time.monotonic() >= deadline:
+            return
+        time.sleep(poll)
+
+
+def prune_changes(days: int | None = None) -> int:
+    """Smaže záznamy logu starší než ``days`` (výchozí MSA_LIVE_FEED_RETENTION_DAYS).
+
+    Klient se starším kurzorem jen dostane zbylé změny; 0 nebo záporná hodnota nic nemaže.
+    """
+    if days is None:
+        days = int(getattr(settings, "MSA_LIVE_FEED_RETENTION_DAYS", 14))
+    if days <= 0:
+        return 0
+    cutoff = timezone.now() - timedelta(days=days)
+    deleted, _ = MatchChange.objects.filter(created_at__lt=cutoff).delete()
+    return deleted
+
+
+__all__ = [
+    "record_match_change",
+    "record_schedule_diff",
+    "schedule_state",
+    "serialize_change",
+    "changes_since",
+    "latest_cursor",
+    "sse_events",
+    "stream_changes",
+    "prune_changes",
+]
@@ -0,0 +1,198 @@
+# msa/services/live_state.py
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Any
+
+from django.conf import settings
+from django.db.models import F, Q, Sum
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from msa.models import Match, MatchState, TournamentLiveState
+
+
+def parse_sets(score_payload: Any) -> tuple[list[dict[str, Any]], bool]:
+    sets: list[dict[str, Any]] = []
+    has_partial = False
+    raw_sets = []
+    if isinstance(score_payload, dict):
+        raw_sets = score_payload.get("sets") or []
+    for item in raw_sets:
+        if isinstance(item, dict):
+            raw_a = item.get("a", item.get("top"))
+            raw_b = item.get("b", item.get("bottom"))
+            status_raw = item.get("status")
+            if raw_a in (None, "", "-") or raw_b in (None, "", "-"):
+                has_partial = True
+            try:
+                a_val = int(raw_a)
+                b_val = int(raw_b)
+            except (TypeError, ValueError):
+                if raw_a is not None or raw_b is not None:
+                    has_partial = True
+                continue
+            if status_raw:
+                status_norm = str(status_raw).strip().lower()
+                if status_norm and status_norm not in {"finished", "done", "completed"}:
+                    has_partial = True
+            sets.append({"a": a_val, "b": b_val, "status": status_raw})
+        elif isinstance(item, list | tuple) and len(item) >= 2:
+            raw_a, raw_b = item[0], item[1]
+            try:
+                a_val = int(raw_a)
+                b_val = int(raw_b)
+            except (TypeError, ValueError):
+                if raw_a is not None or raw_b is not None:
+                    has_partial = True
+                continue
+            sets.append({"a": a_val, "b": b_val, "status": None})
+    if isinstance(score_payload, dict) and len(sets) < len(raw_sets):
+        has_partial = True
+    return sets, has_partial
+
+
+def match_status_and_sets(match) -> tuple[str, list[dict[str, Any]]]:
+    score_payload = getattr(match, "score", None) or {}
+    sets, has_partial = parse_sets(score_payload)
+    meta_status = ""
+    if isinstance(score_payload, dict):
+        meta = score_payload.get("meta")
+        if isinstance(meta, dict):
+            meta_status = (meta.get("status") or "").strip().lower()
+
+    state_value = (getattr(match, "state", None) or "").upper()
+    base_status = {
+        "DONE": "finished",
+        "SCHEDULED": "scheduled",
+        "PENDING": "scheduled",
+        "LIVE": "live",
+    }.get(state_value, state_value.lower() or "scheduled")
+
+    if state_value == "DONE":
+        base_status = "finished"
+
+    if base_status != "finished":
+        in_progress_flag = bool(getattr(match, "in_progress", False))
+        has_recorded_sets = bool(sets)
+        if meta_status == "live":
+            base_status = "live"
+        elif base_status == "live" or in_progress_flag:
+            base_status = "live"
+        elif has_partial and (base_status != "scheduled" or has_recorded_sets):
+            base_status = "live"
+
+    return base_status, sets
+
+
+def live_flags(match) -> tuple[int, int]:
+    """(explicit, partial): explicitní stav LIVE vs. „live“ odvozený z rozehraného skóre."""
+    state_value = (getattr(match, "state", None) or "").upper()
+    if state_value == "LIVE":
+        return 1, 0
+    if state_value == MatchState.DONE:
+        return 0, 0
+    try:
+        status, _ = match_status_and_sets(match)
+    except (TypeError, ValueError, AttributeError):
+        # poškozené skóre (ne-iterovatelné sady, meta.status není text) = není live
+        return 0, 0
+    return 0, 1 if status == "live" else 0
+
+
+def bump_live_counts(tournament_id: int | None, live_delta: int, partial_delta: int) -> None:
+    if not tournament_id or (live_delta == 0 and partial_delta == 0):
+        return
+    updated = TournamentLiveState.objects.filter(tournament_id=tournament_id).update(
+        live_count=Greatest(F("live_count") + live_delta, 0),
+        partial_count=Greatest(F("partial_count") + partial_delta, 0),
+    )
+    # bez řádku není co snižovat (a turnaj se možná právě maže)
+    if not updated and (live_delta > 0 or partial_delta > 0):
+        TournamentLiveState.objects.get_or_create(
+            tournament_id=tournament_id,
+            defaults={
+                "live_count": max(live_delta, 0),
+                "partial_count": max(partial_delta, 0),
+            },
+        )
+
+
+def note_live_transition(match, before) -> tuple[int | None, tuple[int, int]]:
+    """Po uložení zápasu promítni změnu live stavu do počítadel.
+
+    ``before`` je ``(tournament_id, live_flags)`` před změnou; vrací stav po ní.
+    Volá :meth:`msa.models.Match.save` – služby ho samy volat nemusí.
+    """
+    old_tournament, (old_live, old_partial) = before
+    live, partial = live_flags(match)
+    if old_tournament == match.tournament_id:
+        bump_live_counts(match.tournament_id, live - old_live, partial - old_partial)
+    else:
+        bump_live_counts(old_tournament, -old_live, -old_partial)
+        bump_live_counts(match.tournament_id, live, partial)
+    return match.tournament_id, (live, partial)
+
+
+@receiver(post_delete, sender=Match, dispatch_uid="msa-live-state-match-deleted")
+def _match_deleted(sender, instance, **kwargs) -> None:
+    # i hromadné QuerySet.delete() posílá signál za každý zápas (kaskáda na Schedule)
+    live, partial = live_flags(instance)
+    bump_live_counts(instance.tournament_id, -live, -partial)
+
+
+def reconcile_live_states(tournament_ids=None) -> dict[int, tuple[int, int]]:
+    """Přepočítá čítače z Match tabulky (periodicky; opraví drift po přímých zápisech)."""
+    qs = Match.objects.exclude(state=MatchState.DONE).only("id", "tournament", "state", "score")
+    existing = TournamentLiveState.objects.all()
+    if tournament_ids is not None:
+        tournament_ids = list(tournament_ids)
+        qs = qs.filter(tournament_id__in=tournament_ids)
+        existing = existing.filter(tournament_id__in=tournament_ids)
+
+    counts: dict[int, list[int]] = defaultdict(lambda: [0, 0])
+    for match in qs.iterator(chunk_size=2000):
+        if not match.tournament_id:
+            continue
+        explicit, partial = live_flags(match)
+        if explicit or partial:
+            counts[match.tournament_id][0] += explicit
+            counts[match.tournament_id][1] += partial
+
+    result: dict[int, tuple[int, int]] = {}
+    for state in existing:
+        live, partial = counts.pop(state.tournament_id, (0, 0))
+        if (state.live_count, state.partial_count) != (live, partial):
+            state.live_count = live
+            state.partial_count = partial
+            state.save(update_fields=["live_count", "partial_count", "updated_at"])
+        result[state.tournament_id] = (live, partial)
+    for tournament_id, (live, partial) in counts.items():
+        TournamentLiveState.objects.create(
+            tournament_id=tournament_id, live_count=live, partial_count=partial
+        )
+        result[tournament_id] = (live, partial)
+    return result
+
+
+def live_badge_count() -> int:
+    """Počet živých zápasů pro navigační badge – jeden agregační dotaz nad malou tabulkou."""
+    totals = TournamentLiveState.objects.filter(
+        Q(live_count__gt=0) | Q(partial_count__gt=0)
+    ).aggregate(live=Sum("live_count"), partial=Sum("partial_count"))
+    live = int(totals["live"] or 0)
+    if live == 0 and getattr(settings, "MSA_BADGE_INCLUDE_PARTIALS", False):
+        return int(totals["partial"] or 0)
+    return live
+
+
+__all__ = [
+    "parse_sets",
+    "match_status_and_sets",
+    "live_flags",
+    "bump_live_counts",
+    "note_live_transition",
+    "reconcile_live_states",
+    "live_badge_count",
+]
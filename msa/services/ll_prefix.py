@@ -8,6 +8,7 @@ from django.db.models import F
 
 from msa.models import EntryStatus, EntryType, Tournament, TournamentEntry
 from msa.services.tx import atomic, locked
+from msa.services.view_cache import bumps_view_version
 
 
 @dataclass(frozen=True)
@@ -69,6 +70,7 @@ def get_ll_queue(t: Tournament) -> list[LLEntryView]:
 
 
 @atomic()
+@bumps_view_version
 def fill_vacant_slot_prefer_ll_then_alt(t: Tournament, slot: int) -> TournamentEntry:
     """
     Když vznikne díra v MD (slot bez hráče), dosadí:
@@ -102,6 +104,7 @@ def fill_vacant_slot_prefer_ll_then_alt(t: Tournament, slot: int) -> TournamentE
 
 
 @atomic()
+@bumps_view_version
 def enforce_ll_prefix_in_md(t: Tournament) -> None:
     """
     Udrž prefix invariant: množina LL v MD musí být přesně prefix LL fronty délky k,
@@ -145,6 +148,7 @@ def enforce_ll_prefix_in_md(t: Tournament) -> None:
 
 
 @atomic()
+@bumps_view_version
 def reinstate_original_player(t: Tournament, original_entry_id: int, slot: int) -> None:
     """
     Reinstat původního hráče do jeho slotu.
@@ -20,6 +20,7 @@ from msa.services.md_embed import effective_template_size_for_md, r1_name_for_md
 from msa.services.randoms import rng_from_seed_or_tournament_and_persist, seeded_shuffle
 from msa.services.seed_anchors import band_sequence_for_S, md_anchor_map
 from msa.services.tx import atomic, locked
+from msa.services.view_cache import bumps_view_version
 
 
 def _default_seeds_count(draw_size: int) -> int:
@@ -35,6 +36,7 @@ def _default_seeds_count(draw_size: int) -> int:
 # R1 i kotvy vyhodnocujeme podle embed šablony (power-of-two), ne přímo podle draw_size.
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def regenerate_md_band(
     t: Tournament, band: str, rng_seed: int | None = None, mode: str = "SOFT"
 ) -> dict[int, int]:
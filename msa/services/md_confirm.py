@@ -28,6 +28,7 @@ from msa.services.md_embed import (
 from msa.services.md_generator import generate_main_draw_mapping
 from msa.services.round_format import get_round_format
 from msa.services.tx import atomic, locked
+from msa.services.view_cache import bumps_view_version
 
 # ---------- pomocné datové struktury ----------
 
@@ -148,6 +149,7 @@ def _slot_to_entry_id(mapping: dict[int, int]) -> dict[int, int]:
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def confirm_main_draw(t: Tournament, rng_seed: int) -> dict[int, int]:
     """
     Podporuje i embed (např. draw 24 → šablona 32, BYE pro top (32-24) seedů).
@@ -251,6 +253,7 @@ def confirm_main_draw(t: Tournament, rng_seed: int) -> dict[int, int]:
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def hard_regenerate_unseeded_md(t: Tournament, rng_seed: int) -> dict[int, int]:
     """
     Respektuje BYE páry (embed). Seedy drží kotvy; nenasazené se přelosují.
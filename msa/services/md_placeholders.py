@@ -19,6 +19,7 @@ from msa.services.admin_gate import require_admin_mode
 from msa.services.md_confirm import confirm_main_draw
 from msa.services.md_embed import r1_name_for_md
 from msa.services.tx import atomic, locked
+from msa.services.view_cache import bumps_view_version
 
 PLACEHOLDER_PREFIX = "WINNER K#"
 
@@ -54,6 +55,7 @@ def _existing_placeholder_entries(t: Tournament) -> list[PlaceholderInfo]:
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def create_md_placeholders(t: Tournament) -> list[PlaceholderInfo]:
     """
     Vytvoří K placeholder hráčů a TournamentEntry typu Q bez WR (NR),
@@ -85,6 +87,7 @@ def create_md_placeholders(t: Tournament) -> list[PlaceholderInfo]:
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def confirm_md_with_placeholders(t: Tournament, rng_seed: int) -> dict[int, int]:
     """
     Připraví placeholdery (pokud nejsou) a zavolá confirm_main_draw.
@@ -114,6 +117,7 @@ def _final_winner_player_id_for_branch(t: Tournament, branch_index: int) -> int
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def replace_placeholders_with_qual_winners(t: Tournament) -> int:
     """
     Najde všechny placeholdery WINNER K#* v MD a nahradí jejich Player na skutečného vítěze
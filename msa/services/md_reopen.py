@@ -17,10 +17,12 @@ from msa.services.archiver import archive
 from msa.services.md_embed import r1_name_for_md
 from msa.services.randoms import rng_from_seed_or_tournament_and_persist, seeded_shuffle
 from msa.services.tx import atomic, locked
+from msa.services.view_cache import bumps_view_version
 
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def reopen_main_draw(t: Tournament, mode: str = "AUTO", rng_seed: int | None = None) -> str:
     """Reopen main draw according to mode.
 
@@ -21,6 +21,7 @@ from msa.services.ll_prefix import (
 )
 from msa.services.md_embed import r1_name_for_md
 from msa.services.tx import atomic, locked
+from msa.services.view_cache import bumps_view_version
 
 
 def _get_r1_match(t: Tournament, slot: int) -> Match | None:
@@ -47,6 +48,7 @@ def _update_match_for_slot(m: Match, slot: int, player_id: int | None) -> None:
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def remove_player_from_md(t: Tournament, slot: int) -> int | None:
     m = _get_r1_match(t, slot)
     if m and (m.winner_id is not None or m.state == MatchState.DONE):
@@ -76,6 +78,7 @@ def remove_player_from_md(t: Tournament, slot: int) -> int | None:
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def ensure_vacancies_filled(t: Tournament) -> int:
     r1 = r1_name_for_md(t)
     slots: set[int] = set()
@@ -117,6 +120,7 @@ def ensure_vacancies_filled(t: Tournament) -> int:
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def use_reserve_now(t: Tournament, slot: int) -> TournamentEntry:
     """Force ALT to occupy `slot`, even if an LL sits there."""
     m = _get_r1_match(t, slot)
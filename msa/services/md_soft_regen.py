@@ -20,6 +20,7 @@ from msa.services.archiver import archive_tournament_state
 from msa.services.md_embed import r1_name_for_md
 from msa.services.randoms import rng_from_seed_or_tournament_and_persist, seeded_shuffle
 from msa.services.tx import atomic, locked
+from msa.services.view_cache import bumps_view_version
 
 # ---- Pomocné typy ----
 
@@ -84,6 +85,7 @@ def _seed_ids_by_wr(t: Tournament, all_entries: list[EntryView]) -> list[int]:
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def soft_regenerate_unseeded_md(t: Tournament, rng_seed: int | None = None) -> dict[int, int]:
     """
     Přelosuje **jen nenasazené** hráče v těch R1 zápasech, kde ještě není výsledek.
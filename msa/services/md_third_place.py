@@ -3,11 +3,13 @@ from __future__ import annotations
 from msa.models import Match, MatchState, Phase, Schedule, Tournament
 from msa.services.round_format import get_round_format
 from msa.services.tx import atomic
+from msa.services.view_cache import bumps_view_version
 
 THIRD_PLACE_ROUND_NAME = "3P"
 
 
 @atomic()
+@bumps_view_version
 def ensure_third_place_match(t: Tournament) -> Match | None:
     """
     Udržuje zápas o 3. místo v konzistentním stavu.
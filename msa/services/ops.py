@@ -1,9 +1,11 @@
 from django.db.models import Q
 
 from msa.services._concurrency import atomic_tournament, lock_qs
+from msa.services.view_cache import bumps_view_version
 
 
 @atomic_tournament
+@bumps_view_version
 def replace_slot(tournament, slot, alt_id):
     from msa.models import EntryStatus, TournamentEntry
 
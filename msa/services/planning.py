@@ -7,8 +7,10 @@ from django.core.exceptions import ValidationError
 
 from msa.models import Match, Schedule, Snapshot, Tournament
 from msa.services.admin_gate import require_admin_mode
+from msa.services.live_feed import record_schedule_diff, schedule_state
 from msa.services.planning_undo import push_planning_snapshot
 from msa.services.tx import atomic, locked
+from msa.services.view_cache import bumps_view_version
 
 
 @dataclass(frozen=True)
@@ -123,6 +125,7 @@ def list_day_order(t: Tournament, play_date: str) -> list[ScheduledItem]:
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def insert_match(t: Tournament, match_id: int, play_date: str, order: int) -> None:
     """
     Insert (MVP): vyjmi match z případného starého dne, zkompaktuj,
@@ -131,6 +134,7 @@ def insert_match(t: Tournament, match_id: int, play_date: str, order: int) -> No
     """
     # lock cílový den + existující řádek match
     locked(Schedule.objects.filter(tournament=t, play_date=play_date))
+    before = schedule_state(t)
     row = _ensure_not_scheduled_elsewhere(t, match_id)
     if row:
         old_day = str(row.play_date) if row.play_date else None
@@ -154,6 +158,7 @@ def insert_match(t: Tournament, match_id: int, play_date: str, order: int) -> No
 
     # final compact (pro jistotu)
     _compact_day(t, play_date)
+    record_schedule_diff(t, before)
 
     # snapshot
     Snapshot.objects.create(
@@ -163,6 +168,7 @@ def insert_match(t: Tournament, match_id: int, play_date: str, order: int) -> No
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def swap_matches(t: Tournament, match_id_a: int, match_id_b: int) -> None:
     """
     Swap: vymění (play_date, order) dvou zápasů (může být i napříč dny).
@@ -180,6 +186,7 @@ def swap_matches(t: Tournament, match_id_a: int, match_id_b: int) -> None:
     )
     if not a or not b:
         raise ValidationError("Oba zápasy musí být naplánované.")
+    before = schedule_state(t)
     pa, oa = a.play_date, a.order
     pb, ob = b.play_date, b.order
 
@@ -200,6 +207,7 @@ def swap_matches(t: Tournament, match_id_a: int, match_id_b: int) -> None:
         _compact_day(t, str(pa))
     if pb:
         _compact_day(t, str(pb))
+    record_schedule_diff(t, before)
 
     Snapshot.objects.create(
         tournament=t, type=Snapshot.SnapshotType.MANUAL, payload=_snapshot_payload(t)
@@ -208,9 +216,12 @@ def swap_matches(t: Tournament, match_id_a: int, match_id_b: int) -> None:
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def normalize_day(t: Tournament, play_date: str) -> None:
     """Normalize Day: přečísluje pořadí na 1..N a uloží snapshot."""
+    before = schedule_state(t)
     _compact_day(t, play_date)
+    record_schedule_diff(t, before)
     Snapshot.objects.create(
         tournament=t, type=Snapshot.SnapshotType.MANUAL, payload=_snapshot_payload(t)
     )
@@ -218,9 +229,12 @@ def normalize_day(t: Tournament, play_date: str) -> None:
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def clear_day(t: Tournament, play_date: str) -> None:
     """Clear: z daného dne vymaže všechny zápasy (Schedule)."""
+    before = schedule_state(t)
     Schedule.objects.filter(tournament=t, play_date=play_date).delete()
+    record_schedule_diff(t, before)
     Snapshot.objects.create(
         tournament=t, type=Snapshot.SnapshotType.MANUAL, payload=_snapshot_payload(t)
     )
@@ -228,6 +242,7 @@ def clear_day(t: Tournament, play_date: str) -> None:
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def move_match(t: Tournament, match_id: int, to_play_date: str, to_order: int) -> None:
     """Alias pro Insert — přesune zápas na jiný den a pozici."""
     insert_match(t, match_id, to_play_date, to_order)
@@ -248,6 +263,7 @@ def save_planning_snapshot(t: Tournament, day: str, label: str = "manual") -> in
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def restore_planning_snapshot(t: Tournament, snapshot_id: int) -> None:
     """Obnoví plán z dříve uloženého snapshotu."""
     s = Snapshot.objects.filter(
@@ -255,4 +271,6 @@ def restore_planning_snapshot(t: Tournament, snapshot_id: int) -> None:
     ).first()
     if not s:
         raise ValidationError("Snapshot nenalezen nebo není typu MANUAL.")
+    before = schedule_state(t)
     _restore_payload(t, s.payload)
+    record_schedule_diff(t, before)
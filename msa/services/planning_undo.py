@@ -8,6 +8,8 @@ from django.db import transaction
 
 from msa.models import PlanningUndoState, Schedule, Snapshot, Tournament
 from msa.services.admin_gate import require_admin_mode
+from msa.services.live_feed import record_schedule_diff, schedule_state
+from msa.services.view_cache import bumps_view_version
 
 
 def _limits():
@@ -29,6 +31,7 @@ def push_planning_snapshot(t: Tournament, day: str, snapshot_id: int) -> None:
 
 @require_admin_mode
 @transaction.atomic
+@bumps_view_version
 def undo_planning_day(t: Tournament, day: str) -> None:
     from msa.services.planning import restore_planning_snapshot
 
@@ -45,11 +48,14 @@ def undo_planning_day(t: Tournament, day: str) -> None:
     if undo:
         restore_planning_snapshot(t, undo[-1])
     else:
+        before = schedule_state(t)
         Schedule.objects.filter(tournament=t, play_date=day).delete()
+        record_schedule_diff(t, before)
 
 
 @require_admin_mode
 @transaction.atomic
+@bumps_view_version
 def redo_planning_day(t: Tournament, day: str) -> None:
     from msa.services.planning import restore_planning_snapshot
 
@@ -15,6 +15,7 @@ from msa.models import (
     TournamentEntry,
 )
 from msa.services.admin_gate import require_admin_mode
+from msa.services.view_cache import bump_for_players
 
 
 def normalize_name(name: str) -> str:
@@ -115,6 +116,7 @@ def merge_players(master_id: int, dup_id: int, dry_run: bool = False) -> dict:
 
     if not dry_run:
         dup.delete()
+        bump_for_players([master_id])
 
     return {
         "updated": updated,
@@ -21,6 +21,7 @@ from msa.services.licenses import assert_all_licensed_or_raise
 from msa.services.qual_generator import generate_qualification_mapping, seeds_per_bracket
 from msa.services.round_format import get_round_format
 from msa.services.tx import atomic, locked
+from msa.services.view_cache import bumps_view_version
 
 # ---- Pomocné typy ----
 
@@ -82,6 +83,7 @@ def _pairs_for_size(size: int) -> list[tuple[int, int]]:
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def confirm_qualification(t: Tournament, rng_seed: int) -> list[dict[int, int]]:
     """
     Vygeneruje a POTVRDÍ K kvalifikačních větví po R kolech:
@@ -210,6 +212,7 @@ def confirm_qualification(t: Tournament, rng_seed: int) -> list[dict[int, int]]:
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def update_ll_after_qual_finals(t: Tournament) -> int:
     """
     Najde všechny odehrané finále kvaldy (round_name='Q2') a pro poražené finalisty
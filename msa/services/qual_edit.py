@@ -9,6 +9,7 @@ from msa.models import Match, MatchState, Phase, Schedule, Tournament
 from msa.services.admin_gate import require_admin_mode
 from msa.services.qual_generator import bracket_anchor_tiers
 from msa.services.tx import atomic, locked
+from msa.services.view_cache import bumps_view_version
 
 
 @dataclass(frozen=True)
@@ -63,6 +64,7 @@ def _side_is_top(m: Match, slot: int) -> bool:
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def swap_slots_in_qualification(t: Tournament, slot_a: int, slot_b: int) -> SwapResult:
     """
     Bezpečné prohození dvou R1 slotů v kvalifikaci (napříč větvemi).
@@ -17,6 +17,7 @@ from msa.models import (
 )
 from msa.services.admin_gate import require_admin_mode
 from msa.services.tx import atomic, locked
+from msa.services.view_cache import bumps_view_version
 
 
 @dataclass(frozen=True)
@@ -47,6 +48,7 @@ def _pick_best_alt_qs(t: Tournament):
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def remove_and_replace_in_qualification(t: Tournament, global_slot: int) -> ReplaceResult:
     """
     Remove & Replace v kvalifikaci:
@@ -10,6 +10,7 @@ from msa.models import EntryStatus, EntryType, SeedingSource, Snapshot, Tourname
 from msa.services.admin_gate import require_admin_mode
 from msa.services.standings_snapshot import ensure_seeding_baseline
 from msa.services.tx import atomic, locked
+from msa.services.view_cache import bumps_view_version
 
 
 class Group(str, Enum):
@@ -327,6 +328,7 @@ def preview_recalculate_registration(
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def confirm_recalculate_registration(t: Tournament, preview: Preview) -> None:
     """
     Aplikuje návrh:
@@ -397,6 +399,7 @@ def confirm_recalculate_registration(t: Tournament, preview: Preview) -> None:
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def brutal_reset_to_registration(t: Tournament, reason: str = "PARAM_CHANGE") -> None:
     """
     Uloží ARCHIVNÍ SNAPSHOT (lightweight) a vyčistí:
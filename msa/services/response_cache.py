@@ -0,0 +1,169 @@
+# msa/services/response_cache.py
+from __future__ import annotations
+
+import hashlib
+import time
+from collections.abc import Callable, Iterable
+from datetime import date
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+# Každá odpověď si pamatuje verze svých tagů; purge tagu = nová verze → starý záznam
+# se při čtení zahodí. Funguje nad libovolným backendem (locmem, file) bez mazání klíčů.
+ALL_TOURNAMENTS_TAG = "msa:tournaments"
+RANKINGS_TAG = "msa:rankings"
+
+# Vstupy, podle kterých se liší výstup veřejných stránek (aktivní datum a kalendář).
+_VARY_SESSION_KEYS = (
+    "global_date",
+    "woorld_today",
+    "woorld_date",
+    "topbar_date",
+    "woorld_current_date",
+)
+_VARY_COOKIES = ("global_date", "topbar_date", "woorld_today", "woorld_date")
+
+
+def season_tag(season_id) -> str:
+    return f"msa:season:{season_id}"
+
+
+def tournament_tag(tournament_id) -> str:
+    return f"msa:tournament:{tournament_id}"
+
+
+def player_tag(player_id) -> str:
+    return f"msa:player:{player_id}"
+
+
+def _enabled() -> bool:
+    return bool(getattr(settings, "MSA_RESPONSE_CACHE_ENABLED", True))
+
+
+def _timeout() -> int:
+    return int(getattr(settings, "MSA_RESPONSE_CACHE_TIMEOUT", 300))
+
+
+def _tag_key(tag: str) -> str:
+    return f"msa:resp-tag:{tag}"
+
+
+def purge_tags(*tags: str | None) -> None:
+    """Zneplatní všechny odpovědi s danými tagy (hned i po commitu transakce)."""
+    keys = sorted({_tag_key(tag) for tag in tags if tag})
+    if not keys:
+        return
+
+    def _purge():
+        stamp = time.time_ns()
+        cache.set_many({key: stamp for key in keys}, None)
+
+    _purge()
+    # souběžný request mohl mezitím uložit stará data z neukončené transakce
+    transaction.on_commit(_purge)
+
+
+def purge_tournaments(tournament_ids: Iterable[int | None]) -> None:
+    purge_tags(*(tournament_tag(tid) for tid in tournament_ids if tid))
+
+
+def purge_players(player_ids: Iterable[int | None]) -> None:
+    purge_tags(*(player_tag(pid) for pid in player_ids if pid))
+
+
+def tag_response(request, *tags: str | None) -> None:
+    """Přidá tagy zjištěné až během renderu (např. hráči z entry listu)."""
+    extra = getattr(request, "_msa_cache_tags", None)
+    if extra is not None:
+        extra.update(tag for tag in tags if tag)
+
+
+def _cacheable_request(request) -> bool:
+    if request.method not in ("GET", "HEAD"):
+        return False
+    user = getattr(request, "user", None)
+    if getattr(user, "is_authenticated", False):
+        return False
+    session = getattr(request, "session", None)
+    if session is not None and session.get("admin_mode"):
+        return False
+    return True
+
+
+def _request_key(request) -> str:
+    session = getattr(request, "session", None) or {}
+    parts = [request.method, request.get_full_path(), date.today().isoformat()]
+    parts += [f"s:{key}={session.get(key, '')}" for key in _VARY_SESSION_KEYS]
+    parts += [f"c:{key}={request.COOKIES.get(key, '')}" for key in _VARY_COOKIES]
+    digest = hashlib.sha256("\x1f".join(map(str, parts)).encode()).hexdigest()
+    return f"msa:resp:{digest}"
+
+
+def _current_versions(tags: Iterable[str], *, create: bool) -> dict[str, int | None]:
+    keys = {tag: _tag_key(tag) for tag in tags}
+    found = cache.get_many(list(keys.values()))
+    versions: dict[str, int | None] = {}
+    for tag, key in keys.items():
+        version = found.get(key)
+        if version is None and create:
+            stamp = time.time_ns()
+            cache.add(key, stamp, None)
+            version = cache.get(key, stamp)
+        versions[tag] = version
+    return versions
+
+
+def cache_response(tags_for: Callable[..., Iterable[str]]):
+    """Dekorátor veřejných MSA view: cachuje 200 odpovědi anonymních požadavků.
+
+    ``tags_for(request, *args, **kwargs)`` vrací tagy známé předem, view může přidat
+    další přes :func:`tag_response`. Záznam platí, dokud se žádný z tagů nepurgne.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def _wrapped(request, *args, **kwargs):
+            if not (_enabled() and _cacheable_request(request)):
+                return view(request, *args, **kwargs)
+
+            key = _request_key(request)
+            entry = cache.get(key)
+            if entry is not None:
+                response, stored = entry
+                if _current_versions(stored, create=False) == stored:
+                    return response
+
+            # verze předem známých tagů se čtou před renderem, aby purge během
+            # renderu záznam zneplatnil
+            tags = set(tags_for(request, *args, **kwargs))
+            versions = _current_versions(tags, create=True)
+            request._msa_cache_tags = set(tags)
+            response = view(request, *args, **kwargs)
+            if response.status_code == 200 and not response.streaming:
+                if hasattr(response, "render") and callable(response.render):
+                    response = response.render()
+                extra = request._msa_cache_tags - tags
+                versions.update(_current_versions(extra, create=True))
+                cache.set(key, (response, versions), _timeout())
+            return response
+
+        return _wrapped
+
+    return decorator
+
+
+__all__ = [
+    "ALL_TOURNAMENTS_TAG",
+    "RANKINGS_TAG",
+    "season_tag",
+    "tournament_tag",
+    "player_tag",
+    "purge_tags",
+    "purge_tournaments",
+    "purge_players",
+    "tag_response",
+    "cache_response",
+]
@@ -5,10 +5,12 @@ from dataclasses import dataclass
 
 from django.core.exceptions import ValidationError
 
-from msa.models import Match, MatchState
+from msa.models import Match, MatchChange, MatchState
 from msa.services.admin_gate import require_admin_mode
+from msa.services.live_feed import record_match_change
 from msa.services.md_third_place import ensure_third_place_match
 from msa.services.tx import atomic, locked
+from msa.services.view_cache import bumps_view_version
 
 
 @dataclass(frozen=True)
@@ -174,10 +176,12 @@ def _propagate_winner_to_next_round(m: Match) -> None:
 
     if updated:
         next_match.save(update_fields=updated)
+        record_match_change(next_match, MatchChange.Kind.STATE)
 
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def set_result(
     match_id: int,
     *,
@@ -262,6 +266,7 @@ def set_result(
         raise ValidationError("mode musí být 'WIN_ONLY' | 'SPECIAL' | 'SETS'.")
 
     m.save(update_fields=["score", "winner", "state"])
+    record_match_change(m, MatchChange.Kind.SCORE)
 
     # Kaskáda při změně vítěze
     if old_winner and m.winner_id != old_winner:
@@ -281,6 +286,7 @@ def set_result(
                 updated.append("needs_review")
             if updated:
                 locked_match.save(update_fields=updated)
+                record_match_change(locked_match, MatchChange.Kind.STATE)
 
     _propagate_winner_to_next_round(m)
 
@@ -297,6 +303,7 @@ def set_result(
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def resolve_needs_review(match_id: int) -> Match:
     """
     „Potvrď“ dotčený downstream zápas po ruční kontrole – pouze resetuje needs_review=False.
@@ -305,4 +312,5 @@ def resolve_needs_review(match_id: int) -> Match:
     m = locked(Match.objects.filter(pk=match_id)).get()
     m.needs_review = False
     m.save(update_fields=["needs_review"])
+    record_match_change(m, MatchChange.Kind.STATE)
     return m
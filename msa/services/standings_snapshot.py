@@ -17,6 +17,7 @@ from msa.conf import (
 )
 from msa.models import RankingSnapshot, Season, Tournament
 from msa.services.ranking_common import row_to_item, tiebreak_key
+from msa.services.response_cache import RANKINGS_TAG, purge_tags
 from msa.services.standings import rolling_standings, rtf_standings, season_standings
 
 
@@ -55,7 +56,7 @@ def official_monday(now: datetime | date | str, tz_name: str = "Europe/Prague")
 def _season_for_monday(monday: date) -> Season:
     season = (
         Season.objects.filter(start_date__lte=monday, end_date__gte=monday).first()
-        or Season.objects.filter(end_date__lte=monday).order_by("-end_date").first()
+        or Season.objects.filter(end_date__lte=monday).order_by("-end_ordinal").first()
     )
     if not season:
         raise ValidationError("No season for given monday")
@@ -90,6 +91,7 @@ def confirm_snapshot(
     if preview["hash"] != expected_hash:
         raise StalePreviewError("preview hash mismatch")
     hash_val = preview["hash"]
+    purge_tags(RANKINGS_TAG)
     if DEDUP_ENABLED:
         existing = (
             RankingSnapshot.objects.filter(type=rtype, hash=hash_val)
@@ -0,0 +1,292 @@
+# msa/services/view_cache.py
+from __future__ import annotations
+
+import hashlib
+import secrets
+import threading
+from collections.abc import Callable, Iterable
+from functools import wraps
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import F, Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from msa.models import (
+    Category,
+    CategorySeason,
+    Match,
+    Player,
+    PlayerLicense,
+    Schedule,
+    Tour,
+    Tournament,
+    TournamentEntry,
+    TournamentViewVersion,
+)
+from msa.services.response_cache import (
+    ALL_TOURNAMENTS_TAG,
+    purge_players,
+    purge_tags,
+    purge_tournaments,
+    season_tag,
+)
+
+# Zvyš při změně tvaru view-modelů, aby se nepoužily staré záznamy z cache.
+VIEW_MODEL_SCHEMA = 1
+
+# turnaje změněné během běžící služby; verze se zvýší jednou na jejím konci
+_pending = threading.local()
+
+
+def _timeout() -> int:
+    return int(getattr(settings, "MSA_VIEW_CACHE_TIMEOUT", 3600))
+
+
+def bump_tournament_version(*tournament_ids: int | None, create: bool = True) -> None:
+    """Zvýší verzi view-modelů pro dané turnaje (F() update, bez čtení) a purgne
+    cachované odpovědi s jejich tagy.
+
+    Chybějící řádky verzí (turnaje z doby před verzováním) se založí, pokud
+    ``create`` není vypnuté (mazání turnaje je zakládat nesmí).
+    """
+    ids = sorted({int(tid) for tid in tournament_ids if tid})
+    if not ids:
+        return
+    purge_tournaments(ids)
+    updated = TournamentViewVersion.objects.filter(tournament_id__in=ids).update(
+        version=F("version") + 1
+    )
+    if create and updated < len(ids):
+        existing = set(
+            TournamentViewVersion.objects.filter(tournament_id__in=ids).values_list(
+                "tournament_id", flat=True
+            )
+        )
+        missing = [tid for tid in ids if tid not in existing]
+        TournamentViewVersion.objects.bulk_create(
+            [TournamentViewVersion(tournament_id=tid, version=1) for tid in missing],
+            ignore_conflicts=True,
+        )
+
+
+def _tournament_id_from(args: tuple, kwargs: dict, result: Any) -> int | None:
+    for candidate in (*args[:1], kwargs.get("t"), kwargs.get("tournament"), result):
+        if isinstance(candidate, Tournament):
+            return candidate.pk
+        tid = getattr(candidate, "tournament_id", None)
+        if tid:
+            return tid
+    return None
+
+
+def bumps_view_version(fn: Callable) -> Callable:
+    """Dekorátor pro mutující služby: po úspěchu zvýší verzi turnaje.
+
+    Turnaj se bere z prvního argumentu (``t``/``tournament``), případně z návratové
+    hodnoty (např. ``Match`` ze ``set_result``). Zápisy zachycené signály během
+    služby se sloučí do jednoho zvýšení na konci. Patří pod ``@atomic()``, aby se
+    verze změnila ve stejné transakci jako data.
+    """
+
+    @wraps(fn)
+    def _wrapped(*args, **kwargs):
+        outer = getattr(_pending, "ids", None)
+        ids = set() if outer is None else outer
+        _pending.ids = ids
+        try:
+            result = fn(*args, **kwargs)
+        finally:
+            _pending.ids = outer
+        ids.add(_tournament_id_from(args, kwargs, result))
+        if outer is None:
+            bump_tournament_version(*ids)
+        return result
+
+    return _wrapped
+
+
+def current_version(tournament) -> int:
+    """Verze z předem načtené relace (``select_related("view_version")``) nebo jedním dotazem."""
+    try:
+        state = tournament.view_version
+    except ObjectDoesNotExist:
+        return 0
+    return int(getattr(state, "version", 0) or 0)
+
+
+def cached_view_model(tournament, name: str, builder: Callable[[], Any]) -> Any:
+    """Vrať view-model ``name`` z cache klíčované (turnaj, verze); jinak ho postav a ulož."""
+    key = f"msa:vm:{VIEW_MODEL_SCHEMA}:{tournament.pk}:{current_version(tournament)}:{name}"
+    value = cache.get(key)
+    if value is None:
+        value = builder()
+        cache.set(key, value, _timeout())
+    return value
+
+
+def season_stamp(season) -> str:
+    """Otisk stavu sezóny a jejích turnajů jedním dotazem.
+
+    Změní se při přidání/smazání turnaje, uložení turnaje (``updated_at``), po každé
+    mutující službě (verze view-modelů) i při úpravě sezóny (název, rozsah měsíců),
+    kategorie, tour nebo category-season, jejichž hodnoty karty kalendáře zobrazují.
+    """
+    rows = (
+        Tournament.objects.filter(season=season)
+        .order_by("id")
+        .values_list(
+            "id",
+            "updated_at",
+            "view_version__version",
+            "category__name",
+            "category__tour__name",
+            "category_season__draw_size",
+            "category_season__qual_rounds",
+        )
+    )
+    raw = repr(
+        (
+            getattr(season, "name", None),
+            str(getattr(season, "start_date", None)),
+            str(getattr(season, "end_date", None)),
+            list(rows),
+        )
+    )
+    return hashlib.sha1(raw.encode()).hexdigest()[:20]
+
+
+def cached_season_model(season, name: str, builder: Callable[[], Any]) -> Any:
+    """Vrať view-model sezóny z cache klíčované otiskem :func:`season_stamp`."""
+    key = f"msa:svm:{VIEW_MODEL_SCHEMA}:{season.pk}:{season_stamp(season)}:{name}"
+    value = cache.get(key)
+    if value is None:
+        value = builder()
+        cache.set(key, value, _timeout())
+    return value
+
+
+def bump_for_players(player_ids: Iterable[int]) -> None:
+    """Zvýší verze všech turnajů, kde se hráči vyskytují (entries i zápasy)."""
+    player_ids = list(player_ids)
+    if not player_ids:
+        return
+    purge_players(player_ids)
+    ids = set(
+        TournamentEntry.objects.filter(player_id__in=player_ids).values_list(
+            "tournament_id", flat=True
+        )
+    )
+    ids |= set(
+        Match.objects.filter(
+            Q(player_top_id__in=player_ids) | Q(player_bottom_id__in=player_ids)
+        ).values_list("tournament_id", flat=True)
+    )
+    bump_tournament_version(*ids)
+
+
+def _note_tournament_write(*tournament_ids: int | None, deleted: bool = False) -> None:
+    ids = getattr(_pending, "ids", None)
+    if ids is not None:
+        ids.update(tournament_ids)
+    else:
+        bump_tournament_version(*tournament_ids, create=not deleted)
+
+
+@receiver(post_save, sender=Tournament, dispatch_uid="msa-view-version-tournament-saved")
+def _tournament_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        # náhodný start: znovupoužité pk (reset DB při perzistentní cache) nenarazí
+        # na view-modely zaniklého turnaje
+        TournamentViewVersion.objects.create(tournament=instance, version=secrets.randbits(48))
+    else:
+        _note_tournament_write(instance.pk)
+
+
+@receiver(post_save, sender=TournamentEntry, dispatch_uid="msa-view-version-entry-saved")
+@receiver(post_save, sender=Match, dispatch_uid="msa-view-version-match-saved")
+@receiver(post_save, sender=Schedule, dispatch_uid="msa-view-version-schedule-saved")
+def _tournament_row_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _note_tournament_write(instance.tournament_id)
+
+
+@receiver(post_delete, sender=TournamentEntry, dispatch_uid="msa-view-version-entry-deleted")
+@receiver(post_delete, sender=Match, dispatch_uid="msa-view-version-match-deleted")
+@receiver(post_delete, sender=Schedule, dispatch_uid="msa-view-version-schedule-deleted")
+def _tournament_row_deleted(sender, instance, **kwargs):
+    _note_tournament_write(instance.tournament_id, deleted=True)
+
+
+@receiver(post_save, sender=Player, dispatch_uid="msa-view-version-player-saved")
+def _player_saved(sender, instance, created, raw=False, **kwargs):
+    # jméno/země hráče jsou součástí view-modelů i cachovaných odpovědí
+    if not created and not raw:
+        bump_for_players([instance.pk])
+
+
+@receiver(post_save, sender=PlayerLicense, dispatch_uid="msa-view-version-license-saved")
+@receiver(post_delete, sender=PlayerLicense, dispatch_uid="msa-view-version-license-deleted")
+def _license_changed(sender, instance, raw=False, **kwargs):
+    if instance.player_id and not raw:
+        bump_for_players([instance.player_id])
+
+
+def _tournaments_using(sender, instance) -> list[tuple[int, int | None]]:
+    """(turnaj, sezóna) pro turnaje, jejichž view-modely i stránky čtou uloženou
+    kategorii, tour nebo category-season."""
+    if sender is CategorySeason:
+        lookup = Q(category_season=instance)
+    elif sender is Category:
+        lookup = Q(category=instance) | Q(category_season__category=instance)
+    else:
+        lookup = Q(category__tour=instance) | Q(category_season__category__tour=instance)
+    return list(Tournament.objects.filter(lookup).values_list("id", "season_id").distinct())
+
+
+def _category_changed(sender, instance, *, deleted: bool = False) -> None:
+    rows = _tournaments_using(sender, instance)
+    # názvy, štítky a velikosti pavouků jsou i v seznamech turnajů a kalendářích sezón
+    seasons = {season_id for _, season_id in rows}
+    seasons.add(getattr(instance, "season_id", None))
+    purge_tags(ALL_TOURNAMENTS_TAG, *(season_tag(sid) for sid in seasons if sid))
+    ids = [tid for tid, _ in rows]
+    if ids:
+        # Last-Modified seznamů turnajů (podmíněné GETy) vychází z updated_at
+        Tournament.objects.filter(pk__in=ids).update(updated_at=timezone.now())
+    _note_tournament_write(*ids, deleted=deleted)
+
+
+@receiver(post_save, sender=CategorySeason, dispatch_uid="msa-view-version-cs-saved")
+@receiver(post_save, sender=Category, dispatch_uid="msa-view-version-category-saved")
+@receiver(post_save, sender=Tour, dispatch_uid="msa-view-version-tour-saved")
+def _category_saved(sender, instance, created, raw=False, **kwargs):
+    # draw_size, qual_rounds, wc_slots_default a názvy jdou do entries/draw view-modelů
+    if not created and not raw:
+        _category_changed(sender, instance)
+
+
+@receiver(post_delete, sender=CategorySeason, dispatch_uid="msa-view-version-cs-deleted")
+@receiver(post_delete, sender=Category, dispatch_uid="msa-view-version-category-deleted")
+@receiver(post_delete, sender=Tour, dispatch_uid="msa-view-version-tour-deleted")
+def _category_deleted(sender, instance, **kwargs):
+    # turnaje kategorii chrání (PROTECT); smazat jde jen nepoužitá, tj. obvykle nic
+    _category_changed(sender, instance, deleted=True)
+
+
+__all__ = [
+    "VIEW_MODEL_SCHEMA",
+    "bump_tournament_version",
+    "bumps_view_version",
+    "bump_for_players",
+    "current_version",
+    "cached_view_model",
+    "season_stamp",
+    "cached_season_model",
+]
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from django.core.exceptions import ValidationError
 
 from msa.models import EntryStatus, EntryType, Tournament, TournamentEntry
+from msa.services.view_cache import bumps_view_version
 
 from .admin_gate import require_admin_mode
 from .tx import atomic, locked
@@ -98,6 +99,7 @@ def _used_qwc_promotions(t: Tournament) -> int:
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def set_wc_slots(t: Tournament, slots: int) -> None:
     """Nastaví wc_slots na turnaji; nesmí být pod aktuálním využitím (promoted_by_wc)."""
     if slots < 0:
@@ -113,6 +115,7 @@ def set_wc_slots(t: Tournament, slots: int) -> None:
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def set_q_wc_slots(t: Tournament, slots: int) -> None:
     """Nastaví q_wc_slots; nesmí být pod aktuálním využitím (promoted_by_qwc)."""
     if slots < 0:
@@ -128,6 +131,7 @@ def set_q_wc_slots(t: Tournament, slots: int) -> None:
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def apply_wc(t: Tournament, entry_id: int) -> None:
     """
     WC (hlavní pole):
@@ -187,6 +191,7 @@ def apply_wc(t: Tournament, entry_id: int) -> None:
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def remove_wc(t: Tournament, entry_id: int) -> None:
     """
     Odebere WC label. Pokud byl hráč povýšen (promoted_by_wc=True), vrátí ho do Q
@@ -217,6 +222,7 @@ def remove_wc(t: Tournament, entry_id: int) -> None:
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def apply_qwc(t: Tournament, entry_id: int) -> None:
     """
     QWC:
@@ -247,6 +253,7 @@ def apply_qwc(t: Tournament, entry_id: int) -> None:
 
 @require_admin_mode
 @atomic()
+@bumps_view_version
 def remove_qwc(t: Tournament, entry_id: int) -> None:
     """
     Odebere QWC label; pokud byl hráč povýšen QWC (ALT→Q), vrátí ho zpět do ALT.
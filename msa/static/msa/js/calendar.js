@@ -190,6 +190,21 @@
     }
   }
 
+  let faxMetaBundle = null;
+
+  // Předpočítaný bundle metadat (URL s hashem v <meta name="woorld-calendar-meta">).
+  function loadFaxMetaBundle() {
+    if (faxMetaBundle) return faxMetaBundle;
+    const tag = document.querySelector('meta[name="woorld-calendar-meta"]');
+    const url = tag ? tag.getAttribute("content") : "";
+    faxMetaBundle = url
+      ? fetch(url, { headers: { Accept: "application/json" } })
+          .then((resp) => (resp.ok ? resp.json() : null))
+          .catch(() => null)
+      : Promise.resolve(null);
+    return faxMetaBundle;
+  }
+
   async function getFaxYearMeta(year) {
     const numericYear = Number.parseInt(year, 10);
     const key = Number.isFinite(numericYear) ? numericYear : year;
@@ -197,6 +212,14 @@
       return FAX_META_CACHE.get(key);
     }
 
+    const bundle = await loadFaxMetaBundle();
+    const bundled = bundle?.years?.[String(key)]?.month_lengths;
+    if (Array.isArray(bundled)) {
+      const meta = { monthLengths: new Map(bundled.map((len, index) => [index + 1, len])) };
+      FAX_META_CACHE.set(key, meta);
+      return meta;
+    }
+
     let monthLengths = new Map();
 
     try {
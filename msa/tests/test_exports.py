@@ -72,7 +72,9 @@ def test_export_tournaments_csv_respects_filters(client):
     assert response["Content-Type"] == "text/csv; charset=utf-8"
     assert 'attachment; filename="tournaments.csv"' in response["Content-Disposition"]
 
-    reader = csv.reader(io.StringIO(response.content.decode("utf-8")))
+    assert response.streaming
+    content = b"".join(response.streaming_content).decode("utf-8")
+    reader = csv.reader(io.StringIO(content))
     rows = list(reader)
     assert rows[0] == [
         "id",
@@ -122,7 +124,8 @@ def test_export_calendar_ics_has_events(client):
 
     assert response.status_code == 200
     assert response["Content-Type"] == "text/calendar; charset=utf-8"
-    body = response.content.decode("utf-8")
+    assert response.streaming
+    body = b"".join(response.streaming_content).decode("utf-8")
     assert "BEGIN:VCALENDAR" in body
     assert "BEGIN:VEVENT" in body
     assert re.search(r"DTSTAMP:\d{8}T\d{6}Z", body)
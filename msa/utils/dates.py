@@ -1,25 +1,84 @@
 from __future__ import annotations
 
+import copy
+import time
 from datetime import date, datetime
+from functools import lru_cache
 from importlib import import_module
 
 from django.apps import apps
+from django.core.cache import cache
+from django.db import OperationalError, ProgrammingError
 
 FMTS = ("%Y-%m-%d", "%d-%m-%Y", "%Y/%m/%d", "%d.%m.%Y", "%Y.%m.%d")
 
+# Kandidátní převodníky woorld → gregorián; prohledají se jednou za běh procesu.
+CONVERTER_CANDIDATES = (
+    (
+        "fax_calendar.utils",
+        (
+            "woorld_to_gregorian",
+            "to_gregorian",
+            "to_gregorian_date",
+            "as_gregorian",
+            "convert_to_gregorian",
+        ),
+    ),
+    ("fax_calendar.api", ("woorld_to_gregorian", "to_gregorian", "convert")),
+    ("fax_calendar.convert", ("woorld_to_gregorian", "to_gregorian")),
+)
+
+# Index intervalů sezón: generace v cache (sdílená mezi procesy) + pojistné TTL
+# pro změny, které neprojdou přes Season.save/delete (queryset update, rollback).
+SEASON_INDEX_GENERATION_KEY = "msa:season-index:gen"
+SEASON_INDEX_TTL = 60.0
+
+_REQUEST_DATE_ATTR = "_msa_active_date"
+_REQUEST_SEASON_ATTR = "_msa_active_season"
+_MISSING = object()
+
 
 def _parse_date(value: str) -> date | None:
     """Try to parse *value* using multiple date formats."""
     if not value:
         return None
+    if isinstance(value, str):
+        return _parse_date_str(value.strip())
+    return _parse_date_str(str(value).strip())
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_str(value: str) -> date | None:
     for fmt in FMTS:
         try:
-            return datetime.strptime(value.strip(), fmt).date()
+            return datetime.strptime(value, fmt).date()
         except Exception:
             pass
     return None
 
 
+@lru_cache(maxsize=1)
+def _converters() -> tuple:
+    """Dostupné převodní funkce z :data:`CONVERTER_CANDIDATES` (v pořadí priority)."""
+    found = []
+    for mod_name, fn_names in CONVERTER_CANDIDATES:
+        try:
+            mod = import_module(mod_name)
+        except Exception:
+            continue
+        for fn in fn_names:
+            f = getattr(mod, fn, None)
+            if callable(f):
+                found.append(f)
+    return tuple(found)
+
+
+def warm_converters() -> None:
+    """Vyřeš převodníky hned při startu (volá ``MsaConfig.ready``)."""
+    _converters.cache_clear()
+    _converters()
+
+
 def _woorld_to_gregorian(value):
     """
     Best-effort převod „woorld“ data (string/dict) na gregoriánský ``date``.
@@ -31,47 +90,24 @@ def _woorld_to_gregorian(value):
         if d:
             return d
 
-    # 2) Zkus konverzi přes fax_calendar (pokud je nainstalován)
-    try:
-        candidates = [
-            (
-                "fax_calendar.utils",
-                (
-                    "woorld_to_gregorian",
-                    "to_gregorian",
-                    "to_gregorian_date",
-                    "as_gregorian",
-                    "convert_to_gregorian",
-                ),
-            ),
-            ("fax_calendar.api", ("woorld_to_gregorian", "to_gregorian", "convert")),
-            ("fax_calendar.convert", ("woorld_to_gregorian", "to_gregorian")),
-        ]
-
-        for mod_name, fn_names in candidates:
-            try:
-                mod = import_module(mod_name)
-            except Exception:
-                continue
-            for fn in fn_names:
-                f = getattr(mod, fn, None)
-                if not f:
-                    continue
-                try:
-                    res = f(value)
-                except Exception:
-                    continue
-
-                if hasattr(res, "date"):
-                    return res.date()
-                if hasattr(res, "year") and hasattr(res, "month") and hasattr(res, "day"):
-                    return date(int(res.year), int(res.month), int(res.day))
-                if isinstance(res, str):
-                    d = _parse_date(res)
-                    if d:
-                        return d
-    except Exception:
-        pass
+    # 2) Zkus konverzi přes fax_calendar (převodníky vyřešené při startu)
+    for f in _converters():
+        try:
+            res = f(value)
+        except Exception:
+            continue
+
+        try:
+            if hasattr(res, "date"):
+                return res.date()
+            if hasattr(res, "year") and hasattr(res, "month") and hasattr(res, "day"):
+                return date(int(res.year), int(res.month), int(res.day))
+        except Exception:
+            continue
+        if isinstance(res, str):
+            d = _parse_date(res)
+            if d:
+                return d
 
     # 3) dict {year,month,day} nebo {y,m,d}
     try:
@@ -90,6 +126,10 @@ def _woorld_to_gregorian(value):
 def get_active_date(request) -> date:
     """Return active date from request or today.
 
+    The value is resolved once per request (see ``msa.middleware.ActiveDateMiddleware``)
+    and memoized on the request; :func:`reset_active_date` drops it after the
+    session date changes.
+
     Order of sources:
     - query param ``d`` or ``date``
     - session keys ``global_date``, ``woorld_today``, ``woorld_date``, ``topbar_date``
@@ -97,6 +137,18 @@ def get_active_date(request) -> date:
     Fallback to ``date.today()``.
     """
 
+    memo = getattr(request, _REQUEST_DATE_ATTR, None)
+    if memo is not None:
+        return memo
+    d = _resolve_active_date(request)
+    try:
+        setattr(request, _REQUEST_DATE_ATTR, d)
+    except AttributeError:
+        pass
+    return d
+
+
+def _resolve_active_date(request) -> date:
     # query params first
     for key in ("d", "date"):
         if key in request.GET:
@@ -134,11 +186,79 @@ def get_active_date(request) -> date:
     return date.today()
 
 
+def reset_active_date(request) -> None:
+    """Zapomeň datum/sezónu zapamatované na requestu (po změně data v session)."""
+    for attr in (_REQUEST_DATE_ATTR, _REQUEST_SEASON_ATTR):
+        request.__dict__.pop(attr, None)
+
+
+def get_active_season(request):
+    """Sezóna pro :func:`get_active_date` – dohledaná nejvýše jednou za request."""
+    memo = request.__dict__.get(_REQUEST_SEASON_ATTR, _MISSING)
+    if memo is not _MISSING:
+        return memo
+    try:
+        season = find_season_for_date(get_active_date(request))
+    except (OperationalError, ProgrammingError):
+        season = None
+    request.__dict__[_REQUEST_SEASON_ATTR] = season
+    return season
+
+
+class _SeasonIndex:
+    """Procesní index intervalů sezón ``(start, end)`` v pořadí ``id``.
+
+    Drží jen sloupce nutné k výběru; instance se vrací jako kopie, aby se úpravy
+    v jednom requestu nepropsaly do dalších.
+    """
+
+    def __init__(self):
+        self.generation = _MISSING
+        self.built_at = 0.0
+        self.intervals: list[tuple[str, str, object]] = []
+
+    def stale(self, generation) -> bool:
+        return (
+            self.generation is _MISSING
+            or generation != self.generation
+            or time.monotonic() - self.built_at > SEASON_INDEX_TTL
+        )
+
+    def rebuild(self, Season, generation) -> None:
+        intervals = []
+        for season in (
+            Season.objects.exclude(start_date__isnull=True)
+            .exclude(end_date__isnull=True)
+            .order_by("id")
+        ):
+            if season.start_date and season.end_date:
+                intervals.append((str(season.start_date), str(season.end_date), season))
+        self.intervals = intervals
+        self.generation = generation
+        self.built_at = time.monotonic()
+
+    def find(self, iso: str):
+        for start, end, season in self.intervals:
+            if start <= iso <= end:
+                return copy.copy(season)
+        return None
+
+
+_season_index = _SeasonIndex()
+
+
+def invalidate_season_index() -> None:
+    """Zneplatní index sezón ve všech procesech (volá ``Season.save``/``delete``)."""
+    cache.set(SEASON_INDEX_GENERATION_KEY, time.time_ns(), None)
+    _season_index.generation = _MISSING
+
+
 def find_season_for_date(d: date):
     """Return Season object that includes date ``d``.
 
     The function is tolerant to various season schemas and returns ``None`` when
-    the model is unavailable or no season matches the given date.
+    the model is unavailable or no season matches the given date.  Seasons with
+    ``start_date``/``end_date`` are answered from an in-process interval index.
     """
 
     Season = apps.get_model("msa", "Season") if apps.is_installed("msa") else None
@@ -149,7 +269,10 @@ def find_season_for_date(d: date):
     qs = Season.objects.all()
 
     if {"start_date", "end_date"}.issubset(fields):
-        return qs.filter(start_date__lte=d, end_date__gte=d).order_by("id").first()
+        generation = cache.get(SEASON_INDEX_GENERATION_KEY)
+        if _season_index.stale(generation):
+            _season_index.rebuild(Season, generation)
+        return _season_index.find(d.isoformat())
     if {"from_date", "to_date"}.issubset(fields):
         return qs.filter(from_date__lte=d, to_date__gte=d).order_by("id").first()
     if "year" in fields:
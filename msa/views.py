@@ -3,6 +3,7 @@ import io
 import logging
 import re
 from collections import OrderedDict, defaultdict
+from collections.abc import Iterator
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -13,13 +14,33 @@ from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
 from django.db import OperationalError
 from django.db.models import Q
 from django.db.models.fields.related import ForeignKey
-from django.http import Http404, HttpResponse, JsonResponse
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
 from django.shortcuts import render
 from django.urls import NoReverseMatch, reverse
 from django.utils import timezone as django_timezone
-from django.views.decorators.http import require_GET, require_POST
-
+from django.views.decorators.http import condition, require_GET, require_POST
+
+from msa.models import Match, Phase, Tournament
+from msa.services.conditional import (
+    tournament_etag,
+    tournaments_list_etag,
+    tournaments_list_last_modified,
+)
+from msa.services.live_feed import DEFAULT_LIMIT as LIVE_FEED_LIMIT
+from msa.services.live_feed import changes_since, stream_changes
+from msa.services.live_state import live_badge_count
+from msa.services.live_state import match_status_and_sets as _match_status_and_sets
 from msa.services.md_embed import effective_template_size_for_md, md_anchor_map
+from msa.services.response_cache import (
+    ALL_TOURNAMENTS_TAG,
+    RANKINGS_TAG,
+    cache_response,
+    player_tag,
+    season_tag,
+    tag_response,
+    tournament_tag,
+)
+from msa.services.view_cache import cached_season_model, cached_view_model
 
 try:
     from msa.services.qual_generator import (
@@ -46,7 +67,7 @@ except Exception:
         return []
 
 
-from msa.utils.dates import find_season_for_date, get_active_date
+from msa.utils.dates import get_active_date, get_active_season
 
 from .utils import enumerate_fax_months
 
@@ -92,6 +113,17 @@ ALLOWED_ADMIN_ACTIONS = {
 }
 
 
+# Velikost dávky pro QuerySet.iterator() ve streamovaných exportech.
+EXPORT_CHUNK_SIZE = 500
+
+
+class _Echo:
+    """Pseudo-buffer pro csv.writer: ``write`` jen vrací řádek ke streamování."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
 def _csv_value(value: Any) -> str:
     if value is None:
         return ""
@@ -213,6 +245,13 @@ def _normalize_woorld_value(value) -> str | None:
 
 
 def _current_fax_iso(request) -> str:
+    memo = request.__dict__.get("_msa_current_fax_iso")
+    if memo is None:
+        memo = request.__dict__["_msa_current_fax_iso"] = _compute_current_fax_iso(request)
+    return memo
+
+
+def _compute_current_fax_iso(request) -> str:
     candidates = [
         getattr(request, "session", {}).get("woorld_today"),
         getattr(request, "session", {}).get("woorld_date"),
@@ -228,7 +267,10 @@ def _current_fax_iso(request) -> str:
 
 
 def _resolve_tournament_status(request, start_iso: str | None, end_iso: str | None):
-    now_iso = _current_fax_iso(request)
+    return _status_for_date(_current_fax_iso(request), start_iso, end_iso)
+
+
+def _status_for_date(now_iso: str, start_iso: str | None, end_iso: str | None):
     now_tuple = _parse_fax_iso(now_iso)
     start_tuple = _parse_fax_iso(start_iso)
     end_tuple = _parse_fax_iso(end_iso)
@@ -255,7 +297,9 @@ def _get_tournament_or_404(tournament_id: int):
         raise Http404("Tournament model unavailable")
     try:
         qs = Tournament.objects.all()
-        qs = qs.select_related("season", "category", "category__tour")
+        qs = qs.select_related(
+            "season", "category", "category__tour", "category_season", "view_version"
+        )
         return qs.get(pk=tournament_id)
     except (Tournament.DoesNotExist, OperationalError) as err:
         raise Http404("Tournament not found") from err
@@ -369,79 +413,6 @@ def _entry_payload(row: dict[str, Any]) -> dict[str, Any] | None:
     return payload
 
 
-def _parse_sets(score_payload: Any) -> tuple[list[dict[str, Any]], bool]:
-    sets: list[dict[str, Any]] = []
-    has_partial = False
-    raw_sets = []
-    if isinstance(score_payload, dict):
-        raw_sets = score_payload.get("sets") or []
-    for item in raw_sets:
-        if isinstance(item, dict):
-            raw_a = item.get("a", item.get("top"))
-            raw_b = item.get("b", item.get("bottom"))
-            status_raw = item.get("status")
-            if raw_a in (None, "", "-") or raw_b in (None, "", "-"):
-                has_partial = True
-            try:
-                a_val = int(raw_a)
-                b_val = int(raw_b)
-            except (TypeError, ValueError):
-                if raw_a is not None or raw_b is not None:
-                    has_partial = True
-                continue
-            if status_raw:
-                status_norm = str(status_raw).strip().lower()
-                if status_norm and status_norm not in {"finished", "done", "completed"}:
-                    has_partial = True
-            sets.append({"a": a_val, "b": b_val, "status": status_raw})
-        elif isinstance(item, list | tuple) and len(item) >= 2:
-            raw_a, raw_b = item[0], item[1]
-            try:
-                a_val = int(raw_a)
-                b_val = int(raw_b)
-            except (TypeError, ValueError):
-                if raw_a is not None or raw_b is not None:
-                    has_partial = True
-                continue
-            sets.append({"a": a_val, "b": b_val, "status": None})
-    if isinstance(score_payload, dict) and len(sets) < len(raw_sets):
-        has_partial = True
-    return sets, has_partial
-
-
-def _match_status_and_sets(match) -> tuple[str, list[dict[str, Any]]]:
-    score_payload = getattr(match, "score", None) or {}
-    sets, has_partial = _parse_sets(score_payload)
-    meta_status = ""
-    if isinstance(score_payload, dict):
-        meta = score_payload.get("meta")
-        if isinstance(meta, dict):
-            meta_status = (meta.get("status") or "").strip().lower()
-
-    state_value = (getattr(match, "state", None) or "").upper()
-    base_status = {
-        "DONE": "finished",
-        "SCHEDULED": "scheduled",
-        "PENDING": "scheduled",
-        "LIVE": "live",
-    }.get(state_value, state_value.lower() or "scheduled")
-
-    if state_value == "DONE":
-        base_status = "finished"
-
-    if base_status != "finished":
-        in_progress_flag = bool(getattr(match, "in_progress", False))
-        has_recorded_sets = bool(sets)
-        if meta_status == "live":
-            base_status = "live"
-        elif base_status == "live" or in_progress_flag:
-            base_status = "live"
-        elif has_partial and (base_status != "scheduled" or has_recorded_sets):
-            base_status = "live"
-
-    return base_status, sets
-
-
 def _entry_rows_for_tournament(tournament) -> dict[str, Any]:
     TournamentEntry = apps.get_model("msa", "TournamentEntry") if apps.is_installed("msa") else None
     PlayerLicense = apps.get_model("msa", "PlayerLicense") if apps.is_installed("msa") else None
@@ -794,6 +765,42 @@ def _main_draw_structure(tournament, entry_data: dict[str, Any]) -> dict[str, An
     }
 
 
+def _tournament_entry_data(tournament) -> dict[str, Any]:
+    return cached_view_model(tournament, "entries", lambda: _entry_rows_for_tournament(tournament))
+
+
+def _tournament_qualification_data(tournament) -> dict[str, Any]:
+    return cached_view_model(
+        tournament,
+        "qualification",
+        lambda: _qualification_structure(tournament, _tournament_entry_data(tournament)),
+    )
+
+
+def _tournament_main_draw_data(tournament) -> dict[str, Any]:
+    return cached_view_model(
+        tournament,
+        "maindraw",
+        lambda: _main_draw_structure(tournament, _tournament_entry_data(tournament)),
+    )
+
+
+def _tournament_tags(request, tournament_id: int) -> list[str]:
+    return [tournament_tag(tournament_id)]
+
+
+def _season_tags(request) -> list[str]:
+    season_id = request.GET.get("season") or request.GET.get("id")
+    return [season_tag(season_id) if season_id else ALL_TOURNAMENTS_TAG]
+
+
+def _tag_entry_players(request, entry_data: dict[str, Any]) -> None:
+    tag_response(
+        request,
+        *(player_tag(row.get("player_id")) for row in entry_data.get("rows", [])),
+    )
+
+
 def _tournament_detail_url(tournament) -> str:
     identifier = getattr(tournament, "id", None)
     if identifier is None:
@@ -892,8 +899,7 @@ def seasons_list(request):
 
 
 def tournaments_list(request):
-    d = get_active_date(request)
-    season = find_season_for_date(d)
+    season = get_active_season(request)
     if not season:
         return seasons_list(request)
 
@@ -923,7 +929,7 @@ def tournaments_list(request):
     context = {
         "tournaments": tournaments,
         "active_season": season,
-        "active_date": d,
+        "active_date": get_active_date(request),
     }
     return render(request, "msa/tournaments/list.html", context)
 
@@ -959,7 +965,7 @@ def admin_action(request):
     )
 
 
-def _filtered_tournament_cards(request) -> list[tuple[Any, dict[str, Any]]]:
+def _iter_filtered_tournament_cards(request) -> Iterator[tuple[Any, dict[str, Any]]]:
     Season = apps.get_model("msa", "Season") if apps.is_installed("msa") else None
     Tournament = _get_tournament_model()
 
@@ -968,7 +974,7 @@ def _filtered_tournament_cards(request) -> list[tuple[Any, dict[str, Any]]]:
     status_filter = (request.GET.get("status") or "").strip().lower()
     search_query = (request.GET.get("q") or "").strip()
 
-    tournaments_raw: list[Any] = []
+    qs = None
     if Tournament:
         try:
             qs = Tournament.objects.all()
@@ -1007,27 +1013,30 @@ def _filtered_tournament_cards(request) -> list[tuple[Any, dict[str, Any]]]:
             if _has_model_field(Tournament, "name"):
                 order_fields.append("name")
             order_fields.append("id")
-            tournaments_raw = list(qs.order_by(*order_fields))
+            qs = qs.order_by(*order_fields)
         except OperationalError:
-            tournaments_raw = []
+            qs = None
+    if qs is None:
+        return
 
     valid_status = {"planned", "running", "completed"}
-    result: list[tuple[Any, dict[str, Any]]] = []
-    for tournament in tournaments_raw:
-        card = _tournament_card(request, tournament)
-        if status_filter in valid_status:
-            if card.get("status", {}).get("key") != status_filter:
-                continue
-        result.append((tournament, card))
-    return result
+    try:
+        for tournament in qs.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            card = _tournament_card(request, tournament)
+            if status_filter in valid_status:
+                if card.get("status", {}).get("key") != status_filter:
+                    continue
+            yield tournament, card
+    except OperationalError:
+        return
 
 
-@require_GET
-def export_tournaments_csv(request):
-    tournaments_with_cards = _filtered_tournament_cards(request)
+def _filtered_tournament_cards(request) -> list[tuple[Any, dict[str, Any]]]:
+    return list(_iter_filtered_tournament_cards(request))
 
-    buffer = io.StringIO()
-    writer = csv.writer(buffer)
+
+def _iter_tournaments_csv(request) -> Iterator[str]:
+    writer = csv.writer(_Echo())
     headers = [
         "id",
         "name",
@@ -1041,16 +1050,16 @@ def export_tournaments_csv(request):
         "location",
         "status",
     ]
-    writer.writerow(headers)
+    yield writer.writerow(headers)
 
-    for tournament, card in tournaments_with_cards:
+    for tournament, card in _iter_filtered_tournament_cards(request):
         season_label = card.get("season_label")
         if not season_label:
             season = getattr(tournament, "season", None)
             if season:
                 season_label = getattr(season, "name", None) or str(season)
         status_meta = card.get("status", {}) if isinstance(card, dict) else {}
-        writer.writerow(
+        yield writer.writerow(
             [
                 _csv_value(getattr(tournament, "id", "")),
                 _csv_value(card.get("name")),
@@ -1066,11 +1075,90 @@ def export_tournaments_csv(request):
             ]
         )
 
-    response = HttpResponse(buffer.getvalue(), content_type="text/csv; charset=utf-8")
+
+@require_GET
+def export_tournaments_csv(request):
+    response = StreamingHttpResponse(
+        _iter_tournaments_csv(request), content_type="text/csv; charset=utf-8"
+    )
     response["Content-Disposition"] = 'attachment; filename="tournaments.csv"'
     return response
 
 
+def _season_tournaments_queryset(season):
+    Tournament = _get_tournament_model()
+    if not (Tournament and season):
+        return None
+    qs = Tournament.objects.all()
+    if _has_model_field(Tournament, "season"):
+        qs = qs.filter(season=season)
+    elif _has_model_field(Tournament, "start_date") and _has_model_field(Tournament, "end_date"):
+        if getattr(season, "start_date", None) and getattr(season, "end_date", None):
+            qs = qs.filter(
+                start_date__lte=season.end_date,
+                end_date__gte=season.start_date,
+            )
+    try:
+        qs = qs.select_related("category", "category__tour", "category_season", "season")
+    except Exception:
+        qs = qs
+    order_fields = []
+    if _has_model_field(Tournament, "start_date"):
+        order_fields.append("start_date")
+    if _has_model_field(Tournament, "name"):
+        order_fields.append("name")
+    order_fields.append("id")
+    return qs.order_by(*order_fields)
+
+
+def _tournament_vevent_lines(request, tournament, now_utc: str) -> list[str]:
+    card = _tournament_card(request, tournament)
+    lines = ["BEGIN:VEVENT"]
+    uid = f"msa-tournament-{getattr(tournament, 'id', '')}@fax"
+    lines.append(f"UID:{uid}")
+    lines.append(f"DTSTAMP:{now_utc}")
+    summary = card.get("name") or getattr(tournament, "name", None) or "Tournament"
+    lines.append(f"SUMMARY:{_ics_escape(str(summary))}")
+    start_value = _ics_date(card.get("start_date"))
+    if start_value:
+        lines.append(f"DTSTART;VALUE=DATE:{start_value}")
+    end_raw = card.get("end_date")
+    if end_raw:
+        try:
+            parsed = datetime.strptime(str(end_raw)[:10], "%Y-%m-%d").date()
+            end_value = (parsed + timedelta(days=1)).strftime("%Y%m%d")
+        except Exception:
+            end_value = _ics_date(end_raw)
+        if end_value:
+            lines.append(f"DTEND;VALUE=DATE:{end_value}")
+    categories = []
+    if card.get("tour_label"):
+        categories.append(str(card.get("tour_label")))
+    if card.get("category_label"):
+        categories.append(str(card.get("category_label")))
+    if categories:
+        escaped_categories = ",".join(_ics_escape(str(cat)) for cat in categories)
+        lines.append(f"CATEGORIES:{escaped_categories}")
+    location = card.get("location")
+    if location:
+        lines.append(f"LOCATION:{_ics_escape(str(location))}")
+    lines.append("END:VEVENT")
+    return lines
+
+
+def _iter_season_ics(request, season) -> Iterator[str]:
+    yield "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//fax//msa//EN\r\n"
+    now_utc = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+    try:
+        qs = _season_tournaments_queryset(season)
+        if qs is not None:
+            for tournament in qs.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+                yield "\r\n".join(_tournament_vevent_lines(request, tournament, now_utc)) + "\r\n"
+    except OperationalError:
+        pass
+    yield "END:VCALENDAR\r\n"
+
+
 @require_GET
 def export_calendar_ics(request):
     season = None
@@ -1083,82 +1171,13 @@ def export_calendar_ics(request):
             season = None
     if not season:
         try:
-            active_date = get_active_date(request)
-            season = find_season_for_date(active_date)
+            season = get_active_season(request)
         except OperationalError:
             season = None
 
-    Tournament = _get_tournament_model()
-    tournaments: list[Any] = []
-    if Tournament and season:
-        try:
-            qs = Tournament.objects.all()
-            if _has_model_field(Tournament, "season"):
-                qs = qs.filter(season=season)
-            elif _has_model_field(Tournament, "start_date") and _has_model_field(
-                Tournament, "end_date"
-            ):
-                if getattr(season, "start_date", None) and getattr(season, "end_date", None):
-                    qs = qs.filter(
-                        start_date__lte=season.end_date,
-                        end_date__gte=season.start_date,
-                    )
-            try:
-                qs = qs.select_related("category", "category__tour", "season")
-            except Exception:
-                qs = qs
-            order_fields = []
-            if _has_model_field(Tournament, "start_date"):
-                order_fields.append("start_date")
-            if _has_model_field(Tournament, "name"):
-                order_fields.append("name")
-            order_fields.append("id")
-            tournaments = list(qs.order_by(*order_fields))
-        except OperationalError:
-            tournaments = []
-
-    lines = [
-        "BEGIN:VCALENDAR",
-        "VERSION:2.0",
-        "PRODID:-//fax//msa//EN",
-    ]
-    now_utc = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
-    for tournament in tournaments:
-        card = _tournament_card(request, tournament)
-        lines.append("BEGIN:VEVENT")
-        uid = f"msa-tournament-{getattr(tournament, 'id', '')}@fax"
-        lines.append(f"UID:{uid}")
-        lines.append(f"DTSTAMP:{now_utc}")
-        summary = card.get("name") or getattr(tournament, "name", None) or "Tournament"
-        lines.append(f"SUMMARY:{_ics_escape(str(summary))}")
-        start_value = _ics_date(card.get("start_date"))
-        if start_value:
-            lines.append(f"DTSTART;VALUE=DATE:{start_value}")
-        end_raw = card.get("end_date")
-        if end_raw:
-            try:
-                parsed = datetime.strptime(str(end_raw)[:10], "%Y-%m-%d").date()
-                end_value = (parsed + timedelta(days=1)).strftime("%Y%m%d")
-            except Exception:
-                end_value = _ics_date(end_raw)
-            if end_value:
-                lines.append(f"DTEND;VALUE=DATE:{end_value}")
-        categories = []
-        if card.get("tour_label"):
-            categories.append(str(card.get("tour_label")))
-        if card.get("category_label"):
-            categories.append(str(card.get("category_label")))
-        if categories:
-            escaped_categories = ",".join(_ics_escape(str(cat)) for cat in categories)
-            lines.append(f"CATEGORIES:{escaped_categories}")
-        location = card.get("location")
-        if location:
-            lines.append(f"LOCATION:{_ics_escape(str(location))}")
-        lines.append("END:VEVENT")
-    lines.append("END:VCALENDAR")
-
-    body = "\r\n".join(lines) + "\r\n"
-    response = HttpResponse(body, content_type="text/calendar; charset=utf-8")
+    response = StreamingHttpResponse(
+        _iter_season_ics(request, season), content_type="text/calendar; charset=utf-8"
+    )
     response["Content-Disposition"] = 'attachment; filename="season.ics"'
     return response
 
@@ -1166,7 +1185,7 @@ def export_calendar_ics(request):
 @require_GET
 def export_tournament_players_csv(request, tournament_id: int):
     tournament = _get_tournament_or_404(tournament_id)
-    entry_data = _entry_rows_for_tournament(tournament)
+    entry_data = _tournament_entry_data(tournament)
     blocks = entry_data.get("blocks", {}) if isinstance(entry_data, dict) else {}
     block_sequence = [
         ("Seeds", blocks.get("seeds", [])),
@@ -1357,61 +1376,42 @@ def players_list(request):
     return render(request, "msa/players/list.html")
 
 
-def calendar(request):
-    """
-    Kalendář – respektuje ?season=<id>, jinak vybere sezónu dle aktivního data.
-    """
-    d = get_active_date(request)
+def _season_calendar_data(request, season) -> dict[str, Any]:
+    """Karty a měsíční skupiny kalendáře sezóny v pevném počtu dotazů.
 
+    Turnaje (s kategorií, tour a category-season) jdou jedním dotazem, vítězové finále
+    druhým; výsledek se cachuje přes :func:`cached_season_model`.
+    """
+    tournaments: list[Any] = []
     try:
-        season = _get_season_by_query_param(request)
+        tournaments = list(
+            Tournament.objects.filter(season=season)
+            .select_related("season", "category", "category__tour", "category_season")
+            .order_by("start_date", "name", "id")
+        )
     except OperationalError:
-        season = None
-
-    if not season:
-        try:
-            season = find_season_for_date(d)
-        except OperationalError:
-            season = None
-
-    if not season:
-        return seasons_list(request)
-
-    season_id = request.GET.get("season")
-    if not season_id:
-        season_id = getattr(season, "id", "")
-    season_id = str(season_id) if season_id not in {None, ""} else ""
-
-    tournaments: list[Any] = []
-    Tournament = _get_tournament_model()
-    if Tournament and season:
-        try:
-            qs = Tournament.objects.all()
-            if _has_model_field(Tournament, "season"):
-                qs = qs.filter(season=season)
-            elif _has_model_field(Tournament, "start_date") and _has_model_field(
-                Tournament, "end_date"
-            ):
-                if getattr(season, "start_date", None) and getattr(season, "end_date", None):
-                    qs = qs.filter(
-                        start_date__lte=season.end_date,
-                        end_date__gte=season.start_date,
-                    )
-            try:
-                qs = qs.select_related("category", "category__tour", "category_season")
-            except Exception:
-                qs = qs
-            order_fields = []
-            if _has_model_field(Tournament, "start_date"):
-                order_fields.append("start_date")
-            if _has_model_field(Tournament, "name"):
-                order_fields.append("name")
-            order_fields.append("id")
-            tournaments = list(qs.order_by(*order_fields))
-        except OperationalError:
-            tournaments = []
+        tournaments = []
+
+    champions: dict[int, str] = {}
+    if tournaments:
+        finals = (
+            Match.objects.filter(
+                tournament_id__in=[t.id for t in tournaments],
+                phase=Phase.MD,
+                round_name="R2",
+                winner__isnull=False,
+            )
+            .select_related("winner")
+            .only("tournament_id", "winner__name", "winner__full_name")
+        )
+        for final in finals:
+            champions[final.tournament_id] = _player_display(final.winner)
 
-    cards = [_tournament_card(request, tournament) for tournament in tournaments]
+    cards = []
+    for tournament in tournaments:
+        card = _tournament_card(request, tournament)
+        card["champion"] = champions.get(tournament.id)
+        cards.append(card)
 
     month_sequence: list[int] = []
     start_iso = getattr(season, "start_date", None)
@@ -1463,6 +1463,48 @@ def calendar(request):
             }
         )
 
+    return {"cards": cards, "month_groups": month_groups, "month_sequence": month_sequence}
+
+
+def calendar(request):
+    """
+    Kalendář – respektuje ?season=<id>, jinak vybere sezónu dle aktivního data.
+    """
+    d = get_active_date(request)
+
+    try:
+        season = _get_season_by_query_param(request)
+    except OperationalError:
+        season = None
+
+    if not season:
+        try:
+            season = get_active_season(request)
+        except OperationalError:
+            season = None
+
+    if not season:
+        return seasons_list(request)
+
+    season_id = request.GET.get("season")
+    if not season_id:
+        season_id = getattr(season, "id", "")
+    season_id = str(season_id) if season_id not in {None, ""} else ""
+
+    try:
+        calendar_data = cached_season_model(
+            season, "calendar", lambda: _season_calendar_data(request, season)
+        )
+    except OperationalError:
+        calendar_data = _season_calendar_data(request, season)
+    # status závisí na aktivním datu požadavku → dopočítá se nad daty z cache
+    now_iso = _current_fax_iso(request)
+    cards = calendar_data["cards"]
+    for card in cards:
+        card["status"] = _status_for_date(now_iso, card.get("start_date"), card.get("end_date"))
+    month_groups = calendar_data["month_groups"]
+    month_sequence = calendar_data["month_sequence"]
+
     toolbar_title = "Calendar overview"
     if season:
         season_name = getattr(season, "name", None) or str(season)
@@ -1508,28 +1550,10 @@ def search(request):
 
 
 def nav_live_badge(request):
-    Match = apps.get_model("msa", "Match") if apps.is_installed("msa") else None
-    live_count = 0
-    if Match:
-        try:
-            live_count = Match.objects.filter(state="LIVE").count()
-        except OperationalError:
-            live_count = 0
-        if live_count == 0 and getattr(settings, "MSA_BADGE_INCLUDE_PARTIALS", False):
-            try:
-                qs = Match.objects.all()
-                iterator = qs.iterator() if hasattr(qs, "iterator") else qs
-                partial_count = 0
-                for match in iterator:
-                    try:
-                        status, _ = _match_status_and_sets(match)
-                    except Exception:
-                        continue
-                    if status == "live":
-                        partial_count += 1
-                live_count = partial_count
-            except OperationalError:
-                live_count = 0
+    try:
+        live_count = live_badge_count()
+    except OperationalError:
+        live_count = 0
     if live_count > 0:
         badge = (
             '<span id="live-badge" aria-live="polite" '
@@ -1541,13 +1565,14 @@ def nav_live_badge(request):
     return HttpResponse('<span id="live-badge" class="ml-1 hidden" aria-hidden="true"></span>')
 
 
+@cache_response(_tournament_tags)
 def tournament_info(request, tournament_id: int):
     tournament = _get_tournament_or_404(tournament_id)
     context = _tournament_base_context(request, tournament)
     status_meta = context.get("status", {}) if isinstance(context, dict) else {}
     status_key = status_meta.get("key") if isinstance(status_meta, dict) else None
     disable_actions = status_key == "completed"
-    entry_data = _entry_rows_for_tournament(tournament)
+    entry_data = _tournament_entry_data(tournament)
     context.update(
         {
             "active_tab": "info",
@@ -1628,6 +1653,7 @@ def tournament_info(request, tournament_id: int):
     return render(request, "msa/tournament/info.html", context)
 
 
+@cache_response(_tournament_tags)
 def tournament_program(request, tournament_id: int):
     tournament = _get_tournament_or_404(tournament_id)
     context = _tournament_base_context(request, tournament)
@@ -1654,18 +1680,18 @@ def tournament_program(request, tournament_id: int):
     return render(request, "msa/tournament/program.html", context)
 
 
+@cache_response(_tournament_tags)
 def tournament_draws(request, tournament_id: int):
     tournament = _get_tournament_or_404(tournament_id)
     context = _tournament_base_context(request, tournament)
     status_meta = context.get("status", {}) if isinstance(context, dict) else {}
     status_key = status_meta.get("key") if isinstance(status_meta, dict) else None
     disable_actions = status_key == "completed"
-    entry_data = _entry_rows_for_tournament(tournament)
     context.update(
         {
             "active_tab": "draws",
-            "qualification_data": _qualification_structure(tournament, entry_data),
-            "maindraw_data": _main_draw_structure(tournament, entry_data),
+            "qualification_data": _tournament_qualification_data(tournament),
+            "maindraw_data": _tournament_main_draw_data(tournament),
             "admin_controls_draws_qual": [
                 {
                     "label": "Seed K",
@@ -1710,10 +1736,12 @@ def tournament_draws(request, tournament_id: int):
     return render(request, "msa/tournament/draws.html", context)
 
 
+@cache_response(_tournament_tags)
 def tournament_players(request, tournament_id: int):
     tournament = _get_tournament_or_404(tournament_id)
     context = _tournament_base_context(request, tournament)
-    entry_data = _entry_rows_for_tournament(tournament)
+    entry_data = _tournament_entry_data(tournament)
+    _tag_entry_players(request, entry_data)
     export_players_url = reverse(
         "msa:export_tournament_players_csv", args=[getattr(tournament, "id", 0)]
     )
@@ -1774,6 +1802,7 @@ def tournament_media(request, tournament_id: int):
     return render(request, "msa/tournament/media.html", context)
 
 
+@cache_response(_season_tags)
 def season_api(request):
     Season = apps.get_model("msa", "Season") if apps.is_installed("msa") else None
     season_id = request.GET.get("id") or request.GET.get("season")
@@ -1798,6 +1827,8 @@ def season_api(request):
     return JsonResponse(data)
 
 
+@condition(etag_func=tournaments_list_etag, last_modified_func=tournaments_list_last_modified)
+@cache_response(_season_tags)
 def tournaments_api(request):
     """
     JSON seznam turnajů. Preferuje sezonní filtr ?season=<id>.
@@ -1924,11 +1955,14 @@ def tournaments_api(request):
     return JsonResponse({"tournaments": items})
 
 
+@cache_response(lambda request: [RANKINGS_TAG])
 def ranking_api(request):
     """Return ranking entries for the frontend table."""
     return JsonResponse({"entries": []})
 
 
+@condition(etag_func=tournament_etag)
+@cache_response(_tournament_tags)
 def tournament_matches_api(request, tournament_id: int):
     tournament = _get_tournament_or_404(tournament_id)
     Match = apps.get_model("msa", "Match") if apps.is_installed("msa") else None
@@ -2294,6 +2328,8 @@ def tournament_matches_api(request, tournament_id: int):
     )
 
 
+@condition(etag_func=tournament_etag)
+@cache_response(_tournament_tags)
 def tournament_courts_api(request, tournament_id: int):
     tournament = _get_tournament_or_404(tournament_id)
     Match = apps.get_model("msa", "Match") if apps.is_installed("msa") else None
@@ -2360,10 +2396,13 @@ def tournament_courts_api(request, tournament_id: int):
     return JsonResponse({"courts": courts})
 
 
+@condition(etag_func=tournament_etag)
+@cache_response(_tournament_tags)
 def tournament_entries_api(request, tournament_id: int):
     tournament = _get_tournament_or_404(tournament_id)
-    entry_data = _entry_rows_for_tournament(tournament)
+    entry_data = _tournament_entry_data(tournament)
     summary = entry_data["summary"]
+    _tag_entry_players(request, entry_data)
 
     def serialize(
         rows: list[dict[str, Any]], extra: dict[str, Any] | None = None
@@ -2418,21 +2457,26 @@ def tournament_entries_api(request, tournament_id: int):
     return JsonResponse(response)
 
 
+@condition(etag_func=tournament_etag)
+@cache_response(_tournament_tags)
 def tournament_qualification_api(request, tournament_id: int):
     tournament = _get_tournament_or_404(tournament_id)
-    entry_data = _entry_rows_for_tournament(tournament)
-    data = _qualification_structure(tournament, entry_data)
+    data = _tournament_qualification_data(tournament)
     return JsonResponse(data)
 
 
+@condition(etag_func=tournament_etag)
+@cache_response(_tournament_tags)
 def tournament_maindraw_api(request, tournament_id: int):
     tournament = _get_tournament_or_404(tournament_id)
-    entry_data = _entry_rows_for_tournament(tournament)
-    data = _main_draw_structure(tournament, entry_data)
+    entry_data = _tournament_entry_data(tournament)
+    data = _tournament_main_draw_data(tournament)
     data["summary"] = entry_data["summary"]
     return JsonResponse(data)
 
 
+@condition(etag_func=tournament_etag)
+@cache_response(_tournament_tags)
 def tournament_history_api(request, tournament_id: int):
     tournament = _get_tournament_or_404(tournament_id)
     Snapshot = apps.get_model("msa", "Snapshot") if apps.is_installed("msa") else None
@@ -2456,3 +2500,38 @@ def tournament_history_api(request, tournament_id: int):
             snapshots = []
 
     return JsonResponse({"snapshots": snapshots})
+
+
+def _live_cursor(request) -> int:
+    raw = request.GET.get("cursor") or request.headers.get("Last-Event-ID") or 0
+    try:
+        return max(int(raw), 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+@require_GET
+def tournament_changes_api(request, tournament_id: int):
+    """Delta feed: změny zápasů od ``?cursor=`` (bez čtení turnaje, jeden dotaz)."""
+    cursor = _live_cursor(request)
+    try:
+        limit = int(request.GET.get("limit", LIVE_FEED_LIMIT))
+    except (TypeError, ValueError):
+        limit = LIVE_FEED_LIMIT
+    try:
+        changes = changes_since(tournament_id, cursor, limit)
+    except OperationalError:
+        changes = []
+    next_cursor = changes[-1]["id"] if changes else cursor
+    return JsonResponse({"changes": changes, "count": len(changes), "cursor": next_cursor})
+
+
+@require_GET
+def tournament_changes_stream(request, tournament_id: int):
+    """SSE varianta delta feedu; navazuje přes Last-Event-ID nebo ``?cursor=``."""
+    response = StreamingHttpResponse(
+        stream_changes(tournament_id, _live_cursor(request)), content_type="text/event-stream"
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
@@ -0,0 +1,137 @@
+"""Change tracking for searchable models.
+
+Every save/delete of a model of a registered :class:`search.registry.SearchSource` bumps a
+generation counter stored in the Django cache and notifies in-process listeners,
+so per-process indexes can update incrementally.  Other processes' changes are
+only detected when the cache is shared by all workers: the default
+``LocMemCache`` is per process, so a multi-worker deployment needs ``FAX_CACHE_DIR``
+or another shared backend (one with an atomic ``incr``, e.g. Redis or Memcached,
+so that concurrent bumps are never lost).  :func:`refresh_index` rebuilds such an
+index in a background thread while the old one keeps serving.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+from django.core.cache import cache
+from django.db import DatabaseError, connection, connections
+from django.db.models.signals import post_delete, post_save
+
+from .registry import SearchSource, get_sources
+
+logger = logging.getLogger(__name__)
+
+CONTENT_GENERATION_KEY = "search:content-gen"
+
+# listener(source, instance, deleted, old_generation, new_generation)
+Listener = Callable[[SearchSource, object, bool, object, int], None]
+_listeners: list[Listener] = []
+
+# indexy, jejichž přestavba právě běží ve vlákně (id → True)
+_rebuilding: set[int] = set()
+_rebuilding_lock = threading.Lock()
+
+
+def content_generation():
+    """Current generation (``None`` until the first change)."""
+    return cache.get(CONTENT_GENERATION_KEY)
+
+
+def bump_content_generation() -> tuple[object, int]:
+    """Atomically advance the generation; returns ``(old, new)``.
+
+    The counter starts at the current time, so a cleared cache never repeats a
+    generation an index has already seen.
+    """
+    while True:
+        start = time.time_ns()
+        created = cache.add(CONTENT_GENERATION_KEY, start, None)
+        try:
+            new = cache.incr(CONTENT_GENERATION_KEY)
+        except ValueError:
+            # klíč mezitím vypadl z cache (cull) – založit znovu
+            continue
+        # před založením klíče byla generace None (pokud mezitím nepřičetl někdo jiný)
+        return (None if created and new == start + 1 else new - 1), new
+
+
+def _rebuild_in_background(index) -> None:
+    try:
+        index.rebuild(get_sources())
+    except DatabaseError:
+        logger.warning("search index rebuild failed", exc_info=True)
+    finally:
+        with _rebuilding_lock:
+            _rebuilding.discard(id(index))
+        # vlákno si drželo vlastní spojení
+        connections.close_all()
+
+
+def refresh_index(index):
+    """Return ``index``, rebuilding it when another process changed the content.
+
+    The first build runs inline (there is nothing to serve yet).  Later rebuilds run in
+    one background thread per index and requests keep using the current index meanwhile.
+    Inside an open transaction (``ATOMIC_REQUESTS``, tests) the rebuild runs inline,
+    because another thread's connection would not see uncommitted rows.
+    """
+    if not index.built():
+        index.rebuild(get_sources())
+        return index
+    if not index.stale():
+        return index
+    if connection.in_atomic_block:
+        index.rebuild(get_sources())
+        return index
+    with _rebuilding_lock:
+        if id(index) in _rebuilding:
+            return index
+        _rebuilding.add(id(index))
+    threading.Thread(
+        target=_rebuild_in_background, args=(index,), name="search-index-rebuild", daemon=True
+    ).start()
+    return index
+
+
+def register_listener(listener: Listener) -> None:
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def _notify(source: SearchSource, instance, deleted: bool) -> None:
+    old, new = bump_content_generation()
+    for listener in list(_listeners):
+        listener(source, instance, deleted, old, new)
+
+
+def connect_source(source: SearchSource) -> None:
+    def _saved(sender, instance, **kwargs):
+        _notify(source, instance, False)
+
+    def _deleted(sender, instance, **kwargs):
+        _notify(source, instance, True)
+
+    uid = f"search-content:{source.name}"
+    post_save.connect(_saved, sender=source.model, weak=False, dispatch_uid=uid)
+    post_delete.connect(_deleted, sender=source.model, weak=False, dispatch_uid=uid)
+
+
+def disconnect_source(source: SearchSource) -> None:
+    uid = f"search-content:{source.name}"
+    post_save.disconnect(sender=source.model, dispatch_uid=uid)
+    post_delete.disconnect(sender=source.model, dispatch_uid=uid)
+
+
+__all__ = [
+    "CONTENT_GENERATION_KEY",
+    "content_generation",
+    "bump_content_generation",
+    "refresh_index",
+    "register_listener",
+    "connect_source",
+    "disconnect_source",
+]
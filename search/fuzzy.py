@@ -0,0 +1,178 @@
+"""Whole-corpus typo-tolerant lookup: token dictionary + BK-tree.
+
+The index maps normalized title/slug tokens of every indexed document to
+``(source name, pk)`` keys.  Queries walk a BK-tree over the token dictionary,
+so edit-distance-1 matching does not scan the corpus.  Saves update the index
+incrementally (:mod:`search.content`); another worker's change triggers a
+background rebuild.  Writes that bypass signals (``queryset.update``, raw SQL)
+must call :func:`search.content.bump_content_generation`.  Hits are re-read from
+the database, so rolled back or deleted rows never surface.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+
+from . import content
+from .registry import SearchSource, get_sources
+from .utils import fuzzy1_token_match, levenshtein
+
+_MISSING = object()
+
+
+class BKTree:
+    """Burkhard–Keller tree over strings with Levenshtein distance."""
+
+    __slots__ = ("root", "size")
+
+    def __init__(self):
+        self.root: tuple[str, dict] | None = None
+        self.size = 0
+
+    def add(self, word: str) -> None:
+        if self.root is None:
+            self.root = (word, {})
+            self.size = 1
+            return
+        node = self.root
+        while True:
+            dist = levenshtein(word, node[0])
+            if dist == 0:
+                return
+            child = node[1].get(dist)
+            if child is None:
+                node[1][dist] = (word, {})
+                self.size += 1
+                return
+            node = child
+
+    def search(self, word: str, max_dist: int) -> list[str]:
+        if self.root is None:
+            return []
+        found = []
+        stack = [self.root]
+        while stack:
+            token, children = stack.pop()
+            dist = levenshtein(word, token)
+            if dist <= max_dist:
+                found.append(token)
+            for d in range(max(dist - max_dist, 1), dist + max_dist + 1):
+                child = children.get(d)
+                if child is not None:
+                    stack.append(child)
+        return found
+
+
+class FuzzyIndex:
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.tree = BKTree()
+        self.postings: dict[str, set[tuple[str, int]]] = defaultdict(set)
+        self.doc_tokens: dict[tuple[str, int], frozenset[str]] = {}
+        self.generation = _MISSING
+
+    # -- maintenance ---------------------------------------------------
+    def _add_doc(self, key: tuple[str, int], tokens: frozenset[str]) -> None:
+        self.doc_tokens[key] = tokens
+        for token in tokens:
+            if token not in self.postings:
+                self.tree.add(token)
+            self.postings[token].add(key)
+
+    def _remove_doc(self, key: tuple[str, int]) -> None:
+        # tokeny zůstávají ve stromu; prázdné postings se při hledání přeskočí
+        for token in self.doc_tokens.pop(key, ()):
+            docs = self.postings.get(token)
+            if docs is not None:
+                docs.discard(key)
+
+    def rebuild(self, sources: list[SearchSource]) -> None:
+        generation = content.content_generation()
+        tree = BKTree()
+        postings: dict[str, set[tuple[str, int]]] = defaultdict(set)
+        doc_tokens: dict[tuple[str, int], frozenset[str]] = {}
+        for source in sources:
+            for obj in source.queryset().iterator(chunk_size=2000):
+                key = (source.name, obj.pk)
+                tokens = frozenset(source.tokens(obj))
+                doc_tokens[key] = tokens
+                for token in tokens:
+                    if token not in postings:
+                        tree.add(token)
+                    postings[token].add(key)
+        with self.lock:
+            self.tree, self.postings, self.doc_tokens = tree, postings, doc_tokens
+            self.generation = generation
+
+    def apply(self, source: SearchSource, instance, deleted: bool, old, new) -> None:
+        with self.lock:
+            if self.generation is _MISSING:
+                return
+            key = (source.name, instance.pk)
+            self._remove_doc(key)
+            if not deleted and source.include(instance):
+                self._add_doc(key, frozenset(source.tokens(instance)))
+            # cizí změna mezi naší poslední a touto generací → index nechá přestavět
+            if self.generation == old:
+                self.generation = new
+
+    def built(self) -> bool:
+        return self.generation is not _MISSING
+
+    def stale(self) -> bool:
+        return not self.built() or self.generation != content.content_generation()
+
+    # -- queries -------------------------------------------------------
+    def candidates(self, q_tokens: set[str]) -> dict[str, set[int]]:
+        """``{source name: {pk}}`` of documents with a token within distance 1."""
+        out: dict[str, set[int]] = defaultdict(set)
+        with self.lock:
+            for q_tok in q_tokens:
+                for token in self.tree.search(q_tok, 1):
+                    if not fuzzy1_token_match(q_tok, token):
+                        continue
+                    for name, pk in self.postings.get(token, ()):
+                        out[name].add(pk)
+        return out
+
+
+_index = FuzzyIndex()
+content.register_listener(_index.apply)
+
+
+def get_index() -> FuzzyIndex:
+    return content.refresh_index(_index)
+
+
+def fuzzy_hits(q_tokens: set[str], exclude_urls: set[str] | None = None) -> list[dict]:
+    """Documents whose title/slug has a token within edit distance 1 of a query token.
+
+    Returns hit dicts (``type``, ``url``, ``title``, ``snippet``, ``date``,
+    ``source``) sorted by title; URLs from ``exclude_urls`` are skipped.
+    """
+
+    if not q_tokens:
+        return []
+    exclude_urls = exclude_urls or set()
+    candidates = get_index().candidates(q_tokens)
+    hits: list[dict] = []
+    seen: set[str] = set()
+    for source in get_sources():
+        pks = candidates.get(source.name)
+        if not pks:
+            continue
+        for obj in source.queryset().filter(pk__in=pks):
+            tokens = source.tokens(obj)
+            if not any(fuzzy1_token_match(qt, tt) for qt in q_tokens for tt in tokens):
+                continue
+            hit = source.hit(obj)
+            if hit["url"] in exclude_urls or hit["url"] in seen:
+                continue
+            seen.add(hit["url"])
+            hits.append(hit)
+    hits.sort(key=lambda r: r["title"])
+    return hits
+
+
+__all__ = ["BKTree", "FuzzyIndex", "get_index", "fuzzy_hits"]
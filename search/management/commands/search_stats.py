@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from search.result_cache import reset_stats, stats
+
+
+class Command(BaseCommand):
+    help = "Show hit/miss statistics of the search result cache"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reset", action="store_true", help="zero the counters afterwards")
+
+    def handle(self, *args, **opts):
+        data = stats()
+        self.stdout.write(
+            f"hits={data['hits']} misses={data['misses']} hit_rate={data['hit_rate']} "
+            f"generation={data['generation']}"
+        )
+        if opts.get("reset"):
+            reset_stats()
@@ -0,0 +1,211 @@
+"""Per-process prefix index for type-ahead suggestions.
+
+Two sorted arrays of ``(key, score, doc)`` entries are kept: normalized titles plus
+every word-start suffix of the title (``"novak djokovic"`` → ``"djokovic"``)
+and normalized slugs.  Short prefixes (up to :data:`PREFIX_BUCKET_LEN` characters)
+match most of a large corpus, so every such prefix also has a bucket of its
+documents pre-sorted by rank; a suggestion reads only the head of the bucket.
+Longer prefixes are a ``bisect`` to the first key and a scan of the matching
+range.  Suggestions need no database query.  Freshness follows
+:mod:`search.content` like :mod:`search.fuzzy`.
+"""
+
+from __future__ import annotations
+
+import heapq
+import threading
+from bisect import bisect_left, insort
+from collections import defaultdict
+
+from . import content
+from .registry import SearchSource
+from .utils import normalize
+
+# Prefixy do této délky mají předřazené buckety seřazené podle pořadí výsledků.
+PREFIX_BUCKET_LEN = 3
+# Hotové odpovědi pro opakované (hlavně krátké) prefixy; maže se při každé změně.
+PREFIX_MEMO_SIZE = 1024
+_MISSING = object()
+
+# skóre jako dřív v suggest: prefix titulku/slugu 2, začátek slova v titulku 1
+_SCORE_FULL = 2
+_SCORE_WORD = 1
+
+_TITLE = "t"
+_SLUG = "s"
+
+
+def _title_keys(title: str) -> list[tuple[str, int]]:
+    norm = " ".join(normalize(title).replace("-", " ").split())
+    if not norm:
+        return []
+    keys = [(norm, _SCORE_FULL)]
+    start = norm.find(" ")
+    while start != -1:
+        keys.append((norm[start + 1 :], _SCORE_WORD))
+        start = norm.find(" ", start + 1)
+    return keys
+
+
+def _rank(doc_key, doc, score: int) -> tuple:
+    # pořadí návrhů: skóre, váha (popularita), titulek
+    return (-score, -doc[3], doc[0], doc_key)
+
+
+def _bucket_entries(doc_key, doc, title_entries, slug_entries) -> list[tuple]:
+    """``(bucket, rank)`` páry dokumentu – v každém bucketu jednou, s nejlepším skóre."""
+    best: dict[tuple[str, str], int] = {}
+    for kind, entries in ((_TITLE, title_entries), (_SLUG, slug_entries)):
+        for key, score, _ in entries:
+            for n in range(1, min(len(key), PREFIX_BUCKET_LEN) + 1):
+                bucket = (kind, key[:n])
+                if score > best.get(bucket, 0):
+                    best[bucket] = score
+    return [(bucket, _rank(doc_key, doc, score)) for bucket, score in best.items()]
+
+
+class PrefixIndex:
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.titles: list[tuple[str, int, tuple[str, int]]] = []
+        self.slugs: list[tuple[str, int, tuple[str, int]]] = []
+        # (druh, krátký prefix) → seřazené ranky dokumentů
+        self.buckets: dict[tuple[str, str], list[tuple]] = {}
+        # key dokumentu → (title, url, source, weight, title klíče, slug klíč, buckety)
+        self.docs: dict[tuple[str, int], tuple] = {}
+        self.memo: dict[tuple[str, str, int], list[dict]] = {}
+        self.generation = _MISSING
+
+    @staticmethod
+    def _entries(source: SearchSource, obj):
+        doc_key = (source.name, obj.pk)
+        title = source.title(obj) or ""
+        title_entries = [(key, score, doc_key) for key, score in _title_keys(title)]
+        slug = normalize(source.slug(obj))
+        slug_entries = [(slug, _SCORE_FULL, doc_key)] if slug else []
+        doc = (title, source.url(obj), source.source, source.rank_weight(obj))
+        buckets = _bucket_entries(doc_key, doc, title_entries, slug_entries)
+        return doc_key, (*doc, title_entries, slug_entries, buckets)
+
+    def rebuild(self, sources: list[SearchSource]) -> None:
+        generation = content.content_generation()
+        titles, slugs, docs = [], [], {}
+        buckets: dict[tuple[str, str], list[tuple]] = defaultdict(list)
+        for source in sources:
+            for obj in source.queryset().iterator(chunk_size=2000):
+                doc_key, doc = self._entries(source, obj)
+                docs[doc_key] = doc
+                titles.extend(doc[4])
+                slugs.extend(doc[5])
+                for bucket, rank in doc[6]:
+                    buckets[bucket].append(rank)
+        titles.sort()
+        slugs.sort()
+        for ranks in buckets.values():
+            ranks.sort()
+        with self.lock:
+            self.titles, self.slugs, self.docs = titles, slugs, docs
+            self.buckets = dict(buckets)
+            self.memo = {}
+            self.generation = generation
+
+    @staticmethod
+    def _discard(array: list, entry) -> None:
+        i = bisect_left(array, entry)
+        if i < len(array) and array[i] == entry:
+            del array[i]
+
+    def _remove(self, doc_key) -> None:
+        doc = self.docs.pop(doc_key, None)
+        if doc is None:
+            return
+        for array, entries in ((self.titles, doc[4]), (self.slugs, doc[5])):
+            for entry in entries:
+                self._discard(array, entry)
+        for bucket, rank in doc[6]:
+            ranks = self.buckets.get(bucket)
+            if ranks is not None:
+                self._discard(ranks, rank)
+                if not ranks:
+                    del self.buckets[bucket]
+
+    def apply(self, source: SearchSource, instance, deleted: bool, old, new) -> None:
+        with self.lock:
+            if self.generation is _MISSING:
+                return
+            self.memo = {}
+            self._remove((source.name, instance.pk))
+            if not deleted and source.include(instance):
+                doc_key, doc = self._entries(source, instance)
+                self.docs[doc_key] = doc
+                for entry in doc[4]:
+                    insort(self.titles, entry)
+                for entry in doc[5]:
+                    insort(self.slugs, entry)
+                for bucket, rank in doc[6]:
+                    insort(self.buckets.setdefault(bucket, []), rank)
+            if self.generation == old:
+                self.generation = new
+
+    def built(self) -> bool:
+        return self.generation is not _MISSING
+
+    def stale(self) -> bool:
+        return not self.built() or self.generation != content.content_generation()
+
+    def _ranked(self, kind: str, array, prefix: str) -> list[tuple]:
+        """Ranky dokumentů s klíčem začínajícím ``prefix``, seřazené (nejlepší první)."""
+        if len(prefix) <= PREFIX_BUCKET_LEN:
+            return self.buckets.get((kind, prefix), [])
+        best: dict[tuple[str, int], int] = {}
+        i = bisect_left(array, (prefix,))
+        while i < len(array):
+            key, score, doc_key = array[i]
+            if not key.startswith(prefix):
+                break
+            if score > best.get(doc_key, 0):
+                best[doc_key] = score
+            i += 1
+        docs = self.docs
+        return sorted(_rank(doc_key, docs[doc_key], score) for doc_key, score in best.items())
+
+    def top(self, q_norm: str, slug_q: str, k: int = 10) -> list[dict]:
+        """Top ``k`` suggestions ordered by match score, weight and title."""
+        if not q_norm:
+            return []
+        q_key = " ".join(q_norm.replace("-", " ").split())
+        memo_key = (q_key, slug_q, k)
+        with self.lock:
+            cached = self.memo.get(memo_key)
+            if cached is not None:
+                return [dict(r) for r in cached]
+            ranked = [self._ranked(_TITLE, self.titles, q_key)]
+            if slug_q:
+                ranked.append(self._ranked(_SLUG, self.slugs, slug_q))
+            out: list[dict] = []
+            seen: set[tuple[str, int]] = set()
+            # sloučení je seřazené, první výskyt dokumentu nese jeho nejlepší skóre
+            for rank in heapq.merge(*ranked):
+                doc_key = rank[3]
+                if doc_key in seen:
+                    continue
+                seen.add(doc_key)
+                doc = self.docs[doc_key]
+                out.append({"title": doc[0], "url": doc[1], "source": doc[2]})
+                if len(out) >= k:
+                    break
+            if len(self.memo) >= PREFIX_MEMO_SIZE:
+                self.memo.clear()
+            self.memo[memo_key] = out
+        return [dict(r) for r in out]
+
+
+_index = PrefixIndex()
+content.register_listener(_index.apply)
+
+
+def get_prefix_index() -> PrefixIndex:
+    return content.refresh_index(_index)
+
+
+__all__ = ["PREFIX_BUCKET_LEN", "PrefixIndex", "get_prefix_index"]
@@ -0,0 +1,150 @@
+"""Registry of searchable sources.
+
+Each app declares its sources in a ``search_sources`` module (discovered on
+startup like ``admin``)::
+
+    from search.registry import SearchSource, register
+
+    register(SearchSource(name="wiki.article", model=Article, ...))
+
+A source describes how to query a model (``queryset`` + ``search_fields``)
+and how to present a hit (``title``/``url``/``snippet``/``date``).  The same
+definitions feed full search, the fuzzy and prefix indexes and the change
+tracking in :mod:`search.content`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.db.models import Q
+from django.utils import timezone
+
+from .utils import tokenize
+
+# Kolik řádků na zdroj se nejvýš skóruje v Pythonu (shody z DB + nejnovější řádky).
+CANDIDATE_LIMIT = 600
+
+
+@dataclass(frozen=True)
+class SearchSource:
+    """Model searchable through :mod:`search.views`."""
+
+    name: str
+    model: type
+    type: str
+    source: str
+    queryset: Callable
+    title: Callable[[object], str]
+    url: Callable[[object], str]
+    snippet: Callable[[object], str] = lambda obj: ""
+    date: Callable[[object], datetime | None] = lambda obj: None
+    # pole pro ``icontains`` s původním dotazem; slug se porovnává se ``slugify(q)``
+    search_fields: tuple[str, ...] = ()
+    slug_field: str | None = None
+    # text skórovaný navíc k titulku (výchozí: snippet)
+    content: Callable[[object], str] | None = None
+    ordering: tuple[str, ...] = ("-pk",)
+    include: Callable[[object], bool] = lambda obj: True
+    weight: float = 1.0
+    popularity: Callable[[object], float] = lambda obj: 0.0
+    timeout: float = 1.0
+
+    def slug(self, obj) -> str:
+        if not self.slug_field:
+            return ""
+        return getattr(obj, self.slug_field, "") or ""
+
+    def rank_weight(self, obj) -> float:
+        return self.weight + self.popularity(obj)
+
+    def tokens(self, obj) -> set[str]:
+        return tokenize(self.title(obj)) | tokenize(self.slug(obj))
+
+    def text(self, obj) -> str:
+        return (self.content or self.snippet)(obj) or ""
+
+    def hit(self, obj) -> dict:
+        return {
+            "type": self.type,
+            "url": self.url(obj),
+            "title": self.title(obj),
+            "snippet": self.snippet(obj),
+            "date": self.date(obj),
+            "source": self.source,
+        }
+
+    def candidates(self, q: str, slug_q: str) -> list:
+        """Rows worth scoring: database matches padded with the newest rows.
+
+        The padding lets the accent-insensitive scoring in Python catch rows
+        that ``icontains`` misses (``zilina`` vs. ``Žilina``).
+        """
+
+        base = self.queryset().order_by(*self.ordering)
+        cond = Q()
+        for field in self.search_fields:
+            cond |= Q(**{f"{field}__icontains": q})
+        if self.slug_field and slug_q:
+            cond |= Q(**{f"{self.slug_field}__icontains": slug_q})
+        rows = list(base.filter(cond)[:CANDIDATE_LIMIT]) if cond else []
+        if len(rows) < CANDIDATE_LIMIT:
+            seen = [obj.pk for obj in rows]
+            rows += list(base.exclude(pk__in=seen)[: CANDIDATE_LIMIT - len(rows)])
+        return rows
+
+
+_registry: dict[str, SearchSource] = {}
+
+
+def register(source: SearchSource) -> SearchSource:
+    """Register (or replace) ``source`` under its ``name``."""
+    from .content import connect_source, disconnect_source
+
+    previous = _registry.get(source.name)
+    if previous is not None:
+        disconnect_source(previous)
+    _registry[source.name] = source
+    connect_source(source)
+    return source
+
+
+def unregister(name: str) -> None:
+    from .content import disconnect_source
+
+    source = _registry.pop(name, None)
+    if source is not None:
+        disconnect_source(source)
+
+
+def get_sources() -> list[SearchSource]:
+    return list(_registry.values())
+
+
+def autodiscover() -> None:
+    from django.utils.module_loading import autodiscover_modules
+
+    autodiscover_modules("search_sources")
+
+
+def recency(value: datetime | None) -> float:
+    """Popularity bonus 0..1 for recently updated rows (half after ~30 days)."""
+    if not value:
+        return 0.0
+    if isinstance(value, datetime) and timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    age_days = max((timezone.now() - value).total_seconds(), 0) / 86400
+    return 1.0 / (1.0 + age_days / 30)
+
+
+__all__ = [
+    "CANDIDATE_LIMIT",
+    "SearchSource",
+    "register",
+    "unregister",
+    "get_sources",
+    "autodiscover",
+    "recency",
+]
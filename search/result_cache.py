@@ -0,0 +1,86 @@
+"""Cache of full search result lists keyed by the query as searched.
+
+The key is the query with surrounding whitespace stripped – nothing more:
+sources run ``icontains`` and ``slugify`` on the raw query, so case or
+diacritics variants (``Škoda`` / ``skoda``) can return different rows.
+
+Entries are keyed by the content generation from :mod:`search.content`, so
+any save or delete of an indexed model makes every cached result list
+unreachable at once.  Hit/miss counters live in the shared cache, so they
+cover all workers.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Callable
+
+from django.conf import settings
+from django.core.cache import cache
+
+from . import content
+
+STATS_HITS_KEY = "search:results:hits"
+STATS_MISSES_KEY = "search:results:misses"
+
+
+def _enabled() -> bool:
+    return bool(getattr(settings, "SEARCH_RESULT_CACHE_ENABLED", True))
+
+
+def _timeout() -> int:
+    return int(getattr(settings, "SEARCH_RESULT_CACHE_TIMEOUT", 300))
+
+
+def query_key(q: str) -> str:
+    """Form under which queries returning the same rows share one entry."""
+    return (q or "").strip()
+
+
+def _cache_key(q: str) -> str:
+    digest = hashlib.sha256(query_key(q).encode()).hexdigest()[:32]
+    return f"search:results:{content.content_generation() or 0}:{digest}"
+
+
+def _count(key: str) -> None:
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, None)
+        cache.incr(key)
+
+
+def cached_results(q: str, compute: Callable[[], tuple[list[dict], bool]]) -> list[dict]:
+    """Cached result list for ``q``; ``compute`` returns ``(results, cacheable)``."""
+    if not _enabled():
+        return compute()[0]
+    key = _cache_key(q)
+    results = cache.get(key)
+    if results is not None:
+        _count(STATS_HITS_KEY)
+        return results
+    _count(STATS_MISSES_KEY)
+    results, cacheable = compute()
+    if cacheable:
+        cache.set(key, results, _timeout())
+    return results
+
+
+def stats() -> dict:
+    values = cache.get_many([STATS_HITS_KEY, STATS_MISSES_KEY])
+    hits = values.get(STATS_HITS_KEY, 0)
+    misses = values.get(STATS_MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / total, 4) if total else 0.0,
+        "generation": content.content_generation(),
+    }
+
+
+def reset_stats() -> None:
+    cache.delete_many([STATS_HITS_KEY, STATS_MISSES_KEY])
+
+
+__all__ = ["query_key", "cached_results", "stats", "reset_stats"]
@@ -0,0 +1,132 @@
+"""Run registered search sources concurrently within a time budget.
+
+Each source gets its own timeout (``SearchSource.timeout``) on top of the
+request-wide ``SEARCH_TIME_BUDGET``.  A source that exceeds it or fails is
+skipped and the rest is returned as a partial result.  Inside an open
+transaction (``ATOMIC_REQUESTS``, tests) sources run inline in the caller's
+thread.  Other threads use their own connections and would not see
+uncommitted rows.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.db import connection, connections
+
+from .registry import SearchSource
+from .utils import normalize
+
+logger = logging.getLogger(__name__)
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _budget() -> float:
+    return float(getattr(settings, "SEARCH_TIME_BUDGET", 2.0))
+
+
+def _pool_size() -> int:
+    return int(getattr(settings, "SEARCH_POOL_SIZE", 4))
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_pool_size(), thread_name_prefix="search")
+        return _executor
+
+
+def score_match(q_norm: str, slug_q: str, title: str, slug: str | None, content: str | None) -> int:
+    title_norm = normalize(title)
+    slug_norm = normalize(slug or "")
+    content_norm = normalize(content or "")
+    score = 0
+    if q_norm and (title_norm.startswith(q_norm) or slug_norm.startswith(slug_q)):
+        score += 100
+    if q_norm and q_norm in title_norm:
+        score += 40
+    if q_norm and q_norm in content_norm:
+        score += 15
+    return score
+
+
+@dataclass
+class SourceResults:
+    hits: list[dict] = field(default_factory=list)
+    timed_out: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+
+    @property
+    def partial(self) -> bool:
+        return bool(self.timed_out or self.failed)
+
+
+def search_source(source: SearchSource, q: str, q_norm: str, slug_q: str) -> list[dict]:
+    """Scored hits (with ``score``) of one source."""
+    hits = []
+    for obj in source.candidates(q, slug_q):
+        score = score_match(q_norm, slug_q, source.title(obj), source.slug(obj), source.text(obj))
+        if score:
+            hit = source.hit(obj)
+            hit["score"] = score * source.weight
+            hits.append(hit)
+    return hits
+
+
+def _pooled(source: SearchSource, q: str, q_norm: str, slug_q: str) -> list[dict]:
+    try:
+        return search_source(source, q, q_norm, slug_q)
+    finally:
+        # vlákna poolu si drží vlastní spojení – po úloze je zavřít
+        connections.close_all()
+
+
+def run_sources(
+    sources: list[SearchSource], q: str, q_norm: str, slug_q: str, budget: float | None = None
+) -> SourceResults:
+    out = SourceResults()
+    start = time.monotonic()
+    deadline = start + (_budget() if budget is None else budget)
+
+    if connection.in_atomic_block or _pool_size() <= 1:
+        for source in sources:
+            if time.monotonic() >= deadline:
+                out.timed_out.append(source.name)
+                continue
+            began = time.monotonic()
+            try:
+                out.hits += search_source(source, q, q_norm, slug_q)
+            except Exception:
+                logger.exception("search source %s failed", source.name)
+                out.failed.append(source.name)
+                continue
+            if time.monotonic() - began > source.timeout:
+                logger.warning("search source %s exceeded its timeout", source.name)
+        return out
+
+    executor = _get_executor()
+    futures = [(source, executor.submit(_pooled, source, q, q_norm, slug_q)) for source in sources]
+    for source, future in futures:
+        wait_until = min(deadline, start + source.timeout)
+        try:
+            out.hits += future.result(timeout=max(wait_until - time.monotonic(), 0))
+        except FutureTimeout:
+            future.cancel()
+            logger.warning("search source %s timed out", source.name)
+            out.timed_out.append(source.name)
+        except Exception:
+            logger.exception("search source %s failed", source.name)
+            out.failed.append(source.name)
+    return out
+
+
+__all__ = ["SourceResults", "score_match", "search_source", "run_sources"]
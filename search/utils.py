@@ -1,6 +1,6 @@
 import unicodedata
 
-__all__ = ["normalize", "levenshtein_max1", "fuzzy1_token_match"]
+__all__ = ["normalize", "tokenize", "levenshtein", "levenshtein_max1", "fuzzy1_token_match"]
 
 
 def normalize(s: str) -> str:
@@ -11,6 +11,30 @@ def normalize(s: str) -> str:
     return s.casefold()
 
 
+def tokenize(text: str) -> set[str]:
+    """Split ``text`` on whitespace and hyphens into normalized tokens."""
+
+    return {normalize(t) for t in (text or "").replace("-", " ").split() if t}
+
+
+def levenshtein(a: str, b: str) -> int:
+    """Return the edit distance between ``a`` and ``b``."""
+
+    if a == b:
+        return 0
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return len(a)
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb)))
+        prev = cur
+    return prev[-1]
+
+
 def levenshtein_max1(a: str, b: str) -> bool:
     """Return True if edit distance between ``a`` and ``b`` is at most 1."""
 
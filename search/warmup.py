@@ -0,0 +1,22 @@
+"""Build the in-process search indexes before the first request."""
+
+from __future__ import annotations
+
+import logging
+
+from django.db import DatabaseError
+
+logger = logging.getLogger(__name__)
+
+
+def warm_indexes() -> None:
+    """Warm the fuzzy and prefix indexes; a missing/unmigrated DB is not fatal."""
+
+    from .fuzzy import get_index
+    from .prefix import get_prefix_index
+
+    try:
+        get_index()
+        get_prefix_index()
+    except DatabaseError:
+        logger.warning("search indexes not warmed (database unavailable)", exc_info=True)
@@ -6,7 +6,7 @@ from django.shortcuts import redirect, render
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST
 
-from msa.utils.dates import _parse_date, _woorld_to_gregorian
+from msa.utils.dates import _parse_date, _woorld_to_gregorian, reset_active_date
 
 
 def home(request):
@@ -41,6 +41,7 @@ def set_global_date(request):
     request.session["topbar_date"] = iso
     request.session["global_date"] = iso
     request.session.modified = True
+    reset_active_date(request)
 
     # Odpověď + cookie
     resp = JsonResponse({"ok": True, "iso": iso})
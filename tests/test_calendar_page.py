@@ -13,3 +13,95 @@ def test_calendar_page_includes_script(client):
     html = resp.content.decode()
     assert "msa/js/calendar.js" in html  # script je na stránce
     assert 'id="month-filter"' in html  # select existuje
+
+
+def _seed_season(count=3):
+    from msa.models import Match, Phase, Player, Tournament
+
+    cs, season, cat = make_category_season()
+    tournaments = []
+    for i in range(count):
+        t = Tournament.objects.create(
+            season=season,
+            category=cat,
+            category_season=cs,
+            name=f"T{i}",
+            slug=f"t{i}",
+            start_date=f"2025-0{i + 1}-01",
+            end_date=f"2025-0{i + 1}-05",
+        )
+        tournaments.append(t)
+    winner = Player.objects.create(name="Champ")
+    Match.objects.create(
+        tournament=tournaments[0],
+        phase=Phase.MD,
+        round_name="R2",
+        slot_top=1,
+        slot_bottom=2,
+        player_top=winner,
+        winner=winner,
+    )
+    return season, tournaments
+
+
+def test_calendar_query_count_is_fixed_and_cached(client):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    season, _ = _seed_season(2)
+    url = reverse("msa:calendar")
+    with CaptureQueriesContext(connection) as small:
+        resp = client.get(url, {"season": season.id})
+    assert "Vítěz: Champ" in resp.content.decode()
+
+    from msa.models import Tournament
+
+    base = Tournament.objects.get(name="T0")
+    for i in range(2, 6):
+        Tournament.objects.create(
+            season=season,
+            category=base.category,
+            category_season=base.category_season,
+            name=f"T{i}",
+            slug=f"t{i}",
+            start_date=f"2025-0{i + 1}-01",
+            end_date=f"2025-0{i + 1}-05",
+        )
+    # nové turnaje změní otisk sezóny → přestavba se stejným počtem dotazů
+    with CaptureQueriesContext(connection) as big:
+        client.get(url, {"season": season.id})
+    assert len(big.captured_queries) == len(small.captured_queries)
+
+    with CaptureQueriesContext(connection) as cached:
+        resp = client.get(url, {"season": season.id})
+    assert len(cached.captured_queries) < len(big.captured_queries)
+    assert len(resp.context["cards"]) == 6
+
+
+def test_calendar_cache_invalidated_by_tournament_change(client):
+    season, tournaments = _seed_season(2)
+    url = reverse("msa:calendar")
+    client.get(url, {"season": season.id})
+
+    t = tournaments[1]
+    t.name = "Renamed"
+    t.save()
+    html = client.get(url, {"season": season.id}).content.decode()
+    assert "Renamed" in html
+
+
+def test_calendar_cache_invalidated_by_season_and_category_change(client):
+    season, tournaments = _seed_season(2)
+    url = reverse("msa:calendar")
+    first = client.get(url, {"season": season.id})
+    months = len(first.context["month_sequence"])
+
+    category = tournaments[0].category
+    category.name = "Přejmenovaná"
+    category.save()
+    season.end_date = "2025-06-01"
+    season.save()
+
+    resp = client.get(url, {"season": season.id})
+    assert resp.context["cards"][0]["category_label"] == "Přejmenovaná"
+    assert len(resp.context["month_sequence"]) < months
@@ -1,8 +1,12 @@
 import pytest
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 
 from msa.models import Match, Schedule, Tournament
 from msa.services.calendar_sync import build_ics_for_days, escape_ics
+from tests.factories import make_category_season
 
 
 @pytest.mark.django_db
@@ -33,3 +37,45 @@ def test_build_ics_returns_empty_when_disabled():
 def test_escape_ics_escapes_commas_semicolons_and_newlines():
     text = "a,b;c\nnext"
     assert escape_ics(text) == "a\\,b\\;c\\nnext"
+
+
+@pytest.mark.django_db
+@override_settings(MSA_CALENDAR_SYNC_ENABLED=True)
+def test_build_ics_for_days_uses_one_query_for_all_days(django_assert_num_queries):
+    t = Tournament.objects.create(name="TT3", slug="tt3")
+    days = [f"2025-08-0{i}" for i in range(1, 6)]
+    for i, day in enumerate(days):
+        for order in (1, 2):
+            m = Match.objects.create(
+                tournament=t, round_name="R1", slot_top=4 * i + order, slot_bottom=4 * i + 3
+            )
+            Schedule.objects.create(tournament=t, play_date=day, order=order, match=m)
+
+    with django_assert_num_queries(1):
+        ics = build_ics_for_days(t, days)
+    assert ics.count("BEGIN:VEVENT") == 5
+    assert "1. R1 [1 vs 3]\\n2. R1 [2 vs 3]" in ics
+
+
+@pytest.mark.django_db
+def test_season_ics_export_query_count_does_not_grow_with_tournaments(client):
+    cs, season, category = make_category_season()
+    url = reverse("msa:export_calendar_ics")
+
+    def _export(count):
+        for i in range(Tournament.objects.filter(season=season).count(), count):
+            Tournament.objects.create(
+                season=season,
+                category=category,
+                category_season=cs,
+                name=f"T{i}",
+                slug=f"t{i}",
+                start_date=f"2025-0{i + 1}-01",
+                end_date=f"2025-0{i + 1}-05",
+            )
+        with CaptureQueriesContext(connection) as ctx:
+            body = b"".join(client.get(url, {"season": season.id}).streaming_content)
+        assert body.count(b"BEGIN:VEVENT") == count
+        return len(ctx.captured_queries)
+
+    assert _export(2) == _export(8)
@@ -0,0 +1,53 @@
+import json
+
+import pytest
+from django.test import RequestFactory
+from django.urls import reverse
+
+from fax_calendar import core
+from fax_calendar.context_processors import woorld_calendar_meta
+from fax_calendar.meta import bundle_range, meta_bundle
+
+
+def test_bundle_range_is_aligned_block():
+    assert bundle_range(1) == (1, 10)
+    assert bundle_range(2024) == (2021, 2030)
+    assert bundle_range(2030) == (2021, 2030)
+
+
+def test_context_processor_embeds_only_url_and_hash():
+    request = RequestFactory().get("/")
+    request.session = {"woorld_current_date": "15-03-2024"}
+    ctx = woorld_calendar_meta(request)
+
+    _, digest = meta_bundle(2021, 2030)
+    assert ctx["WOORLD_CALENDAR_META_HASH"] == digest
+    assert ctx["WOORLD_CALENDAR_META_URL"].endswith(f"/woorld/meta/2021-2030.json?v={digest}")
+    assert "WOORLD_CALENDAR_MONTH_LENGTHS_JSON" not in ctx
+
+
+@pytest.mark.django_db
+def test_bundle_endpoint_serves_immutable_payload_and_304(client):
+    body, digest = meta_bundle(2021, 2030)
+    url = reverse("fax_calendar:meta_bundle", kwargs={"start": 2021, "end": 2030})
+
+    r = client.get(url, {"v": digest})
+    assert r.status_code == 200
+    assert r["ETag"] == f'"{digest}"'
+    assert "immutable" in r["Cache-Control"]
+    data = json.loads(r.content)
+    assert data["years"]["2024"]["month_lengths"] == core.month_lengths(2024)
+    assert r.content == body
+
+    stale = client.get(url, {"v": "old"})
+    assert "immutable" not in stale["Cache-Control"]
+
+    r304 = client.get(url, HTTP_IF_NONE_MATCH=f'"{digest}"')
+    assert r304.status_code == 304
+    assert r304.content == b""
+
+
+@pytest.mark.django_db
+def test_bundle_endpoint_rejects_bad_range(client):
+    assert client.get("/woorld/meta/10-5.json").status_code == 400
+    assert client.get("/woorld/meta/1-5000.json").status_code == 400
@@ -0,0 +1,72 @@
+import pytest
+
+from fax_calendar import core
+from fax_calendar.model_fields import backfill_ordinals
+from msa.models import Match, Phase, Schedule, Season, Tournament
+from msa.services.planning import swap_matches
+
+
+def test_ordinal_key_orders_like_iso_strings():
+    dates = [(2024, 15, 28), (2025, 1, 1), (2025, 1, 29), (2025, 2, 1), (2025, 15, 29)]
+    keys = [core.ordinal_key(*d) for d in dates]
+    assert keys == sorted(keys)
+    assert core.ordinal_key(2025, 2, 1) == 2025 * 1000 + core.to_ordinal(2025, 2, 1)
+
+
+@pytest.mark.django_db
+def test_save_fills_ordinals_and_range_lookups_use_them():
+    s = Season.objects.create(name="2025/01", start_date="2025-01-01", end_date="2025-15-20")
+    assert s.start_ordinal == core.ordinal_key(2025, 1, 1)
+    early = Tournament.objects.create(season=s, name="A", slug="a", start_date="2025-02-03")
+    late = Tournament.objects.create(season=s, name="B", slug="b", start_date="2025-11-03")
+
+    qs = Tournament.objects.filter(start_date__gte="2025-05-01")
+    sql = str(qs.query)
+    assert "start_ordinal" in sql and '"start_date" >=' not in sql
+    assert list(qs) == [late]
+    assert list(Tournament.objects.filter(start_date__range=("2025-01-01", "2025-03-01"))) == [
+        early
+    ]
+    assert list(Tournament.objects.order_by("start_ordinal")) == [early, late]
+
+    Schedule.objects.create(tournament=early, play_date="2025-02-04", order=1)
+    joined = Tournament.objects.filter(schedule__play_date__lt="2025-03-01")
+    assert "play_ordinal" in str(joined.query)
+    assert list(joined) == [early]
+
+
+@pytest.mark.django_db
+def test_backfill_repairs_ordinals_after_bulk_update():
+    s = Season.objects.create(name="2026/01", start_date="2026-01-01", end_date="2026-15-20")
+    Season.objects.filter(pk=s.pk).update(start_date="2026-03-01", start_ordinal=None)
+
+    assert backfill_ordinals(Season, "start_date", "end_date") == 1
+    s.refresh_from_db()
+    assert s.start_ordinal == core.ordinal_key(2026, 3, 1)
+    assert backfill_ordinals(Season, "start_date", "end_date") == 0
+
+
+@pytest.mark.django_db
+def test_partial_saves_keep_ordinals_in_sync():
+    s = Season.objects.create(name="2025/02", start_date="2025-01-01", end_date="2025-15-20")
+    t = Tournament.objects.create(season=s, name="T", slug="t", start_date="2025-02-03")
+    m1, m2 = (
+        Match.objects.create(
+            tournament=t, phase=Phase.MD, round_name="R4", slot_top=i, slot_bottom=5 - i
+        )
+        for i in (1, 2)
+    )
+    Schedule.objects.create(tournament=t, match=m1, play_date="2025-08-01", order=1)
+    Schedule.objects.create(tournament=t, match=m2, play_date="2025-08-05", order=1)
+
+    swap_matches(t, m1.id, m2.id)
+
+    moved = Schedule.objects.get(match=m1)
+    assert moved.play_date == "2025-08-05"
+    assert moved.play_ordinal == core.ordinal_key(2025, 8, 5)
+    assert [x.match_id for x in Schedule.objects.filter(play_date__gte="2025-08-03")] == [m1.id]
+
+    t.end_date = "2025-02-20"
+    t.save(update_fields=["end_date"])
+    t.refresh_from_db()
+    assert t.end_ordinal == core.ordinal_key(2025, 2, 20)
@@ -0,0 +1,50 @@
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.core.management import call_command
+
+from fax_calendar import core
+from fax_calendar.model_fields import WoorldDateField
+from fax_calendar.values import WoorldDate, is_canonical
+
+
+def test_woorld_date_is_immutable_interned_and_cached():
+    a = WoorldDate.from_iso("2025-03-07")
+    assert a is WoorldDate.from_iso("2025-03-07")
+    assert (a.year, a.month, a.day) == (2025, 3, 7)
+    assert a.ordinal == core.ordinal_key(2025, 3, 7)
+    assert a.weekday == core.weekday(2025, 3, 7)
+    assert a < WoorldDate.from_iso("2025-15-01")
+    assert pickle.loads(pickle.dumps(a)) is a
+    with pytest.raises(AttributeError):
+        a.year = 2026
+    with pytest.raises(ValueError):
+        WoorldDate(2025, 2, 29)
+
+
+def test_from_db_value_fast_path_matches_legacy_normalization():
+    field = WoorldDateField(null=True)
+    assert is_canonical("2025-03-07") and not is_canonical("07-03-2025")
+    first = field.from_db_value("".join(["2025-", "03-07"]), None, None)
+    again = field.from_db_value("".join(["2025-", "03-07"]), None, None)
+    assert first == field._normalize("2025-03-07")
+    assert first is again
+    # nekanonické staré hodnoty jdou dál přes plný parser
+    assert field.from_db_value("07-03-2025", None, None) == "2025-03-07"
+    assert field.from_db_value(None, None, None) == ""
+
+
+def test_hydration_benchmark_command_runs(capsys):
+    call_command("woorld_hydration_bench", rows=500)
+    assert "rows=500" in capsys.readouterr().out
+
+
+def test_year_starts_grow_safely_from_many_threads(monkeypatch):
+    monkeypatch.setattr(core, "_YEAR_STARTS", [0, 0])
+    expected = sum(core.year_length(y) for y in range(1, 2000))
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(core.days_before_year, [2000, 1500, 2000, 700] * 8))
+    assert set(results[0::4]) == {expected}
+    assert core._YEAR_STARTS[2000] == expected
+    assert len(core._YEAR_STARTS) == 2001
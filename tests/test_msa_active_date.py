@@ -0,0 +1,76 @@
+from datetime import date
+
+import pytest
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from msa.models import Season
+from msa.utils.dates import (
+    find_season_for_date,
+    get_active_date,
+    get_active_season,
+    reset_active_date,
+)
+from tests.woorld_helpers import woorld_date
+
+
+def _season_queries(ctx):
+    return [q for q in ctx.captured_queries if 'FROM "msa_season"' in q["sql"]]
+
+
+def test_active_date_is_memoized_on_request():
+    request = RequestFactory().get("/", {"d": "2024-05-01"})
+    request.session = {}
+    assert get_active_date(request) == date(2024, 5, 1)
+
+    request.GET = request.GET.copy()
+    request.GET["d"] = "2024-06-01"
+    assert get_active_date(request) == date(2024, 5, 1)
+
+    reset_active_date(request)
+    assert get_active_date(request) == date(2024, 6, 1)
+
+
+@pytest.mark.django_db
+def test_season_index_refreshes_after_season_change():
+    s = Season.objects.create(name="2024", start_date="2024-01-01", end_date="2024-06-20")
+    found = find_season_for_date(date(2024, 3, 1))
+    assert found.pk == s.pk
+
+    # vrácená instance je kopie – úprava se nepropíše do indexu
+    found.name = "changed"
+    assert find_season_for_date(date(2024, 3, 1)).name == "2024"
+
+    with CaptureQueriesContext(connection) as ctx:
+        assert find_season_for_date(date(2024, 4, 1)).pk == s.pk
+    assert _season_queries(ctx) == []
+
+    s.end_date = "2024-03-15"
+    s.save()
+    assert find_season_for_date(date(2024, 4, 1)) is None
+
+    s.delete()
+    assert find_season_for_date(date(2024, 3, 1)) is None
+
+
+@pytest.mark.django_db
+def test_active_season_resolved_once_per_request(client):
+    Season.objects.create(name="2024", start_date="2024-01-01", end_date=woorld_date(2024, 12))
+    from msa.utils.dates import invalidate_season_index
+
+    invalidate_season_index()
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(reverse("msa:calendar"), {"d": "2024-05-01"})
+    assert response.status_code == 200
+    assert response.context["active_date_iso"] == "2024-05-01"
+    # jediný dotaz na sezóny = přestavba indexu
+    assert len(_season_queries(ctx)) == 1
+
+    request = RequestFactory().get("/", {"d": "2024-05-01"})
+    request.session = {}
+    with CaptureQueriesContext(connection) as ctx:
+        assert get_active_season(request).name == "2024"
+        assert get_active_season(request) is get_active_season(request)
+    assert _season_queries(ctx) == []
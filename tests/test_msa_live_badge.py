@@ -0,0 +1,134 @@
+import importlib
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from msa.models import (
+    Match,
+    MatchState,
+    Phase,
+    Player,
+    Season,
+    Tournament,
+    TournamentLiveState,
+)
+from msa.services.live_state import live_flags
+from msa.services.results import set_result
+from tests.woorld_helpers import woorld_date
+
+PARTIAL = {"sets": [[11, 5], {"a": 3, "b": None}]}
+
+
+def _tournament():
+    s = Season.objects.create(name="2025", start_date="2025-01-01", end_date=woorld_date(2025, 12))
+    return Tournament.objects.create(season=s, name="T", slug="t")
+
+
+def _match(t, slot, score=None):
+    p1 = Player.objects.create(name=f"A{slot}")
+    p2 = Player.objects.create(name=f"B{slot}")
+    return Match.objects.create(
+        tournament=t,
+        phase=Phase.MD,
+        round_name="R8",
+        slot_top=slot,
+        slot_bottom=9 - slot,
+        player_top=p1,
+        player_bottom=p2,
+        best_of=3,
+        state=MatchState.SCHEDULED,
+        score=score or {},
+    )
+
+
+@pytest.mark.django_db
+@override_settings(MSA_BADGE_INCLUDE_PARTIALS=True)
+def test_badge_reads_counters_and_set_result_decrements(client):
+    t = _tournament()
+    m1 = _match(t, 1, PARTIAL)
+    _match(t, 2, PARTIAL)
+    _match(t, 3)
+
+    call_command("msa_live_reconcile")
+    state = TournamentLiveState.objects.get(tournament=t)
+    assert (state.live_count, state.partial_count) == (0, 2)
+
+    with CaptureQueriesContext(connection) as ctx:
+        body = client.get(reverse("nav_live_badge")).content.decode()
+    assert "● 2" in body
+    assert len(ctx.captured_queries) == 1
+
+    set_result(m1.id, mode="WIN_ONLY", winner="top")
+    state.refresh_from_db()
+    assert state.partial_count == 1
+    assert "● 1" in client.get(reverse("nav_live_badge")).content.decode()
+
+
+@pytest.mark.django_db
+def test_partials_hidden_without_setting_and_reconcile_fixes_drift(client):
+    t = _tournament()
+    _match(t, 1, PARTIAL)
+    Match.objects.filter(tournament=t).update(state="LIVE")
+    TournamentLiveState.objects.filter(tournament=t).update(live_count=7, partial_count=3)
+
+    call_command("msa_live_reconcile", tournaments=[t.id])
+    state = TournamentLiveState.objects.get(tournament=t)
+    assert (state.live_count, state.partial_count) == (1, 0)
+    assert "● 1" in client.get(reverse("nav_live_badge")).content.decode()
+
+    Match.objects.filter(tournament=t).update(state=MatchState.SCHEDULED)
+    call_command("msa_live_reconcile")
+    body = client.get(reverse("nav_live_badge")).content.decode()
+    assert "hidden" in body
+
+
+@pytest.mark.django_db
+def test_counters_follow_plain_saves_and_bulk_deletes():
+    t = _tournament()
+    m1 = _match(t, 1)
+    _match(t, 2, PARTIAL)
+
+    def counts():
+        state = TournamentLiveState.objects.get(tournament=t)
+        return state.live_count, state.partial_count
+
+    assert counts() == (0, 1)
+    # úprava existujícího zápasu mimo služby (admin)
+    m1 = Match.objects.get(pk=m1.pk)
+    m1.state = "LIVE"
+    m1.save()
+    assert counts() == (1, 1)
+    deferred = Match.objects.only("id", "state").get(pk=m1.pk)
+    deferred.state = MatchState.DONE
+    deferred.save(update_fields=["state"])
+    assert counts() == (0, 1)
+
+    Match.objects.filter(tournament=t).delete()
+    assert counts() == (0, 0)
+
+    _match(t, 3, PARTIAL)
+    t.delete()
+    assert not TournamentLiveState.objects.exists()
+
+
+@pytest.mark.parametrize(
+    "state,score",
+    [
+        ("LIVE", None),
+        ("DONE", {"sets": [[11, 5]]}),
+        ("SCHEDULED", {"sets": [[11, 5], [3, None]]}),
+        ("SCHEDULED", {"sets": []}),
+        ("PENDING", {"sets": [{"a": 11, "b": 9, "status": "in_progress"}]}),
+        ("WALKOVER", {"sets": [{"a": "-", "b": 2}]}),
+        ("SCHEDULED", {"meta": {"status": "LIVE"}}),
+        ("SCHEDULED", {"sets": 5}),
+    ],
+)
+def test_migration_backfill_matches_live_flags(state, score):
+    migration = importlib.import_module("msa.migrations.0016_tournamentlivestate")
+    match = Match(state=state, score=score)
+    assert migration._flags(state, score) == live_flags(match)
@@ -0,0 +1,134 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from msa.models import (
+    Category,
+    CategorySeason,
+    Match,
+    MatchChange,
+    Phase,
+    Player,
+    Season,
+    Tournament,
+    TournamentState,
+)
+from msa.services.planning import insert_match, swap_matches
+from msa.services.results import set_result
+from tests.woorld_helpers import woorld_date
+
+DAY = "2025-08-01"
+
+
+def _setup():
+    s = Season.objects.create(name="2025", start_date="2025-01-01", end_date=woorld_date(2025, 12))
+    c = Category.objects.create(name="WT")
+    cs = CategorySeason.objects.create(category=c, season=s, draw_size=16, md_seeds_count=4)
+    t = Tournament.objects.create(
+        season=s, category=c, category_season=cs, name="T", slug="t", state=TournamentState.MD
+    )
+    p1, p2, p3, p4 = [Player.objects.create(name=f"P{i}") for i in range(1, 5)]
+    m1 = Match.objects.create(
+        tournament=t,
+        phase=Phase.MD,
+        round_name="R4",
+        slot_top=1,
+        slot_bottom=4,
+        player_top=p1,
+        player_bottom=p2,
+        best_of=3,
+    )
+    m2 = Match.objects.create(
+        tournament=t,
+        phase=Phase.MD,
+        round_name="R4",
+        slot_top=2,
+        slot_bottom=3,
+        player_top=p3,
+        player_bottom=p4,
+        best_of=3,
+    )
+    final = Match.objects.create(
+        tournament=t, phase=Phase.MD, round_name="R2", slot_top=1, slot_bottom=2, best_of=3
+    )
+    return t, m1, m2, final
+
+
+@pytest.mark.django_db
+def test_set_result_and_planning_append_changes(client):
+    t, m1, m2, final = _setup()
+
+    insert_match(t, m1.id, DAY, 1)
+    insert_match(t, m2.id, DAY, 2)
+    set_result(m1.id, mode="SETS", sets=[(11, 5), (11, 7)])
+
+    url = reverse("msa-tournament-changes-api", args=[t.id])
+    payload = client.get(url).json()
+    kinds = [(c["match_id"], c["kind"]) for c in payload["changes"]]
+    assert (m1.id, "SCHEDULE") in kinds
+    assert (m2.id, "SCHEDULE") in kinds
+    assert (m1.id, "SCORE") in kinds
+    # vítěz se propsal do finále → STATE změna finále
+    assert (final.id, "STATE") in kinds
+    score = next(c for c in payload["changes"] if c["kind"] == "SCORE")
+    assert score["data"]["state"] == "DONE"
+    assert score["data"]["winner_id"] == m1.player_top_id
+
+    cursor = payload["cursor"]
+    assert client.get(url, {"cursor": cursor}).json()["changes"] == []
+
+    swap_matches(t, m1.id, m2.id)
+    delta = client.get(url, {"cursor": cursor}).json()
+    assert {c["match_id"] for c in delta["changes"]} == {m1.id, m2.id}
+    assert {c["data"]["order"] for c in delta["changes"]} == {1, 2}
+    assert delta["cursor"] > cursor
+
+
+@pytest.mark.django_db
+def test_changes_api_is_single_query(client):
+    t, m1, _, _ = _setup()
+    set_result(m1.id, mode="WIN_ONLY", winner="top")
+    url = reverse("msa-tournament-changes-api", args=[t.id])
+    with CaptureQueriesContext(connection) as ctx:
+        assert client.get(url).status_code == 200
+    assert len(ctx.captured_queries) == 1
+
+
+@pytest.mark.django_db
+@override_settings(MSA_LIVE_STREAM_SECONDS=0)
+def test_sse_stream_resumes_from_last_event_id(client):
+    t, m1, m2, _ = _setup()
+    set_result(m1.id, mode="WIN_ONLY", winner="top")
+    first_id = MatchChange.objects.filter(tournament=t).order_by("id").first().id
+    set_result(m2.id, mode="WIN_ONLY", winner="bottom")
+
+    url = reverse("msa-tournament-changes-stream", args=[t.id])
+    response = client.get(url, HTTP_LAST_EVENT_ID=str(first_id))
+    assert response["Content-Type"].startswith("text/event-stream")
+    body = b"".join(response.streaming_content).decode()
+    assert body.startswith("retry:")
+    assert f"id: {first_id}\n" not in body
+    assert "event: match" in body
+    assert f'"match_id":{m2.id}' in body
+
+
+@pytest.mark.django_db
+@override_settings(MSA_LIVE_FEED_RETENTION_DAYS=7)
+def test_prune_drops_changes_past_retention(client):
+    t, m1, m2, _ = _setup()
+    set_result(m1.id, mode="WIN_ONLY", winner="top")
+    set_result(m2.id, mode="WIN_ONLY", winner="bottom")
+    old = MatchChange.objects.filter(tournament=t).order_by("id").first()
+    MatchChange.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(days=8))
+
+    call_command("msa_live_feed_prune")
+
+    assert not MatchChange.objects.filter(pk=old.pk).exists()
+    url = reverse("msa-tournament-changes-api", args=[t.id])
+    assert client.get(url, {"cursor": 0}).json()["count"] == MatchChange.objects.count() > 0
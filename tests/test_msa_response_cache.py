@@ -0,0 +1,157 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from msa.models import (
+    Category,
+    CategorySeason,
+    EntryType,
+    Match,
+    Phase,
+    Player,
+    Season,
+    Tournament,
+    TournamentEntry,
+)
+from msa.services.results import set_result
+from tests.woorld_helpers import woorld_date
+
+
+def _setup():
+    s = Season.objects.create(name="2025", start_date="2025-01-01", end_date=woorld_date(2025, 12))
+    c = Category.objects.create(name="WT")
+    cs = CategorySeason.objects.create(category=c, season=s, draw_size=16)
+    t = Tournament.objects.create(
+        season=s, category=c, category_season=cs, name="Open", slug="open", draw_size=16
+    )
+    p1, p2 = Player.objects.create(name="Alpha"), Player.objects.create(name="Beta")
+    for pos, p in enumerate((p1, p2), start=1):
+        TournamentEntry.objects.create(
+            tournament=t, player=p, entry_type=EntryType.DA, position=pos, wr_snapshot=pos
+        )
+    m = Match.objects.create(
+        tournament=t,
+        phase=Phase.MD,
+        round_name="R16",
+        slot_top=1,
+        slot_bottom=16,
+        player_top=p1,
+        player_bottom=p2,
+        best_of=3,
+    )
+    return s, t, p1, m
+
+
+@pytest.mark.django_db
+def test_tournament_api_is_served_from_cache_until_purged(client):
+    _, t, _, m = _setup()
+    url = reverse("msa-tournament-matches-api", args=[t.id])
+    first = client.get(url).content
+
+    with CaptureQueriesContext(connection) as ctx:
+        assert client.get(url).content == first
+    # jen validátor ETag (verze turnaje), tělo jde z cache
+    assert len(ctx.captured_queries) == 1
+
+    set_result(m.id, mode="WIN_ONLY", winner="top")
+    assert client.get(url).content != first
+
+
+@pytest.mark.django_db
+def test_player_and_season_tags_purge_dependent_responses(client):
+    s, t, p1, _ = _setup()
+    entries_url = reverse("msa-tournament-entries-api", args=[t.id])
+    list_url = reverse("msa-tournaments-api")
+
+    assert "Alpha" in client.get(entries_url).content.decode()
+    assert client.get(list_url, {"season": s.id}).json()["tournaments"][0]["name"] == "Open"
+
+    p1.name = p1.full_name = "Alpha Renamed"
+    p1.save()
+    assert "Alpha Renamed" in client.get(entries_url).content.decode()
+
+    Tournament.objects.create(season=s, name="Second", slug="second")
+    names = {row["name"] for row in client.get(list_url, {"season": s.id}).json()["tournaments"]}
+    assert names == {"Open", "Second"}
+
+
+@pytest.mark.django_db
+def test_admin_mode_requests_bypass_cache(client):
+    _, t, _, _ = _setup()
+    url = reverse("msa-tournament-matches-api", args=[t.id])
+    client.get(url)
+    session = client.session
+    session["admin_mode"] = True
+    session.save()
+    with CaptureQueriesContext(connection) as ctx:
+        client.get(url)
+    assert len(ctx.captured_queries) > 0
+
+
+@pytest.mark.django_db
+def test_list_and_tournament_apis_answer_conditional_gets(client):
+    s, t, _, m = _setup()
+    list_url = reverse("msa-tournaments-api")
+    first = client.get(list_url, {"season": s.id})
+    etag, last_modified = first["ETag"], first["Last-Modified"]
+
+    with CaptureQueriesContext(connection) as ctx:
+        not_modified = client.get(list_url, {"season": s.id}, HTTP_IF_NONE_MATCH=etag)
+    assert not_modified.status_code == 304
+    assert len(ctx.captured_queries) == 1
+    assert (
+        client.get(list_url, {"season": s.id}, HTTP_IF_MODIFIED_SINCE=last_modified).status_code
+        == 304
+    )
+
+    matches_url = reverse("msa-tournament-matches-api", args=[t.id])
+    tag = client.get(matches_url)["ETag"]
+    assert client.get(matches_url, HTTP_IF_NONE_MATCH=tag).status_code == 304
+    set_result(m.id, mode="WIN_ONLY", winner="top")
+    changed = client.get(matches_url, HTTP_IF_NONE_MATCH=tag)
+    assert changed.status_code == 200
+    assert changed["ETag"] != tag
+
+
+@pytest.mark.django_db
+def test_category_edits_purge_tournament_lists_and_pages(client):
+    s, t, _, _ = _setup()
+    list_url = reverse("msa-tournaments-api")
+    entries_url = reverse("msa-tournament-entries-api", args=[t.id])
+    assert client.get(list_url, {"season": s.id}).json()["tournaments"][0]["category"] == "WT"
+    client.get(entries_url)
+
+    category = Category.objects.get(pk=t.category_id)
+    category.name = "WT Gold"
+    category.save()
+    assert client.get(list_url, {"season": s.id}).json()["tournaments"][0]["category"] == "WT Gold"
+
+    cs = CategorySeason.objects.get(pk=t.category_season_id)
+    cs.wc_slots_default = 3
+    cs.save()
+    assert client.get(entries_url).json()["summary"]["wc"]["limit"] == 3
+
+
+@pytest.mark.django_db
+def test_category_edits_change_list_and_tournament_validators(client):
+    s, t, _, _ = _setup()
+    list_url = reverse("msa-tournaments-api")
+    matches_url = reverse("msa-tournament-matches-api", args=[t.id])
+    first = client.get(list_url, {"season": s.id})
+    etag = first["ETag"]
+    tag = client.get(matches_url)["ETag"]
+
+    category = Category.objects.get(pk=t.category_id)
+    category.name = "WT Gold"
+    category.save()
+
+    renamed = client.get(list_url, {"season": s.id}, HTTP_IF_NONE_MATCH=etag)
+    assert renamed.status_code == 200
+    assert renamed.json()["tournaments"][0]["category"] == "WT Gold"
+
+    cs = CategorySeason.objects.get(pk=t.category_season_id)
+    cs.draw_size = 32
+    cs.save()
+    assert client.get(matches_url, HTTP_IF_NONE_MATCH=tag).status_code == 200
+    assert renamed["ETag"] != etag
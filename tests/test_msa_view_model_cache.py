@@ -0,0 +1,98 @@
+import pytest
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from msa.models import (
+    Category,
+    CategorySeason,
+    EntryType,
+    Player,
+    Season,
+    Tournament,
+    TournamentEntry,
+    TournamentViewVersion,
+)
+from msa.services.wc import set_wc_slots
+from tests.woorld_helpers import woorld_date
+
+
+def _tournament():
+    s = Season.objects.create(name="2025", start_date="2025-01-01", end_date=woorld_date(2025, 12))
+    c = Category.objects.create(name="WT")
+    cs = CategorySeason.objects.create(category=c, season=s, draw_size=16, qual_rounds=2)
+    t = Tournament.objects.create(
+        season=s, category=c, category_season=cs, name="T", slug="t", draw_size=16
+    )
+    for i in range(1, 5):
+        TournamentEntry.objects.create(
+            tournament=t,
+            player=Player.objects.create(name=f"P{i}"),
+            entry_type=EntryType.DA,
+            position=i,
+            wr_snapshot=i,
+        )
+    return t
+
+
+@pytest.mark.django_db
+@override_settings(MSA_RESPONSE_CACHE_ENABLED=False)
+def test_tournament_apis_share_cached_view_models(client):
+    t = _tournament()
+    entries_url = reverse("msa-tournament-entries-api", args=[t.id])
+    maindraw_url = reverse("msa-tournament-maindraw-api", args=[t.id])
+
+    first = client.get(entries_url).json()
+    assert first["meta"]["total"] == 4
+    client.get(maindraw_url)
+
+    with CaptureQueriesContext(connection) as ctx:
+        again = client.get(maindraw_url).json()
+        client.get(reverse("msa-tournament-qualification-api", args=[t.id]))
+    # na request jen validátor ETag a načtení turnaje (s verzí), view-modely jdou z cache
+    assert len(ctx.captured_queries) == 4
+    assert again["slots"][0]["player"]["name"] == "P1"
+
+
+@pytest.mark.django_db
+def test_mutating_service_bumps_version_and_invalidates(client):
+    t = _tournament()
+    url = reverse("msa-tournament-entries-api", args=[t.id])
+    assert client.get(url).json()["summary"]["wc"]["limit"] == 0
+
+    set_wc_slots(t, 2)
+
+    assert TournamentViewVersion.objects.get(tournament=t).version >= 1
+    assert client.get(url).json()["summary"]["wc"]["limit"] == 2
+
+    # zápis mimo službu (admin, shell) zvýší verzi přes signál modelu
+    TournamentEntry.objects.create(
+        tournament=t, player=Player.objects.create(name="Late"), entry_type=EntryType.DA
+    )
+    assert client.get(url).json()["meta"]["total"] == 5
+
+
+@pytest.mark.django_db
+def test_service_writes_bump_version_once():
+    t = _tournament()
+    before = TournamentViewVersion.objects.get(tournament=t).version
+
+    set_wc_slots(t, 2)
+
+    # uložení turnaje uvnitř služby se sloučí s jejím závěrečným zvýšením
+    assert TournamentViewVersion.objects.get(tournament=t).version == before + 1
+
+
+@pytest.mark.django_db
+@override_settings(MSA_RESPONSE_CACHE_ENABLED=False)
+def test_category_season_edit_invalidates_view_models(client):
+    t = _tournament()
+    url = reverse("msa-tournament-qualification-api", args=[t.id])
+    assert client.get(url).json()["R"] == 2
+
+    cs = CategorySeason.objects.get(pk=t.category_season_id)
+    cs.qual_rounds = 3
+    cs.save()
+
+    assert client.get(url).json()["R"] == 3
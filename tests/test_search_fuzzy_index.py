@@ -0,0 +1,56 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from search.fuzzy import BKTree, fuzzy_hits, get_index
+from search.utils import levenshtein
+from wiki.models import Article
+
+
+def test_bk_tree_finds_all_tokens_within_distance():
+    words = ["oliver", "olivier", "oliva", "novak", "nowak", "squash", "squish", "olive"]
+    tree = BKTree()
+    for w in words:
+        tree.add(w)
+    tree.add("oliver")
+    assert tree.size == len(words)
+    for query in ("oliver", "novac", "squosh", "xyz"):
+        expected = {w for w in words if levenshtein(query, w) <= 1}
+        assert set(tree.search(query, 1)) == expected
+
+
+@pytest.mark.django_db
+def test_fuzzy_covers_whole_corpus_beyond_recent_window(client):
+    Article.objects.create(title="Kowalczyk", content_md="old")
+    Article.objects.bulk_create(
+        [Article(title=f"Filler {i}", slug=f"filler-{i}", content_md="x") for i in range(250)]
+    )
+
+    hits = fuzzy_hits({"kowalcyk"})
+    assert [h["title"] for h in hits] == ["Kowalczyk"]
+
+    response = client.get(reverse("search"), {"q": "Kowalcyk"})
+    assert "Kowalczyk" in response.text
+
+
+@pytest.mark.django_db
+def test_fuzzy_index_updates_incrementally_on_save_and_delete():
+    a = Article.objects.create(title="Marathon", slug="run-1", content_md="x")
+    get_index()
+    assert [h["title"] for h in fuzzy_hits({"marathom"})] == ["Marathon"]
+
+    a.title = "Sprinter"
+    a.save()
+    index = get_index()
+    assert not index.stale()
+    assert fuzzy_hits({"marathom"}) == []
+    assert [h["title"] for h in fuzzy_hits({"sprintr"})] == ["Sprinter"]
+
+    # candidate lookup itself touches no table, only hits are hydrated
+    with CaptureQueriesContext(connection) as ctx:
+        assert index.candidates({"sprintr"})
+    assert len(ctx.captured_queries) == 0
+
+    a.delete()
+    assert fuzzy_hits({"sprintr"}) == []
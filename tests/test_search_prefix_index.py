@@ -0,0 +1,116 @@
+import threading
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from search.content import bump_content_generation, refresh_index
+from search.prefix import PrefixIndex, get_prefix_index
+from search.registry import get_sources
+from wiki.models import Article
+
+
+def _titles(resp):
+    return [r["title"] for r in resp.json()["results"]]
+
+
+@pytest.mark.django_db
+def test_suggest_served_from_prefix_index_without_queries(client):
+    Article.objects.create(title="Novak Djokovic", content_md="x")
+    Article.objects.create(title="Novara Open", content_md="x")
+    get_prefix_index()
+
+    with CaptureQueriesContext(connection) as ctx:
+        resp = client.get(reverse("search-suggest"), {"q": "nova"})
+    # stejné skóre → novější dokument (vyšší popularita) první
+    assert _titles(resp)[:2] == ["Novara Open", "Novak Djokovic"]
+    assert not [q for q in ctx.captured_queries if "wiki_article" in q["sql"]]
+
+    # začátek slova uprostřed titulku má nižší skóre než prefix titulku
+    Article.objects.create(title="Djokovic Story", content_md="x")
+    titles = _titles(client.get(reverse("search-suggest"), {"q": "djok"}))
+    assert titles.index("Djokovic Story") < titles.index("Novak Djokovic")
+
+
+@pytest.mark.django_db
+def test_prefix_index_follows_saves_and_other_workers():
+    a = Article.objects.create(title="Alpha Cup", slug="alpha-cup", content_md="x")
+    index = get_prefix_index()
+    assert [r["title"] for r in index.top("alp", "alp")] == ["Alpha Cup"]
+
+    a.title = "Beta Cup"
+    a.slug = "beta-cup"
+    a.save()
+    assert not index.stale()
+    assert index.top("alp", "alp") == []
+    assert [r["title"] for r in index.top("beta", "beta")] == ["Beta Cup"]
+
+    a.delete()
+    assert index.top("beta", "beta") == []
+
+    # změna v jiném procesu: nová generace v cache → přestavba (v transakci testu hned)
+    bump_content_generation()
+    assert index.stale()
+    assert not get_prefix_index().stale()
+
+
+def test_stale_index_is_rebuilt_in_background_while_old_one_serves():
+    started, release = threading.Event(), threading.Event()
+
+    class SlowIndex:
+        calls = 0
+
+        def built(self):
+            return True
+
+        def stale(self):
+            return True
+
+        def rebuild(self, sources):
+            SlowIndex.calls += 1
+            started.set()
+            release.wait(5)
+
+    index = SlowIndex()
+    # mimo transakci se nečeká na přestavbu a druhé čtení nespustí další vlákno
+    assert refresh_index(index) is index
+    assert started.wait(5)
+    assert refresh_index(index) is index
+    release.set()
+    for thread in threading.enumerate():
+        if thread.name == "search-index-rebuild":
+            thread.join(5)
+    assert SlowIndex.calls == 1
+
+
+def test_concurrent_generation_bumps_are_not_lost():
+    _, first = bump_content_generation()
+    threads = [
+        threading.Thread(target=lambda: [bump_content_generation() for _ in range(50)])
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    old, new = bump_content_generation()
+    assert (old, new) == (first + 200, first + 201)
+
+
+@pytest.mark.django_db
+def test_short_prefix_ranks_the_whole_corpus():
+    old = timezone.now() - timedelta(days=365)
+    Article.objects.bulk_create(
+        [Article(title=f"Aa {i:04}", slug=f"aa-{i:04}", content_md="x") for i in range(2100)]
+    )
+    Article.objects.filter(slug__startswith="aa-").update(updated_at=old)
+    Article.objects.create(title="Azure", slug="azure", content_md="x")
+    index = PrefixIndex()
+    index.rebuild(get_sources())
+
+    # nejnovější (nejpopulárnější) titulek je až za 2100 abecedně dřívějšími klíči
+    assert [r["title"] for r in index.top("a", "a", 1)] == ["Azure"]
+    assert [r["title"] for r in index.top("aa 00", "aa-00", 3)] == ["Aa 0000", "Aa 0001", "Aa 0002"]
@@ -0,0 +1,83 @@
+import time
+
+import pytest
+from django.test import override_settings
+from django.urls import reverse
+
+from msa.models import Player
+from search.registry import SearchSource, get_sources, register, unregister
+from search.runner import run_sources
+from wiki.models import Article
+
+
+def _slow_source(name, delay, timeout=0.2):
+    def queryset():
+        time.sleep(delay)
+        return Article.objects.all()
+
+    return SearchSource(
+        name=name,
+        model=Article,
+        type="Slow",
+        source="slow",
+        queryset=queryset,
+        title=lambda a: a.title,
+        url=lambda a: f"/slow/{a.pk}/",
+        search_fields=("title",),
+        timeout=timeout,
+    )
+
+
+def test_apps_declare_their_sources():
+    names = {s.name for s in get_sources()}
+    assert {"wiki.article", "msa.player", "msa.tournament", "mma.fighter"} <= names
+
+
+@pytest.mark.django_db
+def test_msa_players_are_searchable(client):
+    Player.objects.create(name="Jan Kowalski")
+    response = client.get(reverse("search"), {"q": "kowalski"})
+    assert response.status_code == 200
+    assert "Jan Kowalski" in response.text
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(SEARCH_RESULT_CACHE_ENABLED=False)
+def test_slow_source_is_cut_off_and_partial_results_returned(client):
+    Article.objects.create(title="Budget Test", content_md="x")
+    register(_slow_source("test.slow", delay=1.0))
+    try:
+        started = time.monotonic()
+        response = client.get(reverse("search"), {"q": "budget"})
+        elapsed = time.monotonic() - started
+    finally:
+        unregister("test.slow")
+
+    assert response.status_code == 200
+    assert "Budget Test" in response.text
+    assert "/slow/" not in response.text
+    assert response.context["partial"] is True
+    assert elapsed < 0.9
+
+
+@pytest.mark.django_db
+def test_failing_source_does_not_break_search():
+    Article.objects.create(title="Sturdy", content_md="x")
+
+    def broken():
+        raise RuntimeError("boom")
+
+    source = SearchSource(
+        name="test.broken",
+        model=Article,
+        type="Broken",
+        source="broken",
+        queryset=broken,
+        title=lambda a: a.title,
+        url=lambda a: "/broken/",
+    )
+    wiki = next(s for s in get_sources() if s.name == "wiki.article")
+    run = run_sources([source, wiki], "sturdy", "sturdy", "sturdy")
+    assert run.failed == ["test.broken"]
+    assert [h["title"] for h in run.hits] == ["Sturdy"]
+    assert run.partial
@@ -0,0 +1,52 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from search.result_cache import query_key, reset_stats, stats
+from wiki.models import Article
+
+
+def test_query_key_strips_but_keeps_case_and_accents():
+    assert query_key("  Žluťoučký kůň ") == "Žluťoučký kůň"
+    # icontains/slugify běží nad původním dotazem → varianty nesmí sdílet záznam
+    assert query_key("Škoda") != query_key("skoda")
+
+
+@pytest.mark.django_db
+def test_repeated_search_is_served_from_cache_until_content_changes(client):
+    Article.objects.create(title="Woorld Cup", content_md="x")
+    reset_stats()
+
+    first = client.get(reverse("search"), {"q": "Woorld"})
+    assert "Woorld Cup" in first.text
+    with CaptureQueriesContext(connection) as ctx:
+        second = client.get(reverse("search"), {"q": " Woorld "})
+    assert "Woorld Cup" in second.text
+    assert not [q for q in ctx.captured_queries if "wiki_article" in q["sql"]]
+    assert stats()["hits"] == 1 and stats()["misses"] == 1
+
+    Article.objects.create(title="Woorld Open", content_md="y")
+    third = client.get(reverse("search"), {"q": "Woorld"})
+    assert "Woorld Open" in third.text
+    assert stats()["misses"] == 2
+
+    out = StringIO()
+    call_command("search_stats", "--reset", stdout=out)
+    assert "hits=1 misses=2" in out.getvalue()
+    assert stats()["hits"] == 0
+
+
+@pytest.mark.django_db
+def test_accent_variants_do_not_share_an_entry(client):
+    Article.objects.create(title="Škoda Octavia", content_md="x")
+    Article.objects.create(title="Skoda Felicia", content_md="y")
+    reset_stats()
+    accented = client.get(reverse("search"), {"q": "Škoda"}).text
+    plain = client.get(reverse("search"), {"q": "skoda"}).text
+    assert stats()["misses"] == 2
+    assert "Škoda Octavia" in accented
+    assert "Skoda Felicia" in plain
@@ -2,13 +2,38 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+
 from django.shortcuts import get_object_or_404
+from django.utils.cache import patch_cache_control
 from rest_framework import generics, permissions, serializers, viewsets
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.throttling import AnonRateThrottle
 
 from .models_data import DataPoint, DataSeries
-from .utils_data import get_series_by_category, get_value_for_year
+from .packed_data import get_packs, packed
+from .utils_data import get_series_by_category, get_values_for_keys, parse_keys
+
+# Veřejná data se mění zřídka; klienti a proxy je mohou chvíli držet.
+API_MAX_AGE = 300
+# Víc bodů než pixelů grafu nemá smysl posílat.
+MAX_POINTS_LIMIT = 10_000
+
+
+def cached_response(request, data: dict) -> Response:
+    """``data`` with a content ETag (304 on match) and public Cache-Control."""
+
+    body = json.dumps(data, sort_keys=True, default=str).encode()
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    if etag in request.headers.get("If-None-Match", ""):
+        response = Response(status=304)
+    else:
+        response = Response(data)
+    response["ETag"] = etag
+    patch_cache_control(response, public=True, max_age=API_MAX_AGE)
+    return response
 
 
 class BurstAnonThrottle(AnonRateThrottle):
@@ -65,6 +90,47 @@ class DataSeriesViewSet(viewsets.ModelViewSet):
             return DataSeriesDetailSerializer
         return DataSeriesListSerializer
 
+    def retrieve(self, request, *args, **kwargs) -> Response:
+        """Series detail; ``from``/``to`` limit the key range and ``max_points``
+        downsamples the points (LTTB) for charts."""
+
+        series = self.get_object()
+        start = request.GET.get("from") or None
+        end = request.GET.get("to") or None
+        max_points = request.GET.get("max_points")
+        if max_points is not None:
+            try:
+                max_points = min(max(int(max_points), 3), MAX_POINTS_LIMIT)
+            except ValueError:
+                raise ValidationError({"max_points": "Must be an integer."}) from None
+        if start is None and end is None and max_points is None:
+            return cached_response(request, self.get_serializer(series).data)
+
+        pack = packed(get_packs([series.pk])[series.pk])
+        keys, values = pack.downsample(start, end, max_points)
+        notes = {}
+        if keys:
+            notes = dict(
+                series.points.filter(key__gte=keys[0], key__lte=keys[-1])
+                .exclude(note="")
+                .values_list("key", "note")
+            )
+        total = len(range(*pack.bounds(start, end)))
+        data = {
+            "slug": series.slug,
+            "title": series.title,
+            "unit": series.unit,
+            "description": series.description,
+            "categories": [c.slug for c in series.categories.all()],
+            "points": [
+                {"key": k, "value": str(v), "note": notes.get(k, "")}
+                for k, v in zip(keys, values, strict=True)
+            ],
+            "total_points": total,
+            "downsampled": len(keys) < total,
+        }
+        return cached_response(request, data)
+
 
 class DataPointDetail(generics.GenericAPIView):
     permission_classes = [permissions.AllowAny]
@@ -73,7 +139,9 @@ class DataPointDetail(generics.GenericAPIView):
     def get(self, request, slug: str, key: str) -> Response:
         series = get_object_or_404(DataSeries, slug=slug)
         point = get_object_or_404(DataPoint, series=series, key=key)
-        return Response({"key": point.key, "value": str(point.value), "unit": series.unit})
+        return cached_response(
+            request, {"key": point.key, "value": str(point.value), "unit": series.unit}
+        )
 
 
 class DataSeriesByCategory(generics.GenericAPIView):
@@ -87,13 +155,17 @@ class DataSeriesByCategory(generics.GenericAPIView):
 
     def get(self, request, *args, **kwargs) -> Response:
         year = request.GET.get("year")
+        try:
+            years = parse_keys(request.GET.get("years", ""))
+        except ValueError as exc:
+            raise ValidationError({"years": str(exc)}) from None
         ordering = request.GET.get("ordering", "slug")
         limit = request.GET.get("limit")
-        qs = list(self.get_queryset())
+        keys = [*years, year] if year else years
         data_list = []
         by_slug = {}
-        for s in qs:
-            value = get_value_for_year(s, year) if year else None
+        for s, values in get_values_for_keys(self.get_queryset(), keys):
+            value = values[year] if year else None
             item = {
                 "slug": s.slug,
                 "title": s.title,
@@ -101,6 +173,10 @@ class DataSeriesByCategory(generics.GenericAPIView):
                 "value_for_year": str(value) if value is not None else None,
                 "_sort_value": value,
             }
+            if years:
+                item["values"] = {
+                    key: str(values[key]) if values[key] is not None else None for key in years
+                }
             if value is not None:
                 by_slug[s.slug] = str(value)
             data_list.append(item)
@@ -119,4 +195,4 @@ class DataSeriesByCategory(generics.GenericAPIView):
             data_list = data_list[: int(limit)]
         for item in data_list:
             item.pop("_sort_value", None)
-        return Response({"results": data_list, "by_slug": by_slug})
+        return cached_response(request, {"results": data_list, "by_slug": by_slug})
@@ -0,0 +1,61 @@
+"""REST API for querying articles by infobox parameters."""
+
+from __future__ import annotations
+
+from rest_framework import generics, permissions
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from .api_data import BurstAnonThrottle, cached_response
+from .infoboxes.index import LOOKUPS, NUMERIC_LOOKUPS, field_types, find_articles, parse_number
+
+MAX_LIMIT = 500
+
+
+class InfoboxQuery(generics.GenericAPIView):
+    """``/api/infobox/city/?country=Česko&population__gte=100000&ordering=-population``.
+
+    Query parameters other than ``ordering``, ``fields`` and ``limit`` filter
+    on infobox keys of the schema.
+    """
+
+    permission_classes = [permissions.AllowAny]
+    throttle_classes = [BurstAnonThrottle]
+
+    def get(self, request, ibox_type: str) -> Response:
+        schema = field_types(ibox_type)
+        if not schema:
+            return Response({"detail": "Unknown infobox type."}, status=404)
+        where = {}
+        for param, value in request.GET.items():
+            if param in {"ordering", "fields", "limit", "format"}:
+                continue
+            key, _, lookup = param.partition("__")
+            if key not in schema or (lookup and lookup not in LOOKUPS):
+                raise ValidationError({param: "Unknown infobox field or lookup."})
+            values = value.split(",") if lookup == "in" else [value]
+            if schema[key] == "number" and (lookup or "exact") in NUMERIC_LOOKUPS:
+                if any(parse_number(v) is None for v in values):
+                    raise ValidationError({param: "Must be a number."})
+            where[param] = values if lookup == "in" else value
+        ordering = [o for o in request.GET.get("ordering", "").split(",") if o]
+        fields = [f for f in request.GET.get("fields", "").split(",") if f]
+        for key in [o.lstrip("-") for o in ordering] + fields:
+            if key not in schema:
+                raise ValidationError({"ordering": f"Unknown infobox field: {key}"})
+        try:
+            limit = min(max(int(request.GET.get("limit", MAX_LIMIT)), 1), MAX_LIMIT)
+        except ValueError:
+            raise ValidationError({"limit": "Must be an integer."}) from None
+
+        keys = list(dict.fromkeys([o.lstrip("-") for o in ordering] + fields))
+        articles = find_articles(ibox_type, where, ordering, keys)[:limit]
+        results = [
+            {
+                "slug": a.slug,
+                "title": a.title,
+                "values": {key: getattr(a, f"ib_{key}") for key in keys},
+            }
+            for a in articles
+        ]
+        return cached_response(request, {"results": results})
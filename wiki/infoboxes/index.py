@@ -0,0 +1,147 @@
+"""Queryable index of infobox parameters.
+
+On every article save the ``{{Infobox …}}`` blocks are parsed once and their
+parameters stored as :class:`~wiki.models.InfoboxValue` rows.  Values of
+``number`` fields in the schema (``infoboxes/<type>.schema.json``) are also
+stored as numbers, so :func:`find_articles` can filter and sort on them in the
+database.  After a schema change run ``manage.py rebuild_infobox_index``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from django.db.models import Exists, F, OuterRef, Subquery
+
+from .parser import INFOBOX_RE, clear_caches, compile_schema, parse_number, parse_params
+
+VALUE_TEXT_MAX = 255
+LOOKUPS = {"exact", "iexact", "icontains", "istartswith", "in", "gt", "gte", "lt", "lte"}
+NUMERIC_LOOKUPS = {"exact", "in", "gt", "gte", "lt", "lte"}
+
+
+def field_types(ibox_type: str) -> dict[str, str]:
+    schema = compile_schema(ibox_type)
+    return {name: field.type for name, field in schema.fields.items()} if schema else {}
+
+
+def extract(content_md: str) -> list[tuple[str, int, str, str, float | None]]:
+    """``(type, position, key, text, number)`` for every infobox parameter."""
+    rows = []
+    for position, match in enumerate(INFOBOX_RE.finditer(content_md or "")):
+        ibox_type = match.group(1)
+        types = field_types(ibox_type)
+        for key, value in parse_params(match.group(2)).items():
+            if not value:
+                continue
+            number = parse_number(value) if types.get(key) == "number" else None
+            rows.append((ibox_type, position, key, value[:VALUE_TEXT_MAX], number))
+    return rows
+
+
+def index_article(article) -> None:
+    from ..models import InfoboxValue
+
+    InfoboxValue.objects.filter(article=article).delete()
+    InfoboxValue.objects.bulk_create(
+        InfoboxValue(
+            article=article,
+            infobox_type=ibox_type,
+            position=position,
+            key=key,
+            value_text=text,
+            value_number=number,
+        )
+        for ibox_type, position, key, text, number in extract(article.content_md)
+    )
+
+
+def rebuild(articles=None) -> int:
+    """Re-index ``articles`` (queryset, default all) with freshly loaded schemas."""
+    from ..models import Article
+
+    clear_caches()
+    qs = Article.objects.all() if articles is None else articles
+    count = 0
+    for article in qs.only("pk", "content_md").iterator(chunk_size=500):
+        index_article(article)
+        count += 1
+    return count
+
+
+def _number(key: str, value) -> float:
+    number = parse_number(str(value))
+    if number is None:
+        raise ValueError(f"{key} expects a number, got {value!r}")
+    return number
+
+
+def _column(ibox_type: str, key: str) -> str:
+    return "value_number" if field_types(ibox_type).get(key) == "number" else "value_text"
+
+
+def find_articles(
+    ibox_type: str,
+    where: dict[str, Any] | None = None,
+    order_by: Iterable[str] = (),
+    fields: Iterable[str] = (),
+):
+    """Live articles with an infobox of ``ibox_type`` matching ``where``.
+
+    ``where`` uses Django-style lookups on infobox keys
+    (``{"country": "Česko", "population__gte": 100000}``); number fields compare
+    numerically and raise :class:`ValueError` for values that are not numbers.
+    ``order_by`` takes keys with an optional ``-``; articles without the value
+    sort last.  Every key from ``order_by`` and ``fields`` is annotated on the
+    articles as ``ib_<key>``.
+    """
+
+    from ..models import Article, InfoboxValue
+
+    values = InfoboxValue.objects.filter(article=OuterRef("pk"), infobox_type=ibox_type)
+    qs = Article.objects.filter(is_deleted=False).filter(Exists(values))
+    for expr, wanted in (where or {}).items():
+        key, _, lookup = expr.partition("__")
+        lookup = lookup or "exact"
+        if lookup not in LOOKUPS:
+            raise ValueError(f"unsupported lookup: {lookup}")
+        column = _column(ibox_type, key)
+        if column == "value_number":
+            if lookup == "in":
+                wanted = [_number(key, w) for w in wanted]
+            elif lookup in NUMERIC_LOOKUPS:
+                wanted = _number(key, wanted)
+        qs = qs.filter(Exists(values.filter(key=key, **{f"{column}__{lookup}": wanted})))
+
+    order_by = list(order_by)
+    annotate = dict.fromkeys([*(o.lstrip("-") for o in order_by), *fields])
+    for key in annotate:
+        column = _column(ibox_type, key)
+        qs = qs.annotate(
+            **{
+                f"ib_{key}": Subquery(
+                    values.filter(key=key).order_by("position").values(column)[:1]
+                )
+            }
+        )
+    ordering = []
+    for item in order_by:
+        key = item.lstrip("-")
+        expr = F(f"ib_{key}")
+        ordering.append(
+            expr.desc(nulls_last=True) if item.startswith("-") else expr.asc(nulls_last=True)
+        )
+    return qs.order_by(*ordering, "title")
+
+
+__all__ = [
+    "LOOKUPS",
+    "NUMERIC_LOOKUPS",
+    "extract",
+    "field_types",
+    "find_articles",
+    "index_article",
+    "parse_number",
+    "rebuild",
+]
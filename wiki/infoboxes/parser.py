@@ -1,84 +1,258 @@
-import hashlib
+"""Parsing and rendering of ``{{Infobox <type> | key = value …}}`` blocks.
+
+Schemas (``infoboxes/<type>.schema.json``) are compiled once per process into
+field descriptors with a validator and a display formatter.  Rendered
+infoboxes are kept in a bounded per-process LRU cache; :func:`clear_caches`
+drops both after a schema change.
+"""
+
+from __future__ import annotations
+
 import json
 import logging
 import os
 import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
 
 import bleach
 from django.conf import settings
-from django.core.cache import cache
 from django.template import TemplateDoesNotExist
 from django.template.loader import render_to_string
 
 logger = logging.getLogger(__name__)
 
 INFOBOX_RE = re.compile(r"\{\{Infobox\s+([A-Za-z0-9._-]+)(.*?)\}\}", re.DOTALL)
-SCHEMA_CACHE: dict[str, list[dict[str, str]] | None] = {}
+SCHEMA_CACHE: dict[str, CompiledSchema | None] = {}
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
 
 
 def _normalize_key(key: str) -> str:
-    return re.sub(r"\s+", "_", key.strip().lower())
+    return _WHITESPACE_RE.sub("_", key.strip().lower())
+
+
+# Tokeny těla infoboxu: oddělovač, rovnítko, řetězec v uvozovkách (neuzavřený
+# běží do konce textu) a souvislý úsek ostatních znaků.
+_TOKEN_RE = re.compile(r"""[|=]|"[^"]*(?:"|$)|'[^']*(?:'|$)|[^|='"]+""")
 
 
 def parse_params(raw: str) -> dict[str, str]:
+    """``| key = value | …`` → ``{"key": "value"}``.
+
+    Keys are normalized (lowercase, whitespace → ``_``).  Quoted text may
+    contain ``|`` and ``=``; the quotes themselves are dropped.  Anything
+    before the first ``|`` is ignored, as are segments without ``=``.
+    """
     params: dict[str, str] = {}
-    key: list[str] | None = None
+    start = raw.find("|")
+    if start < 0:
+        return params
+    if '"' not in raw and "'" not in raw:
+        # bez uvozovek stačí rozdělit podle oddělovačů
+        for segment in raw[start + 1 :].split("|"):
+            name, sep, value = segment.partition("=")
+            if sep:
+                params[_normalize_key(name)] = value.lstrip("=").strip()
+        return params
+    key: list[str] | str = []
     val: list[str] = []
-    quote: str | None = None
-    i = 0
-    while i < len(raw):
-        ch = raw[i]
-        if key is None:
-            if ch == "|":
-                key = []
-                val = []
-            i += 1
-            continue
-        if quote:
-            if ch == quote:
-                quote = None
-            else:
-                val.append(ch)
-            i += 1
-            continue
-        if ch in ('"', "'"):
-            quote = ch
-            i += 1
-            continue
-        if ch == "=" and not val:
-            key_str = _normalize_key("".join(key))
-            key = key_str  # type: ignore[assignment]
-            i += 1
-            continue
-        if ch == "|":
+    for token in _TOKEN_RE.findall(raw, start + 1):
+        first = token[0]
+        if first == "|":
             if isinstance(key, str):
                 params[key] = "".join(val).strip()
-            key = []
-            val = []
-            i += 1
-            continue
-        if isinstance(key, list):
-            key.append(ch)
+            key, val = [], []
+        elif first == "=" and not val:
+            if isinstance(key, list):
+                key = _normalize_key("".join(key))
+        elif first in "\"'":
+            text = token[1:-1] if len(token) > 1 and token[-1] == first else token[1:]
+            if text:
+                val.append(text)
+        elif isinstance(key, list):
+            key.append(token)
         else:
-            val.append(ch)
-        i += 1
+            val.append(token)
     if isinstance(key, str):
         params[key] = "".join(val).strip()
     return params
 
 
-def load_schema(ibox_type: str) -> list[dict[str, str]] | None:
+_NUMBER_JUNK = re.compile(r"[\s _]")
+# Pole s obrázky a titulkem vykresluje šablona sama, do tabulky řádků nepatří.
+MEDIA_FIELDS = frozenset({"name", "flag", "coat_of_arms", "map", "image", "caption"})
+
+
+def parse_number(value: str) -> float | None:
+    """``"1 357 326"``, ``"496,2"`` → float; ``None`` if not a number."""
+    value = _NUMBER_JUNK.sub("", value or "")
+    if "," in value and "." not in value:
+        value = value.replace(",", ".")
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _validate_number(key: str, value: str) -> str | None:
+    if value and parse_number(value) is None:
+        return f"Parameter {key} expects number"
+    return None
+
+
+def _validate_any(key: str, value: str) -> str | None:
+    return None
+
+
+def _format_number(value: str) -> str:
+    """Group the digits of plain integers by thousands (``1357326`` → ``1 357 326``)."""
+    digits = _NUMBER_JUNK.sub("", value)
+    if not digits.isdigit() or len(digits) < 5:
+        return value
+    return f"{int(digits):,}".replace(",", "\u00a0")
+
+
+def _format_text(value: str) -> str:
+    return value
+
+
+VALIDATORS: dict[str, Callable[[str, str], str | None]] = {"number": _validate_number}
+FORMATTERS: dict[str, Callable[[str], str]] = {"number": _format_number}
+
+
+@dataclass(frozen=True)
+class FieldDescriptor:
+    name: str
+    title: str
+    type: str
+    validate: Callable[[str, str], str | None]
+    format: Callable[[str], str]
+
+
+@dataclass(frozen=True)
+class CompiledSchema:
+    """Schema of one infobox type prepared for rendering."""
+
+    type: str
+    items: list[dict[str, str]]
+    fields: dict[str, FieldDescriptor]
+    rows: tuple[FieldDescriptor, ...]
+    template: str
+
+    def validate(self, params: dict[str, str]) -> list[str]:
+        warnings: list[str] = []
+        for key, value in params.items():
+            field = self.fields.get(key)
+            if field is None:
+                warnings.append(f"Unknown parameter: {key}")
+                continue
+            warning = field.validate(key, value)
+            if warning:
+                warnings.append(warning)
+        return warnings
+
+
+def _compile(ibox_type: str, items: list[dict[str, str]]) -> CompiledSchema:
+    fields = {}
+    for item in items:
+        kind = item.get("type", "string")
+        fields[item["name"]] = FieldDescriptor(
+            name=item["name"],
+            title=item.get("title", item["name"]),
+            type=kind,
+            validate=VALIDATORS.get(kind, _validate_any),
+            format=FORMATTERS.get(kind, _format_text),
+        )
+    return CompiledSchema(
+        type=ibox_type,
+        items=items,
+        fields=fields,
+        rows=tuple(f for f in fields.values() if f.name not in MEDIA_FIELDS),
+        template=_template_name(ibox_type),
+    )
+
+
+def _template_name(ibox_type: str) -> str:
+    return f"infoboxes/{ibox_type}.html"
+
+
+def compile_schema(ibox_type: str) -> CompiledSchema | None:
+    """Compiled schema of ``ibox_type``; the JSON file is read once per process."""
     if ibox_type not in SCHEMA_CACHE:
         path = os.path.join(settings.BASE_DIR, "infoboxes", f"{ibox_type}.schema.json")
         try:
             with open(path, encoding="utf-8") as fh:
-                SCHEMA_CACHE[ibox_type] = json.load(fh)
+                SCHEMA_CACHE[ibox_type] = _compile(ibox_type, json.load(fh))
         except FileNotFoundError:
             logger.debug("Schema not found for %s", ibox_type)
             SCHEMA_CACHE[ibox_type] = None
     return SCHEMA_CACHE[ibox_type]
 
 
+def load_schema(ibox_type: str) -> list[dict[str, str]] | None:
+    compiled = compile_schema(ibox_type)
+    return compiled.items if compiled else None
+
+
+class RenderCache:
+    """Bounded LRU of rendered infoboxes with hit statistics (per process)."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> str | None:
+        with self._lock:
+            html = self._data.get(key)
+            if html is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return html
+
+    def set(self, key: Hashable, html: str) -> None:
+        with self._lock:
+            self._data[key] = html
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+            }
+
+
+RENDER_CACHE = RenderCache(getattr(settings, "INFOBOX_RENDER_CACHE_SIZE", 512))
+
+
+def render_cache_stats() -> dict[str, int]:
+    return RENDER_CACHE.stats()
+
+
+def clear_caches() -> None:
+    """Forget compiled schemas and rendered infoboxes (after a schema change)."""
+    SCHEMA_CACHE.clear()
+    RENDER_CACHE.clear()
+
+
 ALLOWED_TAGS = [
     "div",
     "h2",
@@ -106,61 +280,34 @@ def _sanitize_params(params: dict[str, str]) -> dict[str, str]:
     return {k: bleach.clean(v, tags=[], attributes={}, strip=True) for k, v in params.items()}
 
 
-def _validate_params(params: dict[str, str], schema: list[dict[str, str]] | None) -> list[str]:
-    if not schema:
-        return []
-    schema_map = {item["name"]: item for item in schema}
-    warnings: list[str] = []
-    for key, value in params.items():
-        if key not in schema_map:
-            warnings.append(f"Unknown parameter: {key}")
-            continue
-        expected = schema_map[key].get("type")
-        if expected == "number":
-            try:
-                float(value)
-            except ValueError:
-                warnings.append(f"Parameter {key} expects number")
-    return warnings
-
-
 def render_infobox(
     ibox_type: str,
     params: dict[str, str],
-    schema: list[dict[str, str]] | None,
+    schema: CompiledSchema | None,
     page_title: str,
 ) -> str:
-    template = f"infoboxes/{ibox_type}.html"
-    cache_key = (
-        "infobox:"
-        + hashlib.md5((template + json.dumps(params, sort_keys=True)).encode()).hexdigest()
-    )
-    cached = cache.get(cache_key)
-    if cached:
+    cache_key = (ibox_type, page_title, tuple(sorted(params.items())))
+    cached = RENDER_CACHE.get(cache_key)
+    if cached is not None:
         return cached
     context = {
         **params,
         "page_title": page_title,
-        "schema": schema or [],
+        "schema": schema.items if schema else [],
     }
     if schema:
-        rows = [
-            {
-                "title": item["title"],
-                "value": params.get(item["name"], ""),
-            }
-            for item in schema
-            if item["name"] not in {"name", "flag", "coat_of_arms", "map", "image", "caption"}
+        context["rows"] = [
+            {"title": field.title, "value": field.format(params.get(field.name, ""))}
+            for field in schema.rows
         ]
-        context["rows"] = rows
     try:
-        html = render_to_string(template, context)
+        html = render_to_string(schema.template if schema else _template_name(ibox_type), context)
     except TemplateDoesNotExist:
         if settings.DEBUG:
             return f'<div class="infobox infobox--missing">Missing template: {ibox_type}</div>'
         return ""
     html = bleach.clean(html, tags=ALLOWED_TAGS, attributes=ALLOWED_ATTRS)
-    cache.set(cache_key, html)
+    RENDER_CACHE.set(cache_key, html)
     return html
 
 
@@ -169,10 +316,10 @@ def process(text: str, page_title: str) -> str:
         ibox_type = match.group(1)
         body = match.group(2)
         params = parse_params(body)
-        schema = load_schema(ibox_type)
+        schema = compile_schema(ibox_type)
         if not params and schema:
-            params = {item["name"]: "" for item in schema}
-        warnings = _validate_params(params, schema)
+            params = dict.fromkeys(schema.fields, "")
+        warnings = schema.validate(params) if schema else []
         params = _sanitize_params(params)
         html = render_infobox(ibox_type, params, schema, page_title)
         if warnings and settings.DEBUG:
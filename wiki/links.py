@@ -0,0 +1,108 @@
+"""Wikilink graph: ``[[Target]]`` links persisted as :class:`~wiki.models.ArticleLink`.
+
+Links are re-synced on every article save (one bulk lookup resolves which
+targets exist).  Saving an article also resolves the links pointing at its
+slug, so "what links here" and red/blue styling never need a content scan.
+When an article appears, disappears (including a hard delete) or is renamed,
+only the rendered HTML of the articles linking to it is dropped from the cache.
+"""
+
+from __future__ import annotations
+
+import re
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from django.utils.text import slugify
+
+WIKILINK_RE = re.compile(r"\[\[([^|\]]+)(?:\|([^\]]+))?\]\]")
+RENDER_CACHE_TTL = 60 * 60
+
+
+def extract_slugs(content_md: str) -> list[str]:
+    """Target slugs of all wikilinks in ``content_md`` (unique, in order)."""
+    slugs = (slugify(m.group(1)) for m in WIKILINK_RE.finditer(content_md or ""))
+    return list(dict.fromkeys(s for s in slugs if s))
+
+
+def render_cache_key(article_id: int) -> str:
+    return f"wiki:article-html:{article_id}"
+
+
+def invalidate_sources_of(slugs: list[str]) -> None:
+    """Drop cached HTML of articles that link to any of ``slugs``."""
+    from .models import ArticleLink
+
+    slugs = [s for s in slugs if s]
+    if not slugs:
+        return
+    source_ids = set(
+        ArticleLink.objects.filter(target_slug__in=slugs).values_list("source_id", flat=True)
+    )
+    cache.delete_many([render_cache_key(pk) for pk in source_ids])
+
+
+def sync_links(article, previous_slug: str | None = None, existence_changed: bool = False) -> None:
+    """Rebuild outgoing links of ``article`` and re-resolve links pointing at it."""
+    from .models import Article, ArticleLink
+
+    slugs = extract_slugs(article.content_md)
+    targets = dict(Article.objects.filter(slug__in=slugs).values_list("slug", "pk"))
+    ArticleLink.objects.filter(source=article).delete()
+    ArticleLink.objects.bulk_create(
+        ArticleLink(source=article, target_slug=slug, target_id=targets.get(slug)) for slug in slugs
+    )
+
+    renamed = previous_slug is not None and previous_slug != article.slug
+    if renamed:
+        ArticleLink.objects.filter(target=article).exclude(target_slug=article.slug).update(
+            target=None
+        )
+    ArticleLink.objects.filter(target_slug=article.slug, target__isnull=True).update(target=article)
+    if renamed or existence_changed:
+        invalidate_sources_of([article.slug, previous_slug or ""])
+
+
+@receiver(post_delete, sender="wiki.Article", dispatch_uid="wiki-links-article-deleted")
+def _article_deleted(sender, instance, **kwargs) -> None:
+    # tvrdé smazání (admin) obchází save – odkazující stránky musí zčervenat hned
+    invalidate_sources_of([instance.slug])
+
+
+def existing_targets(article, slugs: list[str]) -> set[str]:
+    """Which of ``slugs`` point at live articles – a single query."""
+    from .models import Article, ArticleLink
+
+    if not slugs:
+        return set()
+    if article.pk:
+        qs = ArticleLink.objects.filter(
+            source=article, target_slug__in=slugs, target__is_deleted=False
+        ).values_list("target_slug", flat=True)
+    else:
+        qs = Article.objects.filter(slug__in=slugs, is_deleted=False).values_list("slug", flat=True)
+    return set(qs)
+
+
+def backlinks(article):
+    """Live articles linking to ``article``."""
+    from .models import Article
+
+    return (
+        Article.objects.filter(outgoing_links__target_slug=article.slug, is_deleted=False)
+        .exclude(pk=article.pk)
+        .distinct()
+        .order_by("title")
+    )
+
+
+__all__ = [
+    "WIKILINK_RE",
+    "backlinks",
+    "existing_targets",
+    "extract_slugs",
+    "invalidate_sources_of",
+    "render_cache_key",
+    "sync_links",
+]
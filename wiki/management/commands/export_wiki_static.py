@@ -0,0 +1,46 @@
+"""Management command to export the wiki as static HTML."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from ...static_export import export_site
+
+
+class Command(BaseCommand):
+    help = "Render published articles, categories and tags into a static HTML tree"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--output", type=Path, required=True)
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+        parser.add_argument(
+            "--force", action="store_true", help="Ignore the manifest and render everything"
+        )
+
+    def handle(self, *args, **options):
+        verbosity: int = options["verbosity"]
+
+        def progress(message: str) -> None:
+            if verbosity >= 2:
+                self.stdout.write(message)
+
+        result = export_site(
+            options["output"],
+            workers=max(options["workers"], 1),
+            force=options["force"],
+            progress=progress,
+        )
+        if verbosity >= 2:
+            for rel in result.rendered:
+                self.stdout.write(f"rendered {rel}")
+            for rel in result.removed:
+                self.stdout.write(f"removed {rel}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Exported {len(result.rendered)} pages, {result.unchanged} unchanged,"
+                f" {len(result.removed)} removed"
+            )
+        )
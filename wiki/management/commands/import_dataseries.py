@@ -7,31 +7,49 @@ from pathlib import Path
 from django.core.management.base import BaseCommand, CommandParser
 
 from ...models_data import DataSeries
-from ...utils_data import import_csv_to_series
+from ...utils_data import IMPORT_CHUNK_SIZE, ImportStats, import_csv
 
 
 class Command(BaseCommand):
-    help = "Import CSV data into a DataSeries"
+    help = (
+        "Import CSV data into a DataSeries (key;value with --slug, "
+        "otherwise series;key;value for multiple series)"
+    )
 
     def add_arguments(self, parser: CommandParser) -> None:
-        parser.add_argument("--slug", required=True)
+        parser.add_argument("--slug")
         parser.add_argument("--unit", default="")
         parser.add_argument("--title", default="")
         parser.add_argument("--file", type=Path, required=True)
+        parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE)
 
     def handle(self, *args, **options):
-        slug: str = options["slug"]
+        slug: str | None = options["slug"]
         unit: str = options["unit"]
         title: str = options["title"]
         file_path: Path = options["file"]
-
-        series, _ = DataSeries.objects.get_or_create(slug=slug)
-        if title:
-            series.title = title
-        if unit:
-            series.unit = unit
-        series.save()
+        verbosity: int = options["verbosity"]
+
+        series = None
+        if slug:
+            series, _ = DataSeries.objects.get_or_create(slug=slug)
+            if title:
+                series.title = title
+            if unit:
+                series.unit = unit
+            series.save()
+
+        def progress(stats: ImportStats) -> None:
+            if verbosity >= 2:
+                self.stdout.write(
+                    f"{stats.rows} rows: {stats.created} created, {stats.updated} updated"
+                )
 
         with file_path.open("r", encoding="utf-8") as fh:
-            created, updated = import_csv_to_series(series, fh)
-        self.stdout.write(self.style.SUCCESS(f"Imported {created} created, {updated} updated"))
+            stats = import_csv(fh, series, chunk_size=options["chunk_size"], progress=progress)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {stats.created} created, {stats.updated} updated"
+                f" ({len(stats.series)} series)"
+            )
+        )
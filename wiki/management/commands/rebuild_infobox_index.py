@@ -0,0 +1,30 @@
+"""Management command to rebuild the infobox parameter index."""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db.models import Q
+
+from ...infoboxes import index
+from ...models import Article
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-extract infobox parameters of articles "
+        "(run after migrating an existing database or changing a schema)"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--type", help="Only articles containing this infobox type")
+
+    def handle(self, *args, **options):
+        articles = Article.objects.all()
+        if options["type"]:
+            ibox_type = options["type"]
+            articles = articles.filter(
+                Q(content_md__icontains=f"{{{{Infobox {ibox_type}")
+                | Q(infobox_values__infobox_type=ibox_type)
+            ).distinct()
+        count = index.rebuild(articles)
+        self.stdout.write(self.style.SUCCESS(f"Indexed infoboxes of {count} articles"))
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:49
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wiki", "0006_dataseries_categories_m2m"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DataSeriesPack",
+            fields=[
+                (
+                    "series",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="pack",
+                        serialize=False,
+                        to="wiki.dataseries",
+                    ),
+                ),
+                ("keys", models.JSONField(default=list)),
+                ("values", models.BinaryField()),
+                ("count", models.PositiveIntegerField(default=0)),
+                ("min_value", models.DecimalField(decimal_places=4, max_digits=20, null=True)),
+                ("max_value", models.DecimalField(decimal_places=4, max_digits=20, null=True)),
+                ("sum_value", models.DecimalField(decimal_places=4, max_digits=30, null=True)),
+                ("latest_key", models.CharField(blank=True, max_length=50)),
+                ("latest_value", models.DecimalField(decimal_places=4, max_digits=20, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,81 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from wiki.revisions import apply_delta, pack_text, unpack_text
+
+
+def pack_existing(apps, schema_editor):
+    """Existing revisions become keyframes holding their full text."""
+    ArticleRevision = apps.get_model("wiki", "ArticleRevision")
+    for rev in ArticleRevision.objects.only("pk", "content_md").iterator(chunk_size=500):
+        rev.data = pack_text(rev.content_md)
+        rev.is_keyframe = True
+        rev.save(update_fields=["data", "is_keyframe"])
+
+
+def unpack_existing(apps, schema_editor):
+    ArticleRevision = apps.get_model("wiki", "ArticleRevision")
+    texts: dict[int, str] = {}
+    for rev in ArticleRevision.objects.order_by("pk").iterator(chunk_size=500):
+        if rev.is_keyframe:
+            text = unpack_text(bytes(rev.data))
+        else:
+            text = apply_delta(texts[rev.base_id], bytes(rev.data))
+        texts[rev.pk] = text
+        rev.content_md = text
+        rev.save(update_fields=["content_md"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wiki", "0007_dataseries_pack"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="articlerevision",
+            name="base",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to="wiki.articlerevision",
+            ),
+        ),
+        migrations.AddField(
+            model_name="articlerevision",
+            name="data",
+            field=models.BinaryField(default=b""),
+        ),
+        migrations.AddField(
+            model_name="articlerevision",
+            name="is_keyframe",
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddField(
+            model_name="articlerevision",
+            name="keyframe",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to="wiki.articlerevision",
+            ),
+        ),
+        migrations.RunPython(pack_existing, unpack_existing),
+        # výchozí hodnota jen kvůli zpětné migraci (sloupec se znovu přidává)
+        migrations.AlterField(
+            model_name="articlerevision",
+            name="content_md",
+            field=models.TextField(default=""),
+        ),
+        migrations.RemoveField(
+            model_name="articlerevision",
+            name="content_md",
+        ),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:57
+
+import re
+import unicodedata
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# zmrazená kopie wiki.links.extract_slugs (a django slugify) z doby migrace
+WIKILINK_RE = re.compile(r"\[\[([^|\]]+)(?:\|([^\]]+))?\]\]")
+
+
+def _slugify(value):
+    value = unicodedata.normalize("NFKD", str(value)).encode("ascii", "ignore").decode("ascii")
+    value = re.sub(r"[^\w\s-]", "", value.lower())
+    return re.sub(r"[-\s]+", "-", value).strip("-_")
+
+
+def extract_slugs(content_md):
+    slugs = (_slugify(m.group(1)) for m in WIKILINK_RE.finditer(content_md or ""))
+    return list(dict.fromkeys(s for s in slugs if s))
+
+
+def build_links(apps, schema_editor):
+    Article = apps.get_model("wiki", "Article")
+    ArticleLink = apps.get_model("wiki", "ArticleLink")
+    ids = dict(Article.objects.values_list("slug", "pk"))
+    for pk, content_md in Article.objects.values_list("pk", "content_md").iterator():
+        ArticleLink.objects.bulk_create(
+            ArticleLink(source_id=pk, target_slug=slug, target_id=ids.get(slug))
+            for slug in extract_slugs(content_md)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wiki", "0008_revision_deltas"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArticleLink",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("target_slug", models.SlugField(max_length=200)),
+                (
+                    "source",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="outgoing_links",
+                        to="wiki.article",
+                    ),
+                ),
+                (
+                    "target",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="incoming_links",
+                        to="wiki.article",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("source", "target_slug")},
+            },
+        ),
+        migrations.RunPython(build_links, migrations.RunPython.noop),
+    ]
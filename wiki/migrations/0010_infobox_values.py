@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Jen schéma: extrakce závisí na aktuálním parseru a schématech na disku, proto
+# existující články doplní ``manage.py rebuild_infobox_index``.
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wiki", "0009_article_links"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="InfoboxValue",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("infobox_type", models.CharField(max_length=50)),
+                ("position", models.PositiveSmallIntegerField(default=0)),
+                ("key", models.CharField(max_length=100)),
+                ("value_text", models.CharField(blank=True, max_length=255)),
+                ("value_number", models.FloatField(blank=True, null=True)),
+                (
+                    "article",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="infobox_values",
+                        to="wiki.article",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["infobox_type", "key", "value_number"],
+                        name="wiki_infobo_infobox_753d79_idx",
+                    ),
+                    models.Index(
+                        fields=["infobox_type", "key", "value_text"],
+                        name="wiki_infobo_infobox_fddc04_idx",
+                    ),
+                ],
+            },
+        ),
+    ]
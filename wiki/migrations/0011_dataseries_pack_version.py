@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wiki", "0010_infobox_values"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dataseries",
+            name="points_version",
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="dataseriespack",
+            name="version",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+    ]
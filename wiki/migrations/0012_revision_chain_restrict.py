@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:22
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wiki", "0011_dataseries_pack_version"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="articlerevision",
+            name="base",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.RESTRICT,
+                related_name="+",
+                to="wiki.articlerevision",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="articlerevision",
+            name="keyframe",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.RESTRICT,
+                related_name="+",
+                to="wiki.articlerevision",
+            ),
+        ),
+    ]
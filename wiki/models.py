@@ -1,12 +1,13 @@
-import re
-
 import bleach
 import markdown
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.db import models
 from django.urls import reverse
 from django.utils.text import slugify
 
+from . import links, revisions
+from .infoboxes import index as infobox_index
 from .utils_data import replace_data_shortcodes
 
 
@@ -61,31 +62,64 @@ class Article(models.Model):
         "Category", through="CategoryArticle", related_name="articles", blank=True
     )
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._stored_state = (
+            instance.__dict__.get("slug"),
+            instance.__dict__.get("is_deleted"),
+        )
+        return instance
+
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title)
+        previous_slug, was_deleted = getattr(self, "_stored_state", (None, None))
+        created = self.pk is None
         super().save(*args, **kwargs)
+        links.sync_links(
+            self,
+            previous_slug=previous_slug,
+            existence_changed=created or was_deleted != self.is_deleted,
+        )
+        infobox_index.index_article(self)
+        self._stored_state = (self.slug, self.is_deleted)
 
     def get_absolute_url(self):
         return reverse("wiki:article-detail", kwargs={"slug": self.slug})
 
-    def content_html(self) -> str:
+    def _markup_html(self) -> str:
+        """Infoboxes, wikilinks and Markdown – cached until the article or a
+        link target changes (see :mod:`wiki.links`)."""
         from .infoboxes import parser as infobox_parser
 
-        pattern = r"\[\[([^|\]]+)(?:\|([^\]]+))?\]\]"
+        stamp = self.updated_at.isoformat() if self.pk and self.updated_at else None
+        if stamp:
+            cached = cache.get(links.render_cache_key(self.pk))
+            if cached and cached[0] == stamp:
+                return cached[1]
+
+        existing = links.existing_targets(self, links.extract_slugs(self.content_md))
 
         def repl(match):
             target = match.group(1)
             label = match.group(2) or target
             slug = slugify(target)
             url = reverse("wiki:article-detail", args=[slug])
-            cls = "text-red-600 hover:underline"
-            return f'<a href="{url}" class="{cls}">{label}</a>'
+            if slug in existing:
+                return f'<a href="{url}" class="text-red-600 hover:underline">{label}</a>'
+            # chybějící cíl: odlišený vzhled jako „červené odkazy“ na Wikipedii
+            cls = "text-red-600 hover:underline italic opacity-70 new"
+            return f'<a href="{url}" class="{cls}" title="Stránka zatím neexistuje">{label}</a>'
 
         md = infobox_parser.process(self.content_md, page_title=self.title)
-        processed = re.sub(pattern, repl, md)
-        html = markdown.markdown(processed)
-        html = replace_data_shortcodes(html)
+        html = markdown.markdown(links.WIKILINK_RE.sub(repl, md))
+        if stamp:
+            cache.set(links.render_cache_key(self.pk), (stamp, html), links.RENDER_CACHE_TTL)
+        return html
+
+    def content_html(self) -> str:
+        html = replace_data_shortcodes(self._markup_html())
         allowed = list(bleach.sanitizer.ALLOWED_TAGS) + [
             "p",
             "pre",
@@ -147,17 +181,113 @@ class CategoryArticle(models.Model):
         return f"{self.category} -> {self.article}"
 
 
+class ArticleLink(models.Model):
+    """``[[wikilink]]`` from ``source`` to the article with ``target_slug``.
+
+    ``target`` is ``None`` while no article has that slug (a red link).
+    """
+
+    source = models.ForeignKey(Article, related_name="outgoing_links", on_delete=models.CASCADE)
+    target_slug = models.SlugField(max_length=200, db_index=True)
+    target = models.ForeignKey(
+        Article, null=True, blank=True, related_name="incoming_links", on_delete=models.SET_NULL
+    )
+
+    class Meta:
+        unique_together = ("source", "target_slug")
+
+    def __str__(self) -> str:  # pragma: no cover - simple repr
+        return f"{self.source_id} -> {self.target_slug}"
+
+
+class InfoboxValue(models.Model):
+    """One infobox parameter of an article, typed by the infobox schema.
+
+    Filled on article save by :mod:`wiki.infoboxes.index`; ``value_number`` is
+    set for ``number`` fields so they filter and sort numerically.
+    """
+
+    article = models.ForeignKey(Article, related_name="infobox_values", on_delete=models.CASCADE)
+    infobox_type = models.CharField(max_length=50)
+    position = models.PositiveSmallIntegerField(default=0)
+    key = models.CharField(max_length=100)
+    value_text = models.CharField(max_length=255, blank=True)
+    value_number = models.FloatField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["infobox_type", "key", "value_number"]),
+            models.Index(fields=["infobox_type", "key", "value_text"]),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - simple repr
+        return f"{self.article_id}:{self.infobox_type}.{self.key}={self.value_text}"
+
+
 class ArticleRevision(models.Model):
+    """Snapshot of an article; the text is stored compactly (see :mod:`wiki.revisions`).
+
+    ``content_md`` behaves like a plain field – it can be passed to the
+    constructor and read back – but saved revisions are immutable.
+    """
+
     article = models.ForeignKey(Article, related_name="revisions", on_delete=models.CASCADE)
     title = models.CharField(max_length=200)
     summary = models.TextField(blank=True)
-    content_md = models.TextField()
+    is_keyframe = models.BooleanField(default=True)
+    # keyframe: zlib(JSON text); jinak zlib(JSON delta) vůči ``base``;
+    # RESTRICT: smazání revize by rozbilo řetězec delt, smazání celého článku projde
+    data = models.BinaryField(default=b"")
+    base = models.ForeignKey(
+        "self", null=True, blank=True, on_delete=models.RESTRICT, related_name="+"
+    )
+    keyframe = models.ForeignKey(
+        "self", null=True, blank=True, on_delete=models.RESTRICT, related_name="+"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     author = models.ForeignKey(get_user_model(), null=True, blank=True, on_delete=models.SET_NULL)
 
     class Meta:
         ordering = ["-created_at"]
 
+    @property
+    def content_md(self) -> str:
+        if getattr(self, "_content_md", None) is None:
+            self._content_md = revisions.reconstruct(self) if self.pk else ""
+        return self._content_md
+
+    @content_md.setter
+    def content_md(self, value: str) -> None:
+        if self.pk:
+            raise AttributeError("saved revisions are immutable")
+        self._content_md = value
+
+    def save(self, *args, **kwargs):
+        if self.pk is None:
+            self._encode()
+        super().save(*args, **kwargs)
+
+    def _encode(self) -> None:
+        text = self.content_md
+        previous = (
+            ArticleRevision.objects.filter(article_id=self.article_id)
+            .order_by("-pk")
+            .only("pk", "is_keyframe", "data", "keyframe_id", "base_id")
+            .first()
+        )
+        chain_length = 0
+        if previous is not None and not previous.is_keyframe:
+            chain_length = ArticleRevision.objects.filter(keyframe_id=previous.keyframe_id).count()
+        if previous is None or chain_length + 1 >= revisions.KEYFRAME_INTERVAL:
+            self.is_keyframe = True
+            self.data = revisions.pack_text(text)
+            self.base = self.keyframe = None
+            return
+        self.is_keyframe = False
+        self.data = revisions.make_delta(previous.content_md, text)
+        self.base = previous
+        self.keyframe_id = previous.pk if previous.is_keyframe else previous.keyframe_id
+
     def __str__(self) -> str:  # pragma: no cover - simple repr
         return f"{self.article} @ {self.created_at:%Y-%m-%d %H:%M}"
 
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F
 
 
 class DataCategory(models.Model):
@@ -24,6 +25,8 @@ class DataSeries(models.Model):
     description = models.TextField(blank=True)
     categories = models.ManyToManyField(DataCategory, related_name="series", blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    # zvyšuje se s každou změnou bodů; pack s jinou verzí je zastaralý
+    points_version = models.PositiveBigIntegerField(default=0, editable=False)
 
     class Meta:
         verbose_name_plural = "data series"
@@ -46,3 +49,51 @@ class DataPoint(models.Model):
 
     def __str__(self) -> str:  # pragma: no cover - trivial
         return f"{self.series}:{self.key}={self.value}"
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            bump_points_version([self.series_id])
+
+    def delete(self, *args, **kwargs):
+        series_id = self.series_id
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            bump_points_version([series_id])
+        return result
+
+
+def bump_points_version(series_ids) -> None:
+    """Mark packs of ``series_ids`` stale; call in the transaction writing the points."""
+    DataSeries.objects.filter(pk__in=list(series_ids)).update(
+        points_version=F("points_version") + 1
+    )
+
+
+class DataSeriesPack(models.Model):
+    """Packed copy of a series' points with a precomputed summary.
+
+    Derived from :class:`DataPoint` rows (the source of truth) by
+    :mod:`wiki.packed_data`.  ``version`` is the series' ``points_version`` the
+    pack was built from; saving or deleting a point bumps the series version,
+    so the pack is rebuilt on the next read.  Bulk writes must call
+    :func:`bump_points_version` themselves.
+    """
+
+    series = models.OneToOneField(
+        DataSeries, on_delete=models.CASCADE, primary_key=True, related_name="pack"
+    )
+    keys = models.JSONField(default=list)
+    # int64 little-endian, hodnota * 10**4 (desetinná místa DataPoint.value)
+    values = models.BinaryField()
+    count = models.PositiveIntegerField(default=0)
+    min_value = models.DecimalField(max_digits=20, decimal_places=4, null=True)
+    max_value = models.DecimalField(max_digits=20, decimal_places=4, null=True)
+    sum_value = models.DecimalField(max_digits=30, decimal_places=4, null=True)
+    latest_key = models.CharField(max_length=50, blank=True)
+    latest_value = models.DecimalField(max_digits=20, decimal_places=4, null=True)
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:  # pragma: no cover - trivial
+        return f"pack:{self.series_id} ({self.count})"
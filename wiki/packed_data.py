@@ -0,0 +1,285 @@
+"""Packed (columnar) representation of data series.
+
+A :class:`~wiki.models_data.DataSeriesPack` keeps the sorted keys of a series
+and its values as one int64 array (value × 10⁴, i.e. exact for
+``DataPoint.value``) plus a summary.  Aggregates without a key range come
+straight from the summary, ranged aggregates and chart slices ``bisect`` the
+key list and work on array slices – no per-point rows are loaded.
+
+A pack records the series' ``points_version`` it was built from; packs whose
+version lags behind are treated as missing and rebuilt on read.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import F
+
+from .models_data import DataPoint, DataSeries, DataSeriesPack
+
+SCALE_DIGITS = 4
+_INT64 = 2**63
+
+
+def _to_int(value: Decimal) -> int:
+    return int(value.scaleb(SCALE_DIGITS))
+
+
+def _to_decimal(value: int) -> Decimal:
+    return Decimal(value).scaleb(-SCALE_DIGITS)
+
+
+def _dumps(values: array) -> bytes:
+    if sys.byteorder == "big":  # pragma: no cover - platform dependent
+        values = array("q", values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _loads(blob: bytes) -> array:
+    values = array("q")
+    values.frombytes(bytes(blob))
+    if sys.byteorder == "big":  # pragma: no cover - platform dependent
+        values.byteswap()
+    return values
+
+
+@dataclass
+class PackedSeries:
+    """Sorted keys and scaled integer values of one series."""
+
+    keys: list[str]
+    values: array | list[int]
+
+    @classmethod
+    def from_pack(cls, pack: DataSeriesPack) -> PackedSeries:
+        return cls(keys=list(pack.keys), values=_loads(pack.values))
+
+    def bounds(self, start: str | None = None, end: str | None = None) -> tuple[int, int]:
+        lo = 0 if start is None else bisect_left(self.keys, start)
+        hi = len(self.keys) if end is None else bisect_right(self.keys, end)
+        return lo, max(lo, hi)
+
+    def slice(
+        self, start: str | None = None, end: str | None = None
+    ) -> tuple[list[str], list[Decimal]]:
+        """Keys and values with ``start <= key <= end``."""
+        lo, hi = self.bounds(start, end)
+        return self.keys[lo:hi], [_to_decimal(v) for v in self.values[lo:hi]]
+
+    def downsample(
+        self, start: str | None = None, end: str | None = None, max_points: int | None = None
+    ) -> tuple[list[str], list[Decimal]]:
+        """:meth:`slice` reduced to at most ``max_points`` points with :func:`lttb`."""
+        lo, hi = self.bounds(start, end)
+        if not max_points or hi - lo <= max_points:
+            return self.slice(start, end)
+        window = self.values[lo:hi]
+        kept = lttb([float(v) for v in window], max_points)
+        return [self.keys[lo + i] for i in kept], [_to_decimal(window[i]) for i in kept]
+
+    def aggregate(self, name: str, start: str | None = None, end: str | None = None):
+        lo, hi = self.bounds(start, end)
+        if lo == hi:
+            return None
+        values = self.values[lo:hi]
+        if name == "latest":
+            return _to_decimal(values[-1])
+        if name == "min":
+            return _to_decimal(min(values))
+        if name == "max":
+            return _to_decimal(max(values))
+        if name == "sum":
+            return _to_decimal(sum(values))
+        if name == "avg":
+            return (_to_decimal(sum(values)) / len(values)).quantize(
+                Decimal(1).scaleb(-SCALE_DIGITS)
+            )
+        return None
+
+
+def lttb(values: list[float], threshold: int) -> list[int]:
+    """Indices kept by Largest-Triangle-Three-Buckets downsampling.
+
+    Points are treated as equally spaced.  The first and last point are always
+    kept; from every bucket in between the point spanning the largest triangle
+    with the previously kept point and the next bucket's average wins.
+    """
+
+    n = len(values)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+    kept = [0]
+    every = (n - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        # poslední bucket má za „další“ jen poslední bod
+        next_end = max(min(int((i + 2) * every) + 1, n), end + 1)
+        avg_x = (end + next_end - 1) / 2
+        avg_y = sum(values[end:next_end]) / (next_end - end)
+        ax, ay = a, values[a]
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = abs((ax - avg_x) * (values[j] - ay) - (ax - j) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        kept.append(best)
+        a = best
+    kept.append(n - 1)
+    return kept
+
+
+def summary_aggregate(pack: DataSeriesPack, name: str) -> Decimal | None:
+    """Whole-series aggregate from the stored summary (no unpacking)."""
+    if not pack.count:
+        return None
+    if name == "latest":
+        return pack.latest_value
+    if name == "min":
+        return pack.min_value
+    if name == "max":
+        return pack.max_value
+    if name == "sum":
+        return pack.sum_value
+    if name == "avg":
+        return (pack.sum_value / pack.count).quantize(Decimal(1).scaleb(-SCALE_DIGITS))
+    return None
+
+
+def _build(
+    series_id: int, rows: list[tuple[str, Decimal]], version: int = 0
+) -> tuple[PackedSeries, DataSeriesPack | None]:
+    rows.sort()
+    keys = [k for k, _ in rows]
+    ints = [_to_int(v) for _, v in rows]
+    fits = all(-_INT64 <= v < _INT64 for v in ints)
+    packed = PackedSeries(keys=keys, values=array("q", ints) if fits else ints)
+    pack = DataSeriesPack(
+        series_id=series_id,
+        keys=keys,
+        values=_dumps(packed.values) if fits else b"",
+        count=len(rows),
+        min_value=min((v for _, v in rows), default=None),
+        max_value=max((v for _, v in rows), default=None),
+        sum_value=_to_decimal(sum(ints)) if rows else None,
+        latest_key=keys[-1] if keys else "",
+        latest_value=rows[-1][1] if rows else None,
+        version=version,
+    )
+    # hodnoty mimo int64 se neukládají – řada se pak pokaždé skládá z řádků
+    return packed, pack if fits else None
+
+
+def _load_rows(series_ids: Iterable[int]) -> dict[int, list[tuple[str, Decimal]]]:
+    rows: dict[int, list[tuple[str, Decimal]]] = {sid: [] for sid in series_ids}
+    qs = DataPoint.objects.filter(series_id__in=list(rows)).order_by()
+    for sid, key, value in qs.values_list("series_id", "key", "value").iterator(chunk_size=5000):
+        rows[sid].append((key, value))
+    return rows
+
+
+PACK_FIELDS = [
+    "keys",
+    "values",
+    "count",
+    "min_value",
+    "max_value",
+    "sum_value",
+    "latest_key",
+    "latest_value",
+    "version",
+    "updated_at",
+]
+
+
+def refresh_packs(series_ids: Iterable[int]) -> dict[int, PackedSeries]:
+    """Rebuild packs of ``series_ids`` from their rows (one read query)."""
+    series_ids = set(series_ids)
+    out: dict[int, PackedSeries] = {}
+    if not series_ids:
+        return out
+    packs: list[DataSeriesPack] = []
+    unfit: list[int] = []
+    with transaction.atomic():
+        # verze se čte před body: souběžný zápis ji zvýší a pack zůstane zastaralý
+        versions = dict(
+            DataSeries.objects.filter(pk__in=series_ids).values_list("pk", "points_version")
+        )
+        for sid, series_rows in _load_rows(series_ids).items():
+            out[sid], pack = _build(sid, series_rows, versions.get(sid, 0))
+            if pack is not None:
+                packs.append(pack)
+            else:
+                unfit.append(sid)
+        if unfit:
+            DataSeriesPack.objects.filter(series_id__in=unfit).delete()
+        # souběžné první čtení téže řady nesmí skončit IntegrityError
+        DataSeriesPack.objects.bulk_create(
+            [p for p in packs if p.series_id in versions],
+            update_conflicts=True,
+            unique_fields=["series"],
+            update_fields=PACK_FIELDS,
+        )
+    return out
+
+
+def get_packs(series_ids: Iterable[int]) -> dict[int, DataSeriesPack | PackedSeries]:
+    """Current stored packs of ``series_ids``; missing or stale ones are rebuilt.
+
+    Returns the :class:`DataSeriesPack` row when it exists (so callers can use
+    the summary) and a :class:`PackedSeries` for freshly built series.
+    """
+    series_ids = set(series_ids)
+    found: dict[int, DataSeriesPack | PackedSeries] = {
+        pack.series_id: pack
+        for pack in DataSeriesPack.objects.filter(
+            series_id__in=series_ids, version=F("series__points_version")
+        )
+    }
+    missing = series_ids - found.keys()
+    if missing:
+        found.update(refresh_packs(missing))
+    return found
+
+
+def split_range(range_part: str) -> tuple[str, str]:
+    """Split ``"2000-2010"`` or ``"2020-01-01-2020-03-31"`` into its bounds."""
+    parts = range_part.split("-")
+    if len(parts) % 2:
+        raise ValueError(f"invalid key range: {range_part!r}")
+    half = len(parts) // 2
+    return "-".join(parts[:half]), "-".join(parts[half:])
+
+
+def packed(item: DataSeriesPack | PackedSeries) -> PackedSeries:
+    return item if isinstance(item, PackedSeries) else PackedSeries.from_pack(item)
+
+
+def aggregate(item: DataSeriesPack | PackedSeries, agg: str) -> Decimal | None:
+    """Evaluate ``agg`` (``sum``, ``max:2000-2010`` …) over a packed series."""
+    name, range_part = agg.split(":", 1) if ":" in agg else (agg, None)
+    if range_part is None and isinstance(item, DataSeriesPack):
+        return summary_aggregate(item, name)
+    start, end = split_range(range_part) if range_part else (None, None)
+    return packed(item).aggregate(name, start, end)
+
+
+__all__ = [
+    "PackedSeries",
+    "aggregate",
+    "get_packs",
+    "lttb",
+    "packed",
+    "refresh_packs",
+    "split_range",
+    "summary_aggregate",
+]
@@ -0,0 +1,154 @@
+"""Compact storage and diffs of article revisions.
+
+Revisions form a forward chain per article: every ``KEYFRAME_INTERVAL``-th
+revision is a keyframe holding the whole text, the ones in between store only
+a line delta against their predecessor.  Payloads are zlib-compressed JSON.
+Reconstruction loads the chain back to the keyframe in a single query.
+
+Diffs are unified, line based and cached per revision pair – revisions never
+change, so the cache needs no invalidation.  Diffs against the article's
+current text are keyed on its ``updated_at`` as well.
+"""
+
+from __future__ import annotations
+
+import difflib
+import json
+import zlib
+
+from django.core.cache import cache
+from django.db.models import Q
+
+# Každá n-tá revize nese celý text; delší řetězce delt by zpomalily čtení.
+KEYFRAME_INTERVAL = 10
+DIFF_CACHE_TTL = 60 * 60 * 24
+DIFF_CONTEXT_LINES = 3
+
+
+def pack_text(text: str) -> bytes:
+    return zlib.compress(json.dumps(text).encode())
+
+
+def make_delta(base: str, text: str) -> bytes:
+    """Ops turning ``base`` into ``text``: ``[i1, i2]`` copies base lines, a list of
+    strings inserts new lines."""
+    old = base.splitlines(keepends=True)
+    new = text.splitlines(keepends=True)
+    ops: list = []
+    matcher = difflib.SequenceMatcher(None, old, new, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append([i1, i2])
+        elif j2 > j1:
+            ops.append({"+": new[j1:j2]})
+    return zlib.compress(json.dumps(ops).encode())
+
+
+def apply_delta(base: str, delta: bytes) -> str:
+    old = base.splitlines(keepends=True)
+    out: list[str] = []
+    for op in json.loads(zlib.decompress(delta)):
+        if isinstance(op, dict):
+            out.extend(op["+"])
+        else:
+            out.extend(old[op[0] : op[1]])
+    return "".join(out)
+
+
+def unpack_text(data: bytes) -> str:
+    return json.loads(zlib.decompress(data))
+
+
+def reconstruct(revision) -> str:
+    """Text of a saved ``revision`` rebuilt from its keyframe and deltas."""
+    if revision.is_keyframe:
+        return unpack_text(bytes(revision.data))
+    keyframe_id = revision.keyframe_id
+    rows = (
+        type(revision)
+        .objects.filter(Q(pk=keyframe_id) | Q(keyframe_id=keyframe_id), pk__lte=revision.pk)
+        .values_list("pk", "base_id", "is_keyframe", "data")
+    )
+    chain = {pk: (base_id, is_keyframe, bytes(data)) for pk, base_id, is_keyframe, data in rows}
+    steps = []
+    pk = revision.pk
+    while True:
+        base_id, is_keyframe, data = chain[pk]
+        if is_keyframe:
+            text = unpack_text(data)
+            break
+        steps.append(data)
+        pk = base_id
+    for delta in reversed(steps):
+        text = apply_delta(text, delta)
+    return text
+
+
+def _stamp(obj, at) -> str:
+    # čas chrání před znovu použitým pk (SQLite po smazání článku)
+    return f"{obj.pk}-{at.timestamp():.6f}"
+
+
+def _diff_lines(key: str, old, new, fromfile: str, tofile: str) -> list[tuple[str, str]]:
+    """``content_md`` of ``old``/``new`` is read (reconstructed) only on a cache miss."""
+    text = cache.get(key)
+    if text is None:
+        text = "\n".join(
+            difflib.unified_diff(
+                old.content_md.splitlines(),
+                new.content_md.splitlines(),
+                fromfile=fromfile,
+                tofile=tofile,
+                n=DIFF_CONTEXT_LINES,
+                lineterm="",
+            )
+        )
+        cache.set(key, text, DIFF_CACHE_TTL)
+    lines = []
+    for line in text.splitlines():
+        if line.startswith(("---", "+++")):
+            css = "diff-file"
+        elif line.startswith("@@"):
+            css = "diff-hunk"
+        elif line.startswith("+"):
+            css = "diff-add"
+        elif line.startswith("-"):
+            css = "diff-del"
+        else:
+            css = "diff-ctx"
+        lines.append((css, line))
+    return lines
+
+
+def unified_diff(old_rev, new_rev) -> list[tuple[str, str]]:
+    """``(css class, line)`` pairs of a unified diff from ``old_rev`` to ``new_rev``."""
+    key = "wiki:revdiff:" + ":".join(_stamp(rev, rev.created_at) for rev in (old_rev, new_rev))
+    return _diff_lines(
+        key,
+        old_rev,
+        new_rev,
+        f"r{old_rev.pk}",
+        f"r{new_rev.pk}",
+    )
+
+
+def diff_to_current(rev, article) -> list[tuple[str, str]]:
+    """Like :func:`unified_diff`, against the article's current text.
+
+    Keyed on the article's ``updated_at``, so edits that create no revision
+    (Django admin) show up immediately.
+    """
+    key = f"wiki:revdiff:{_stamp(rev, rev.created_at)}:a{_stamp(article, article.updated_at)}"
+    return _diff_lines(key, rev, article, f"r{rev.pk}", "current")
+
+
+__all__ = [
+    "KEYFRAME_INTERVAL",
+    "apply_delta",
+    "diff_to_current",
+    "make_delta",
+    "pack_text",
+    "reconstruct",
+    "unified_diff",
+    "unpack_text",
+]
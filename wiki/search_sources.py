@@ -0,0 +1,23 @@
+from search.registry import SearchSource, recency, register
+
+from .models import Article
+
+register(
+    SearchSource(
+        name="wiki.article",
+        model=Article,
+        type="Wiki",
+        source="wiki",
+        queryset=lambda: Article.objects.filter(is_deleted=False),
+        title=lambda a: a.title,
+        url=lambda a: a.get_absolute_url(),
+        snippet=lambda a: (a.summary or a.content_md or "")[:180],
+        content=lambda a: a.summary or a.content_md or "",
+        date=lambda a: a.updated_at,
+        search_fields=("title", "summary", "content_md"),
+        slug_field="slug",
+        ordering=("-updated_at",),
+        include=lambda a: not a.is_deleted,
+        popularity=lambda a: recency(a.updated_at),
+    )
+)
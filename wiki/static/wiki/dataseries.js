@@ -5,14 +5,15 @@ document.addEventListener('DOMContentLoaded', () => {
     const from = el.dataset.from || null;
     const to = el.dataset.to || null;
     const height = parseInt(el.dataset.height || '200', 10);
-    fetch(`/api/dataseries/${slug}/`)
+    // server vrací jen rozsah a nejvýš tolik bodů, kolik graf zobrazí
+    const maxPoints = parseInt(el.dataset.maxPoints || '', 10) || Math.max(el.clientWidth, 100);
+    const params = new URLSearchParams({ max_points: String(maxPoints) });
+    if (from) params.set('from', from);
+    if (to) params.set('to', to);
+    fetch(`/api/dataseries/${slug}/?${params}`)
       .then((r) => r.json())
       .then((data) => {
-        const points = data.points.filter((p) => {
-          if (from && p.key < from) return false;
-          if (to && p.key > to) return false;
-          return true;
-        });
+        const points = data.points;
         const labels = points.map((p) => p.key);
         const values = points.map((p) => parseFloat(p.value));
         const canvas = document.createElement('canvas');
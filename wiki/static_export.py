@@ -0,0 +1,261 @@
+"""Incremental static HTML export of the wiki.
+
+Articles, category pages and tag pages are rendered into a directory tree
+that mirrors the ``/wiki/`` URLs (``<slug>/index.html``,
+``categories/<slug>/index.html``, ``tags/<slug>/index.html``).  Each page has
+an input hash – its own fields and tag names, the export templates, the
+existence of its link targets, the schema and template of its infobox types
+and the points version of the data series it shows (directly or through a
+category table) – stored in ``manifest.json``.  A later export renders only
+pages whose hash changed and removes pages that disappeared.  Articles render
+in a process pool.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connection, connections
+from django.db.models import Prefetch
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template, render_to_string
+from django.utils import timezone
+
+from .infoboxes.parser import INFOBOX_RE
+from .links import extract_slugs
+from .models import Article, ArticleLink, Category, CategoryArticle, Tag
+from .models_data import DataSeries
+from .utils_data import DATA_PATTERN, TABLE_PATTERN
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+TEMPLATES = {
+    "article": "wiki/export/article.html",
+    "listing": "wiki/export/listing.html",
+}
+
+
+def _digest(*parts) -> str:
+    raw = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _templates_hash() -> str:
+    sources = []
+    for name in [*TEMPLATES.values(), "wiki/export/base.html"]:
+        origin = get_template(name).origin
+        sources.append(Path(origin.name).read_text(encoding="utf-8"))
+    return _digest(MANIFEST_VERSION, sources)
+
+
+def _series_fingerprints() -> dict[str, tuple]:
+    """Series slug → (points version, title, unit); no scan of the points."""
+    rows = DataSeries.objects.values_list("slug", "points_version", "title", "unit")
+    return {slug: rest for slug, *rest in rows}
+
+
+def _category_members() -> dict[str, list[str]]:
+    """Data category slug → slugs of its series (``{{table:…}}`` shortcodes)."""
+    out: dict[str, list[str]] = {}
+    rows = DataSeries.categories.through.objects.values_list(
+        "datacategory__slug", "dataseries__slug"
+    ).order_by("dataseries__slug")
+    for category, series in rows:
+        out.setdefault(category, []).append(series)
+    return out
+
+
+def _infobox_hash(ibox_type: str, memo: dict[str, str]) -> str:
+    """Digest of the schema file and template of one infobox type."""
+    if ibox_type not in memo:
+        sources = []
+        schema = Path(settings.BASE_DIR) / "infoboxes" / f"{ibox_type}.schema.json"
+        sources.append(schema.read_text(encoding="utf-8") if schema.exists() else None)
+        try:
+            origin = get_template(f"infoboxes/{ibox_type}.html").origin
+            sources.append(Path(origin.name).read_text(encoding="utf-8"))
+        except TemplateDoesNotExist:
+            sources.append(None)
+        memo[ibox_type] = _digest(sources)
+    return memo[ibox_type]
+
+
+def _live_targets() -> dict[int, list[str]]:
+    out: dict[int, list[str]] = {}
+    rows = ArticleLink.objects.filter(target__is_deleted=False, target__isnull=False)
+    for source_id, slug in rows.values_list("source_id", "target_slug").order_by("target_slug"):
+        out.setdefault(source_id, []).append(slug)
+    return out
+
+
+def _article_path(slug: str) -> str:
+    return f"{slug}/index.html"
+
+
+def _write(root: Path, rel: str, html: str) -> None:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(html, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def render_article(pk: int) -> str:
+    article = Article.objects.prefetch_related("tags").get(pk=pk)
+    return render_to_string(TEMPLATES["article"], {"article": article})
+
+
+def _render_articles(root: str, items: list[tuple[int, str]]) -> int:
+    """Render and write ``(pk, relative path)`` pairs."""
+    for pk, rel in items:
+        _write(Path(root), rel, render_article(pk))
+    return len(items)
+
+
+def _init_worker() -> None:
+    import django
+
+    django.setup()
+
+
+def _pooled(root: str, items: list[tuple[int, str]]) -> int:
+    try:
+        return _render_articles(root, items)
+    finally:
+        # procesy poolu si drží vlastní spojení – po úloze je zavřít
+        connections.close_all()
+
+
+@dataclass
+class ExportResult:
+    rendered: list[str] = field(default_factory=list)
+    unchanged: int = 0
+    removed: list[str] = field(default_factory=list)
+
+
+def export_site(
+    output: Path,
+    *,
+    workers: int = 1,
+    force: bool = False,
+    progress: Callable[[str], None] | None = None,
+) -> ExportResult:
+    output = Path(output)
+    output.mkdir(parents=True, exist_ok=True)
+    manifest_path = output / MANIFEST_NAME
+    previous: dict = {}
+    if manifest_path.exists() and not force:
+        previous = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if previous.get("version") != MANIFEST_VERSION:
+            previous = {}
+    old_pages: dict[str, dict] = previous.get("pages", {})
+
+    base_hash = _templates_hash()
+    series = _series_fingerprints()
+    tables_of = _category_members()
+    targets = _live_targets()
+    infoboxes: dict[str, str] = {}
+    pages: dict[str, dict] = {}
+    article_jobs: list[tuple[int, str]] = []
+    listing_jobs: list[tuple[str, str, dict]] = []
+
+    articles = list(
+        Article.objects.filter(is_deleted=False, status="published")
+        .prefetch_related("tags")
+        .order_by("title")
+    )
+    for article in articles:
+        content = article.content_md
+        used_series = sorted({m.group("slug") for m in DATA_PATTERN.finditer(content)})
+        tables = sorted({m.group("slug") for m in TABLE_PATTERN.finditer(content)})
+        ibox_types = sorted({m.group(1) for m in INFOBOX_RE.finditer(content)})
+        digest = _digest(
+            base_hash,
+            article.title,
+            article.summary,
+            content,
+            [(t.slug, t.name) for t in article.tags.all()],
+            targets.get(article.pk, []),
+            [(s, series.get(s)) for s in used_series],
+            [(c, [(s, series.get(s)) for s in tables_of.get(c, [])]) for c in tables],
+            [(t, _infobox_hash(t, infoboxes)) for t in ibox_types],
+            extract_slugs(content),
+        )
+        rel = _article_path(article.slug)
+        pages[rel] = {"kind": "article", "title": article.title, "hash": digest}
+        if old_pages.get(rel, {}).get("hash") != digest or not (output / rel).exists():
+            article_jobs.append((article.pk, rel))
+
+    listed = {a.pk: a for a in articles}
+    groups = []
+    # stejné pořadí v každém běhu, jinak by se hash výpisu měnil bez změny dat
+    ordered = CategoryArticle.objects.order_by("order", "article_id")
+    for category in Category.objects.prefetch_related(
+        Prefetch("categoryarticle_set", queryset=ordered)
+    ).order_by("slug"):
+        members = [
+            listed[ca.article_id]
+            for ca in category.categoryarticle_set.all()
+            if ca.article_id in listed
+        ]
+        groups.append(("category", f"categories/{category.slug}/index.html", category, members))
+    for tag in Tag.objects.prefetch_related("article_set").order_by("name"):
+        members = sorted(
+            (listed[a.pk] for a in tag.article_set.all() if a.pk in listed), key=lambda a: a.title
+        )
+        groups.append(("tag", f"tags/{tag.slug}/index.html", tag, members))
+    for kind, rel, obj, members in groups:
+        digest = _digest(base_hash, kind, obj.name, [(a.slug, a.title) for a in members])
+        pages[rel] = {"kind": kind, "title": obj.name, "hash": digest}
+        if old_pages.get(rel, {}).get("hash") != digest or not (output / rel).exists():
+            listing_jobs.append((rel, obj.name, {"kind": kind, "articles": members}))
+
+    result = ExportResult(unchanged=len(pages) - len(article_jobs) - len(listing_jobs))
+
+    if article_jobs:
+        # v otevřené transakci (testy) by jiné procesy neviděly neuložená data
+        if workers > 1 and len(article_jobs) > 1 and not connection.in_atomic_block:
+            connections.close_all()
+            chunks = [c for c in (article_jobs[i::workers] for i in range(workers)) if c]
+            with ProcessPoolExecutor(max_workers=len(chunks), initializer=_init_worker) as pool:
+                for done in pool.map(_pooled, [str(output)] * len(chunks), chunks):
+                    if progress:
+                        progress(f"{done} articles rendered")
+        else:
+            _render_articles(str(output), article_jobs)
+            if progress:
+                progress(f"{len(article_jobs)} articles rendered")
+        result.rendered += [rel for _, rel in article_jobs]
+
+    for rel, title, context in listing_jobs:
+        html = render_to_string(TEMPLATES["listing"], {"title": title, **context})
+        _write(output, rel, html)
+        result.rendered.append(rel)
+
+    for rel in sorted(old_pages.keys() - pages.keys()):
+        path = output / rel
+        if path.resolve().is_relative_to(output.resolve()):
+            path.unlink(missing_ok=True)
+            try:
+                path.parent.rmdir()
+            except OSError:
+                pass  # adresář není prázdný (např. vnořené stránky)
+        result.removed.append(rel)
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "generated_at": timezone.now().isoformat(),
+        "pages": pages,
+    }
+    _write(output, MANIFEST_NAME, json.dumps(manifest, indent=2, ensure_ascii=False))
+    return result
+
+
+__all__ = ["ExportResult", "MANIFEST_NAME", "export_site", "render_article"]
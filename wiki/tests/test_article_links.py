@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from wiki.links import backlinks, extract_slugs
+from wiki.models import Article, ArticleLink
+
+
+def test_extract_slugs():
+    assert extract_slugs("[[Praha]], [[praha|město]] a [[Brno]]") == ["praha", "brno"]
+
+
+@pytest.mark.django_db
+def test_links_follow_saves_and_targets():
+    cache.clear()
+    a = Article.objects.create(title="A", content_md="[[B]] a [[C|céčko]]")
+    links = dict(ArticleLink.objects.filter(source=a).values_list("target_slug", "target_id"))
+    assert links == {"b": None, "c": None}
+    assert a.content_html().count(" new") == 2
+
+    b = Article.objects.create(title="B", content_md="zpět na [[A]]")
+    assert ArticleLink.objects.get(source=a, target_slug="b").target == b
+    assert ArticleLink.objects.get(source=b, target_slug="a").target == a
+    a = Article.objects.get(pk=a.pk)
+    assert a.content_html().count(" new") == 1  # cache stránky A zahozena cíleně
+
+    b.slug = "b2"
+    b.save()
+    assert ArticleLink.objects.get(source=a, target_slug="b").target is None
+    assert a.content_html().count(" new") == 2
+
+    a.content_md = "jen [[B2]]"
+    a.save()
+    assert list(backlinks(b)) == [a]
+    assert list(ArticleLink.objects.filter(source=a).values_list("target_slug", flat=True)) == [
+        "b2"
+    ]
+
+
+@pytest.mark.django_db
+def test_render_uses_cache_and_soft_delete_turns_link_red():
+    cache.clear()
+    target = Article.objects.create(title="Cíl", content_md="x")
+    source = Article.objects.create(title="Zdroj", content_md="[[Cíl]] " * 50)
+    source.content_html()
+    source = Article.objects.get(pk=source.pk)
+    with CaptureQueriesContext(connection) as ctx:
+        html = source.content_html()
+    assert len(ctx) == 0
+    assert " new" not in html
+
+    target.is_deleted = True
+    target.save()
+    assert " new" in Article.objects.get(pk=source.pk).content_html()
+
+
+@pytest.mark.django_db
+def test_backlinks_page(client):
+    target = Article.objects.create(title="T", content_md="x")
+    Article.objects.create(title="S1", content_md="[[T]]")
+    Article.objects.create(title="S2", content_md="[[t|tady]]", is_deleted=True)
+    resp = client.get(reverse("wiki:article-backlinks", args=[target.slug]))
+    assert resp.status_code == 200
+    assert "S1" in resp.text and "S2" not in resp.text
+
+
+@pytest.mark.django_db
+def test_hard_delete_turns_cached_links_red():
+    cache.clear()
+    target = Article.objects.create(title="Cíl", content_md="x")
+    source = Article.objects.create(title="Zdroj", content_md="[[Cíl]]")
+    assert " new" not in source.content_html()
+
+    target.delete()
+    assert ArticleLink.objects.get(source=source).target is None
+    assert " new" in Article.objects.get(pk=source.pk).content_html()
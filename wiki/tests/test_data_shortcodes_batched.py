@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from wiki.models_data import DataPoint, DataSeries
+from wiki.utils_data import replace_data_shortcodes
+
+
+def _series(slug: str, values: dict[str, int], unit: str = "") -> DataSeries:
+    series = DataSeries.objects.create(slug=slug, unit=unit)
+    DataPoint.objects.bulk_create(
+        DataPoint(series=series, key=k, value=v) for k, v in values.items()
+    )
+    return series
+
+
+@pytest.mark.django_db
+def test_query_count_does_not_grow_with_shortcodes():
+    cache.clear()
+    for i in range(10):
+        _series(f"s{i}", {"2000": i, "2001": i + 10, "2002": i + 20})
+
+    one = "{{data:s0|2000}} {{data:s0|agg=sum}}"
+    many = " ".join(
+        f"{{{{data:s{i}|2001}}}} {{{{data:s{i}|agg=max}}}} {{{{data:s{i}|agg=sum:2000-2001}}}}"
+        for i in range(10)
+    )
+    with CaptureQueriesContext(connection) as small:
+        replace_data_shortcodes(one)
+    cache.clear()
+    with CaptureQueriesContext(connection) as large:
+        html = replace_data_shortcodes(many + " {{data:missing|2000|default=?}}")
+    assert len(large) == len(small)
+    assert html.split()[:3] == ["10", "20", "10"]
+    assert html.endswith("?")
+
+    with CaptureQueriesContext(connection) as cached:
+        assert replace_data_shortcodes(many + " {{data:missing|2000|default=?}}") == html
+    assert len(cached) == 0
+
+    # packy už existují: řady, hodnoty klíčů, packy
+    cache.clear()
+    with CaptureQueriesContext(connection) as packed:
+        assert replace_data_shortcodes(many + " {{data:missing|2000|default=?}}") == html
+    assert len(packed) == 3
+
+
+@pytest.mark.django_db
+def test_aggregates_and_per_shortcode_params():
+    cache.clear()
+    _series("gdp", {"2018": 5, "2019": 2, "2020": 7}, unit="bn")
+    html = replace_data_shortcodes(
+        "{{data:gdp|agg=latest}}|{{data:gdp|agg=min}}|{{data:gdp|agg=max:2018-2019}}"
+        "|{{data:gdp|agg=sum:2019-2020}}|{{data:gdp|2019|unit=x}}|{{data:gdp|2019}}"
+        "|{{data:gdp|agg=sum:2030-2031|default=n/a}}"
+    )
+    assert html.split("|") == ["7 bn", "2 bn", "5 bn", "9 bn", "2 x", "2 bn", "n/a"]
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import math
+from decimal import Decimal
+
+import pytest
+
+from wiki.models_data import DataPoint, DataSeries
+from wiki.packed_data import lttb
+
+
+@pytest.fixture
+def wave():
+    series = DataSeries.objects.create(slug="wave", title="Wave")
+    DataPoint.objects.bulk_create(
+        DataPoint(series=series, key=f"{i:05d}", value=Decimal(round(math.sin(i / 50) * 100, 2)))
+        for i in range(2000)
+    )
+    DataPoint.objects.filter(series=series, key="00100").update(note="peak")
+    return series
+
+
+def test_lttb_keeps_ends_and_spikes():
+    values = [0.0] * 100
+    values[37] = 50.0
+    kept = lttb(values, 10)
+    assert len(kept) == 10
+    assert kept[0] == 0 and kept[-1] == 99
+    assert 37 in kept
+    assert lttb(values, 200) == list(range(100))
+
+
+@pytest.mark.django_db
+def test_range_and_downsampling(client, wave):
+    resp = client.get("/api/dataseries/wave/?from=00100&to=00199")
+    data = resp.json()
+    assert len(data["points"]) == data["total_points"] == 100
+    assert data["points"][0] == {"key": "00100", "value": "90.9300", "note": "peak"}
+    assert not data["downsampled"]
+
+    resp = client.get("/api/dataseries/wave/?max_points=300")
+    data = resp.json()
+    assert len(data["points"]) == 300
+    assert data["downsampled"] and data["total_points"] == 2000
+    assert data["points"][-1]["key"] == "01999"
+
+    assert client.get("/api/dataseries/wave/?max_points=x").status_code == 400
+
+
+@pytest.mark.django_db
+def test_cache_headers_and_etag(client, wave):
+    resp = client.get("/api/dataseries/wave/?max_points=50")
+    assert "max-age=300" in resp["Cache-Control"]
+    assert "public" in resp["Cache-Control"]
+    etag = resp["ETag"]
+    resp = client.get("/api/dataseries/wave/?max_points=50", HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == 304
+
+    point = wave.points.get(key="01999")
+    point.value = Decimal("1")
+    point.save()
+    resp = client.get("/api/dataseries/wave/?max_points=50", HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == 200
+    assert resp.json()["points"][-1]["value"] == "1.0000"
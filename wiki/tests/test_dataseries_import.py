@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import io
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+
+from wiki.models_data import DataPoint, DataSeries
+from wiki.utils_data import import_csv, import_csv_to_series
+
+
+@pytest.mark.django_db
+def test_import_csv_chunks_and_counts():
+    series = DataSeries.objects.create(slug="census")
+    DataPoint.objects.create(series=series, key="0001", value=1, note="keep")
+    rows = "\n".join(f"{i:04d};{i}" for i in range(1, 251))
+    seen = []
+    stats = import_csv(
+        io.StringIO("key;value\n" + rows + "\n0002;7\n"),
+        series,
+        chunk_size=100,
+        progress=lambda s: seen.append(s.rows),
+    )
+    assert seen == [100, 200, 251]
+    assert (stats.created, stats.updated) == (249, 2)
+    assert series.points.count() == 250
+    first = series.points.get(key="0001")
+    assert first.note == "keep"
+    assert series.points.get(key="0002").value == Decimal("7")
+
+
+@pytest.mark.django_db
+def test_import_multiple_series_per_file():
+    DataSeries.objects.create(slug="a")
+    data = "series;key;value\na;2020;1\nb;2020;2\nb;2021;3\n"
+    stats = import_csv(io.StringIO(data))
+    assert stats.series == {"a", "b"}
+    assert DataSeries.objects.get(slug="b").points.count() == 2
+    assert import_csv_to_series(DataSeries.objects.get(slug="a"), io.StringIO("2020;5\n")) == (
+        0,
+        1,
+    )
+
+
+@pytest.mark.django_db
+def test_management_command_multi_series(tmp_path, capsys):
+    file_path = tmp_path / "data.csv"
+    file_path.write_text("x;1;1\ny;1;2\n", encoding="utf-8")
+    call_command("import_dataseries", file=file_path, chunk_size=1, verbosity=2)
+    out = capsys.readouterr().out
+    assert "1 rows: 1 created, 0 updated" in out
+    assert "Imported 2 created, 0 updated (2 series)" in out
+    assert DataPoint.objects.filter(series__slug__in=["x", "y"]).count() == 2
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import io
+from decimal import Decimal
+
+import pytest
+
+from wiki.models_data import DataPoint, DataSeries, DataSeriesPack
+from wiki.packed_data import PackedSeries, aggregate, get_packs, packed, refresh_packs
+from wiki.utils_data import import_csv
+
+
+@pytest.fixture
+def daily():
+    series = DataSeries.objects.create(slug="daily")
+    DataPoint.objects.bulk_create(
+        DataPoint(series=series, key=f"2020-01-{day:02d}", value=Decimal(day) / 4)
+        for day in range(1, 32)
+    )
+    return series
+
+
+@pytest.mark.django_db
+def test_pack_summary_and_ranges(daily):
+    pack = get_packs([daily.pk])[daily.pk]
+    assert isinstance(pack, PackedSeries)
+    stored = DataSeriesPack.objects.get(series=daily)
+    assert (stored.count, stored.latest_key) == (31, "2020-01-31")
+    assert aggregate(stored, "sum") == Decimal("124")
+    assert aggregate(stored, "avg") == Decimal("4.0000")
+    assert aggregate(stored, "latest") == Decimal("7.75")
+    assert aggregate(stored, "max:2020-01-02-2020-01-03") == Decimal("0.75")
+    assert aggregate(pack, "min") == Decimal("0.25")
+
+    keys, values = packed(stored).slice("2020-01-10", "2020-01-12")
+    assert keys == ["2020-01-10", "2020-01-11", "2020-01-12"]
+    assert values == [Decimal("2.5"), Decimal("2.75"), Decimal("3")]
+
+
+@pytest.mark.django_db
+def test_point_writes_make_pack_stale(daily):
+    get_packs([daily.pk])
+    point = daily.points.get(key="2020-01-05")
+    point.value = Decimal("100")
+    point.save()
+    daily.refresh_from_db()
+    assert DataSeriesPack.objects.get(series=daily).version < daily.points_version
+    assert aggregate(get_packs([daily.pk])[daily.pk], "max") == Decimal("100")
+    assert DataSeriesPack.objects.get(series=daily).version == daily.points_version
+
+    point.delete()
+    assert aggregate(get_packs([daily.pk])[daily.pk], "max") == Decimal("7.75")
+    # opakované sestavení přepíše uložený pack místo chyby na unikátním klíči
+    refresh_packs([daily.pk])
+    assert DataSeriesPack.objects.filter(series=daily).count() == 1
+
+
+@pytest.mark.django_db
+def test_import_refreshes_pack():
+    series = DataSeries.objects.create(slug="imp")
+    import_csv(io.StringIO("1;1\n2;2\n"), series)
+    assert DataSeriesPack.objects.get(series=series).sum_value == Decimal("3")
+    import_csv(io.StringIO("2;5\n"), series)
+    assert DataSeriesPack.objects.get(series=series).sum_value == Decimal("6")
+
+
+@pytest.mark.django_db
+def test_failed_import_refreshes_committed_chunks():
+    series = DataSeries.objects.create(slug="imp")
+    import_csv(io.StringIO("1;1\n2;2\n"), series)
+    with pytest.raises(ArithmeticError):
+        import_csv(io.StringIO("3;100\n4;oops\n"), series, chunk_size=1)
+    assert DataSeriesPack.objects.get(series=series).sum_value == Decimal("103")
+    assert aggregate(get_packs([series.pk])[series.pk], "sum") == Decimal("103")
+
+
+@pytest.mark.django_db
+def test_values_outside_int64_are_not_stored():
+    series = DataSeries.objects.create(slug="huge")
+    DataPoint.objects.create(series=series, key="a", value=Decimal("999999999999999"))
+    DataPoint.objects.create(series=series, key="b", value=Decimal("1"))
+    result = get_packs([series.pk])[series.pk]
+    assert aggregate(result, "sum") == Decimal("1000000000000000")
+    assert not DataSeriesPack.objects.filter(series=series).exists()
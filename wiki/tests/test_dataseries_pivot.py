@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from wiki.models_data import DataCategory, DataPoint, DataSeries
+from wiki.utils_data import (
+    MAX_KEYS,
+    get_series_by_category,
+    get_values_for_keys,
+    parse_keys,
+    replace_data_shortcodes,
+)
+
+
+@pytest.fixture
+def countries():
+    cat = DataCategory.objects.create(slug="gdp")
+    for i in range(30):
+        series = DataSeries.objects.create(slug=f"gdp/c{i:02d}", title=f"C{i:02d}", unit="bn")
+        series.categories.add(cat)
+        DataPoint.objects.bulk_create(
+            DataPoint(series=series, key=str(year), value=Decimal(i * 100 + year - 2000))
+            for year in range(2000, 2020)
+            if not (i == 0 and year == 2019)
+        )
+    return cat
+
+
+def test_parse_keys():
+    assert parse_keys("2018-2020") == ["2018", "2019", "2020"]
+    assert parse_keys("2018, 2020") == ["2018", "2020"]
+    assert parse_keys("1990-Q1") == ["1990-Q1"]
+    assert len(parse_keys(f"2000-{2000 + MAX_KEYS - 1}")) == MAX_KEYS
+    with pytest.raises(ValueError):
+        parse_keys("0-99999999")
+    with pytest.raises(ValueError):
+        parse_keys(",".join(str(y) for y in range(MAX_KEYS + 1)))
+
+
+@pytest.mark.django_db
+def test_values_for_keys_is_one_query(countries):
+    with CaptureQueriesContext(connection) as ctx:
+        rows = get_values_for_keys(get_series_by_category("gdp"), parse_keys("2000-2019"))
+    assert len(ctx) == 1
+    assert len(rows) == 30
+    values = {s.slug: v for s, v in rows}
+    assert values["gdp/c01"]["2005"] == Decimal("105")
+    assert values["gdp/c00"]["2019"] is None
+
+
+@pytest.mark.django_db
+def test_table_shortcode_multi_year(countries):
+    cache.clear()
+    with CaptureQueriesContext(connection) as ctx:
+        html = replace_data_shortcodes("{{table:gdp|years=2018-2019|sort=value|desc=1|limit=3}}")
+    assert len(ctx) == 1
+    assert "<th>Hodnota (2018)</th><th>Hodnota (2019)</th>" in html
+    assert "<tr><td>C29</td><td>2918</td><td>2919</td></tr>" in html
+    assert html.index("C29") < html.index("C28")
+
+
+@pytest.mark.django_db
+def test_category_api_years(client, countries):
+    with CaptureQueriesContext(connection) as ctx:
+        resp = client.get("/api/dataseries/category/gdp/?years=2018,2019&ordering=slug&limit=1")
+    assert len([q for q in ctx if "wiki_datapoint" in q["sql"]]) == 1
+    item = resp.json()["results"][0]
+    assert item["slug"] == "gdp/c00"
+    assert item["values"] == {"2018": "18.0000", "2019": None}
+
+
+@pytest.mark.django_db
+def test_too_many_keys_are_rejected(client, countries):
+    cache.clear()
+    resp = client.get("/api/dataseries/category/gdp/?years=1-3000")
+    assert resp.status_code == 400
+    assert "years" in resp.json()
+    assert replace_data_shortcodes("{{table:gdp|years=0-99999999}}") == ""
@@ -0,0 +1,67 @@
+import importlib.util
+import random
+from pathlib import Path
+
+import pytest
+from django.conf import settings
+
+from wiki.infoboxes import parser
+
+
+def _reference_parser():
+    path = Path(settings.BASE_DIR) / "dev" / "bench_infobox_parser.py"
+    spec = importlib.util.spec_from_file_location("bench_infobox_parser", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.reference_parse_params
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    parser.clear_caches()
+    yield
+    parser.clear_caches()
+
+
+def test_tokenizer_matches_reference_parser():
+    reference = _reference_parser()
+    rng = random.Random(50)
+    alphabet = ["|", "=", "'", '"', " ", "\n", "a", "B", "ř", "1"]
+    samples = ["".join(rng.choices(alphabet, k=rng.randint(0, 40))) for _ in range(3000)]
+    samples += ["| a==b | c= =d", "x | 'k'=v | e", '| q = "unterminated | r=1', "| =v"]
+    for raw in samples:
+        assert parser.parse_params(raw) == reference(raw), raw
+
+
+def test_compiled_schema_fields():
+    schema = parser.compile_schema("city")
+    assert schema is parser.compile_schema("city")
+    population = schema.fields["population"]
+    assert population.type == "number" and population.title == "Population"
+    assert population.format("1357326") == "1 357 326"
+    assert population.format("496,2") == "496,2"
+    assert "image" not in {f.name for f in schema.rows}
+    assert parser.load_schema("city")[0]["name"] == "name"
+    assert parser.compile_schema("planet") is None
+
+
+def test_number_validator_accepts_grouped_digits():
+    schema = parser.compile_schema("city")
+    params = {"population": "1 357 326", "area_km2": "", "elevation_m": "vysoko", "x": "1"}
+    assert schema.validate(params) == [
+        "Parameter elevation_m expects number",
+        "Unknown parameter: x",
+    ]
+
+
+def test_render_cache_is_bounded_lru(monkeypatch):
+    monkeypatch.setattr(parser, "RENDER_CACHE", parser.RenderCache(2))
+    for name in ["A", "B", "A", "C", "A", "B"]:
+        parser.process(f"{{{{Infobox city | name={name} }}}}", page_title="Page")
+    assert parser.render_cache_stats() == {"hits": 2, "misses": 4, "size": 2, "maxsize": 2}
+
+
+def test_render_cache_keys_on_page_title():
+    first = parser.process("{{Infobox city | population=5}}", page_title="Brno")
+    second = parser.process("{{Infobox city | population=5}}", page_title="Ostrava")
+    assert "Brno" in first and "Ostrava" in second
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import pytest
+from django.core.management import call_command
+
+from wiki.infoboxes.index import extract, find_articles, parse_number
+from wiki.models import Article, InfoboxValue
+
+
+def _city(title: str, country: str, population: str) -> Article:
+    return Article.objects.create(
+        title=title,
+        content_md=f"{{{{Infobox city | name={title} | country={country} | population={population} }}}}",
+    )
+
+
+def test_parse_number_and_extract():
+    assert parse_number("1 357 326") == 1357326
+    assert parse_number("496,2") == 496.2
+    assert parse_number("cca 5") is None
+    rows = extract(
+        "{{Infobox city | population=1 000 | mayor=Jan }} {{Infobox country | hdi=0,9 }}"
+    )
+    assert ("city", 0, "population", "1 000", 1000.0) in rows
+    assert ("city", 0, "mayor", "Jan", None) in rows
+    assert ("country", 1, "hdi", "0,9", 0.9) in rows
+
+
+@pytest.mark.django_db
+def test_index_follows_saves_and_sorts_numerically():
+    praha = _city("Praha", "Česko", "1 357 326")
+    _city("Brno", "Česko", "382405")
+    _city("Ostrava", "Česko", "284982")
+    _city("Vídeň", "Rakousko", "1931593")
+    Article.objects.create(title="Bez infoboxu", content_md="text")
+
+    qs = find_articles("city", {"country": "Česko"}, ["-population"], ["population"])
+    assert [(a.title, a.ib_population) for a in qs] == [
+        ("Praha", 1357326.0),
+        ("Brno", 382405.0),
+        ("Ostrava", 284982.0),
+    ]
+    # číselné porovnání, ne textové ("9" > "10" by textově platilo)
+    assert [
+        a.title for a in find_articles("city", {"population__lt": "1000000"}, ["population"])
+    ] == [
+        "Ostrava",
+        "Brno",
+    ]
+    with pytest.raises(ValueError):
+        find_articles("city", {"population": "abc"})
+
+    praha.content_md = "{{Infobox city | name=Praha | country=Česko }}"
+    praha.save()
+    assert InfoboxValue.objects.filter(article=praha).count() == 2
+    qs = find_articles("city", {"country": "Česko"}, ["-population"])
+    assert [a.title for a in qs][-1] == "Praha"  # bez hodnoty až na konci
+
+    praha.is_deleted = True
+    praha.save()
+    assert "Praha" not in [a.title for a in find_articles("city")]
+
+
+@pytest.mark.django_db
+def test_infobox_api(client):
+    _city("Brno", "Česko", "382405")
+    _city("Plzeň", "Česko", "175219")
+    resp = client.get(
+        "/api/infobox/city/", {"country": "Česko", "ordering": "population", "fields": "country"}
+    )
+    assert resp.status_code == 200
+    results = resp.json()["results"]
+    assert [r["slug"] for r in results] == ["plzen", "brno"]
+    assert results[0]["values"] == {"population": 175219.0, "country": "Česko"}
+    assert client.get("/api/infobox/city/", {"nope": "1"}).status_code == 400
+    for bad in ({"population__gte": "abc"}, {"population": "abc"}, {"population__in": "1,x"}):
+        assert client.get("/api/infobox/city/", bad).status_code == 400
+    assert client.get("/api/infobox/planet/").status_code == 404
+    # záporný limit nesmí skončit chybou záporného indexu
+    clamped = client.get("/api/infobox/city/", {"ordering": "population", "limit": "-5"})
+    assert [r["slug"] for r in clamped.json()["results"]] == ["plzen"]
+
+
+@pytest.mark.django_db
+def test_rebuild_command(capsys):
+    article = _city("Brno", "Česko", "382405")
+    InfoboxValue.objects.all().delete()
+    call_command("rebuild_infobox_index", type="city")
+    assert "1 articles" in capsys.readouterr().out
+    assert (
+        InfoboxValue.objects.filter(article=article, key="population").get().value_number == 382405
+    )
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+from decimal import Decimal
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+
+from wiki.models import Article, Category, CategoryArticle, Tag
+from wiki.models_data import DataCategory, DataPoint, DataSeries
+from wiki.static_export import MANIFEST_NAME, export_site
+
+
+@pytest.fixture
+def site():
+    cache.clear()
+    tag = Tag.objects.create(name="Města")
+    cat = Category.objects.create(name="Evropa", color="#ff0000")
+    pop = DataSeries.objects.create(slug="pop", unit="ob.")
+    DataPoint.objects.create(series=pop, key="2020", value=Decimal("100"))
+    praha = Article.objects.create(title="Praha", content_md="Viz [[Brno]], {{data:pop|2020}}")
+    praha.tags.add(tag)
+    brno = Article.objects.create(title="Brno", content_md="Město")
+    CategoryArticle.objects.create(category=cat, article=brno)
+    Article.objects.create(title="Koncept", content_md="x", status="draft")
+    return praha, brno
+
+
+@pytest.mark.django_db
+def test_export_writes_tree_and_manifest(tmp_path, site):
+    result = export_site(tmp_path)
+    assert sorted(result.rendered) == [
+        "brno/index.html",
+        "categories/evropa/index.html",
+        "praha/index.html",
+        "tags/mesta/index.html",
+    ]
+    html = (tmp_path / "praha/index.html").read_text(encoding="utf-8")
+    assert "100 ob." in html and "/wiki/brno/" in html
+    assert "Brno" in (tmp_path / "categories/evropa/index.html").read_text(encoding="utf-8")
+    manifest = json.loads((tmp_path / MANIFEST_NAME).read_text(encoding="utf-8"))
+    assert manifest["pages"]["praha/index.html"]["kind"] == "article"
+    assert not (tmp_path / "koncept").exists()
+
+
+@pytest.mark.django_db
+def test_export_is_incremental(tmp_path, site):
+    praha, brno = site
+    export_site(tmp_path)
+    assert export_site(tmp_path).rendered == []
+
+    brno.content_md = "Moravská metropole"
+    brno.save()
+    assert export_site(tmp_path).rendered == ["brno/index.html"]
+
+    # změna dat v řadě, na kterou článek odkazuje
+    cache.clear()
+    point = DataPoint.objects.get(key="2020")
+    point.value = Decimal("200")
+    point.save()
+    assert export_site(tmp_path).rendered == ["praha/index.html"]
+    assert "200 ob." in (tmp_path / "praha/index.html").read_text(encoding="utf-8")
+
+    brno.is_deleted = True
+    brno.save()
+    result = export_site(tmp_path)
+    assert result.removed == ["brno/index.html"]
+    # Praha odkazuje na smazané Brno, kategorie ho už nevypisuje
+    assert sorted(result.rendered) == ["categories/evropa/index.html", "praha/index.html"]
+    assert not (tmp_path / "brno").exists()
+
+
+@pytest.mark.django_db
+def test_command(tmp_path, site, capsys):
+    call_command("export_wiki_static", output=tmp_path, workers=1)
+    assert "Exported 4 pages, 0 unchanged, 0 removed" in capsys.readouterr().out
+    call_command("export_wiki_static", output=tmp_path, force=True)
+    assert "Exported 4 pages" in capsys.readouterr().out
+
+
+@pytest.mark.django_db
+def test_category_tables_infobox_schemas_and_tag_names_feed_the_hash(tmp_path, settings):
+    cache.clear()
+    (tmp_path / "infoboxes").mkdir()
+    schema = tmp_path / "infoboxes" / "city.schema.json"
+    schema.write_text('[{"name": "name", "title": "Name"}]', encoding="utf-8")
+    settings.BASE_DIR = tmp_path
+    out = tmp_path / "out"
+
+    category = DataCategory.objects.create(slug="mesta")
+    pop = DataSeries.objects.create(slug="pop")
+    pop.categories.add(category)
+    DataPoint.objects.create(series=pop, key="2020", value=Decimal("1"))
+    tag = Tag.objects.create(name="Data")
+    article = Article.objects.create(
+        title="Přehled", content_md="{{table:mesta|year=2020}} {{Infobox city | name=X }}"
+    )
+    article.tags.add(tag)
+    export_site(out)
+    assert export_site(out).rendered == []
+
+    area = DataSeries.objects.create(slug="area")
+    area.categories.add(category)
+    DataPoint.objects.create(series=area, key="2020", value=Decimal("2"))
+    assert export_site(out).rendered == ["prehled/index.html"]
+
+    schema.write_text('[{"name": "name", "title": "Název"}]', encoding="utf-8")
+    assert export_site(out).rendered == ["prehled/index.html"]
+
+    tag.name = "Statistiky"
+    tag.save()
+    assert "prehled/index.html" in export_site(out).rendered
+
+
+@pytest.mark.django_db
+def test_swapped_series_values_rerender(tmp_path):
+    cache.clear()
+    pop = DataSeries.objects.create(slug="pop")
+    a = DataPoint.objects.create(series=pop, key="2019", value=Decimal("1"))
+    b = DataPoint.objects.create(series=pop, key="2020", value=Decimal("2"))
+    Article.objects.create(title="Růst", content_md="{{data:pop|2020}}")
+    export_site(tmp_path)
+
+    # počet, součet i poslední klíč zůstávají stejné
+    a.value, b.value = Decimal("2"), Decimal("1")
+    a.save()
+    b.save()
+    assert export_site(tmp_path).rendered == ["rust/index.html"]
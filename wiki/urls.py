@@ -3,6 +3,7 @@ from rest_framework.routers import DefaultRouter
 
 from . import views
 from .api_data import DataPointDetail, DataSeriesByCategory, DataSeriesViewSet
+from .api_infobox import InfoboxQuery
 from .views_data import (
     DataSeriesCreateView,
     DataSeriesDeleteView,
@@ -56,6 +57,11 @@ urlpatterns = [
         views.ArticleDeleteView.as_view(),
         name="article-delete",
     ),
+    path(
+        "<slug:slug>/backlinks/",
+        views.ArticleBacklinksView.as_view(),
+        name="article-backlinks",
+    ),
     path(
         "<slug:slug>/history/",
         views.ArticleHistoryView.as_view(),
@@ -89,4 +95,5 @@ api_urlpatterns = [
         DataSeriesByCategory.as_view(),
         name="dataseries-category",
     ),
+    path("infobox/<str:ibox_type>/", InfoboxQuery.as_view(), name="infobox-query"),
 ] + router.urls
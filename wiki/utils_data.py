@@ -5,14 +5,16 @@ from __future__ import annotations
 import csv
 import io
 import re
-from collections.abc import Iterable
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
 from decimal import Decimal
 
 from django.core.cache import cache
-from django.db.models import Sum
+from django.db import transaction
+from django.db.models import Max, Q, QuerySet
 
-from .models_data import DataPoint, DataSeries
+from .models_data import DataPoint, DataSeries, bump_points_version
+from .packed_data import aggregate, get_packs, refresh_packs
 
 CACHE_TTL = 30  # seconds
 
@@ -63,30 +65,6 @@ def _parse_params(parts: Iterable[str]) -> tuple[str | None, ShortcodeParams]:
     return key, sp
 
 
-def _agg_query(series: DataSeries, agg: str) -> Decimal | None:
-    """Aggregate values based on ``agg`` expression."""
-
-    range_part = None
-    if ":" in agg:
-        agg, range_part = agg.split(":", 1)
-    qs = series.points.all()
-    if range_part:
-        start, end = range_part.split("-")
-        qs = qs.filter(key__gte=start, key__lte=end)
-    if agg == "latest":
-        point = qs.order_by("-key").first()
-        return point.value if point else None
-    if agg == "min":
-        point = qs.order_by("value").first()
-        return point.value if point else None
-    if agg == "max":
-        point = qs.order_by("-value").first()
-        return point.value if point else None
-    if agg == "sum":
-        return qs.aggregate(Sum("value"))["value__sum"]
-    return None
-
-
 def get_series_by_category(category: str):
     """Return a queryset of series assigned to ``category``."""
 
@@ -102,50 +80,147 @@ def get_value_for_year(series: DataSeries, year: str) -> Decimal | None:
         return None
 
 
+def get_values_for_keys(
+    series_qs: QuerySet[DataSeries], keys: Iterable[str]
+) -> list[tuple[DataSeries, dict[str, Decimal | None]]]:
+    """Return every series of ``series_qs`` with its values for ``keys``.
+
+    DataPoints are pivoted in the database – one column per key – so any
+    number of series and keys costs a single query.
+    """
+
+    keys = list(dict.fromkeys(keys))
+    columns = {f"_value_{i}": key for i, key in enumerate(keys)}
+    value_field = DataPoint._meta.get_field("value")
+    qs = series_qs.annotate(
+        **{
+            column: Max("points__value", filter=Q(points__key=key))
+            for column, key in columns.items()
+        }
+    )
+    # agregát nad filtrem přijde z SQLite bez pevného počtu desetinných míst
+    exponent = Decimal(1).scaleb(-value_field.decimal_places)
+    out = []
+    for series in qs:
+        values: dict[str, Decimal | None] = {}
+        for column, key in columns.items():
+            value = getattr(series, column)
+            values[key] = None if value is None else Decimal(value).quantize(exponent)
+        out.append((series, values))
+    return out
+
+
+# Každý klíč je jeden filtrovaný agregát (sloupec) v pivot dotazu.
+MAX_KEYS = 50
+
+
+def parse_keys(value: str) -> list[str]:
+    """Parse ``"2018,2019"`` or a year range ``"2000-2019"`` into keys.
+
+    Raises ``ValueError`` for more than :data:`MAX_KEYS` keys (checked before a
+    range is expanded).
+    """
+
+    value = value.strip()
+    if "," not in value and value.count("-") == 1:
+        start, end = value.split("-")
+        if start.isdigit() and end.isdigit() and int(start) <= int(end):
+            if int(end) - int(start) + 1 > MAX_KEYS:
+                raise ValueError(f"At most {MAX_KEYS} keys are allowed.")
+            return [str(y) for y in range(int(start), int(end) + 1)]
+    keys = [k.strip() for k in value.split(",") if k.strip()]
+    if len(keys) > MAX_KEYS:
+        raise ValueError(f"At most {MAX_KEYS} keys are allowed.")
+    return keys
+
+
+DATA_PATTERN = re.compile(r"\{\{data:(?P<slug>[^|}]+)(?:\|(?P<rest>[^}]+))?\}\}")
+TABLE_PATTERN = re.compile(r"\{\{table:(?P<slug>[^|}]+)(?:\|(?P<rest>[^}]+))?\}\}")
+
+
+@dataclass
+class _DataShortcode:
+    slug: str
+    key: str | None
+    params: ShortcodeParams
+
+    @property
+    def cache_key(self) -> str:
+        return f"ds-value:{self.slug}:{self.key}:{self.params.agg}"
+
+
+def _parse_data_shortcode(match: re.Match[str]) -> _DataShortcode:
+    rest = match.group("rest") or ""
+    key, params = _parse_params(p for p in rest.split("|") if p)
+    return _DataShortcode(slug=match.group("slug"), key=key, params=params)
+
+
+def _resolve_data_shortcodes(
+    codes: list[_DataShortcode],
+) -> dict[str, tuple[Decimal | None, str]]:
+    """Return ``(value, series unit)`` for ``codes`` keyed by cache key.
+
+    Cache misses are resolved together: one query for the series, one for
+    plain keys and one for the packs of aggregated series
+    (:mod:`wiki.packed_data`).
+    """
+
+    resolved = cache.get_many(list({c.cache_key for c in codes}))
+    missing = {c.cache_key: c for c in codes if c.cache_key not in resolved}
+    if not missing:
+        return resolved
+
+    series_by_slug = {
+        s.slug: s for s in DataSeries.objects.filter(slug__in={c.slug for c in missing.values()})
+    }
+    found = [c for c in missing.values() if c.slug in series_by_slug]
+    plain = [c for c in found if not c.params.agg and c.key is not None]
+    aggregated = [c for c in found if c.params.agg]
+
+    values: dict[tuple[int, str], Decimal] = {}
+    if plain:
+        rows = DataPoint.objects.filter(
+            series__in=[series_by_slug[c.slug] for c in plain],
+            key__in={c.key for c in plain},
+        ).values_list("series_id", "key", "value")
+        values = {(sid, key): value for sid, key, value in rows}
+
+    packs = get_packs({series_by_slug[c.slug].pk for c in aggregated}) if aggregated else {}
+
+    fetched: dict[str, tuple[Decimal | None, str]] = {}
+    for cache_key, code in missing.items():
+        series = series_by_slug.get(code.slug)
+        if series is None:
+            fetched[cache_key] = (None, "")
+        elif code.params.agg:
+            fetched[cache_key] = (aggregate(packs[series.pk], code.params.agg), series.unit)
+        else:
+            fetched[cache_key] = (values.get((series.pk, code.key)), series.unit)
+    cache.set_many(fetched, CACHE_TTL)
+    resolved.update(fetched)
+    return resolved
+
+
+def _render_data_shortcode(code: _DataShortcode, value: Decimal | None, unit: str) -> str:
+    if value is None:
+        return code.params.default
+    formatted = format_number(value, code.params.fmt)
+    return f"{formatted} {code.params.unit or unit}".strip()
+
+
 def replace_data_shortcodes(html: str) -> str:
     """Replace data-related shortcodes in HTML.
 
     Supports ``{{data:...}}``, ``{{chart:...}}``, ``{{table:...}}`` and
-    ``{{map:...}}``.
+    ``{{map:...}}``.  All ``{{data}}`` shortcodes of the document are resolved
+    together (see :func:`_resolve_data_shortcodes`) before substitution.
     """
 
-    def repl(match: re.Match[str]) -> str:
-        slug = match.group("slug")
-        rest = match.group("rest") or ""
-        parts = [p for p in rest.split("|") if p]
-        key, params = _parse_params(parts)
-        cache_key = f"ds:{slug}:{key}:{params.agg}"
-        cached = cache.get(cache_key)
-        if cached is not None:
-            return cached
-        try:
-            series = DataSeries.objects.get(slug=slug)
-        except DataSeries.DoesNotExist:
-            cache.set(cache_key, params.default, CACHE_TTL)
-            return params.default
-        value: Decimal | None
-        if params.agg:
-            value = _agg_query(series, params.agg)
-        else:
-            if key is None:
-                cache.set(cache_key, params.default, CACHE_TTL)
-                return params.default
-            try:
-                point = series.points.get(key=key)
-                value = point.value
-            except DataPoint.DoesNotExist:
-                value = None
-        if value is None:
-            cache.set(cache_key, params.default, CACHE_TTL)
-            return params.default
-        formatted = format_number(value, params.fmt)
-        unit = params.unit or series.unit
-        text = f"{formatted} {unit}".strip()
-        cache.set(cache_key, text, CACHE_TTL)
-        return text
-
-    data_pattern = re.compile(r"\{\{data:(?P<slug>[^|}]+)(?:\|(?P<rest>[^}]+))?\}\}")
-    html = data_pattern.sub(repl, html)
+    codes = [_parse_data_shortcode(m) for m in DATA_PATTERN.finditer(html)]
+    if codes:
+        resolved = _resolve_data_shortcodes(codes)
+        rendered = iter(_render_data_shortcode(c, *resolved[c.cache_key]) for c in codes)
+        html = DATA_PATTERN.sub(lambda m: next(rendered), html)
 
     def repl_chart(match: re.Match[str]) -> str:
         slug = match.group("slug")
@@ -155,10 +230,11 @@ def replace_data_shortcodes(html: str) -> str:
         data_from = params.get("from", "")
         data_to = params.get("to", "")
         height = params.get("height", "200")
+        max_points = params.get("points", "")
         return (
             f'<div class="ds-chart" data-series="{slug}" data-type="{chart_type}" '
             f'data-from="{data_from}" data-to="{data_to}" '
-            f'data-height="{height}"></div>'
+            f'data-height="{height}" data-max-points="{max_points}"></div>'
         )
 
     chart_pattern = re.compile(r"\{\{chart:(?P<slug>[^|}]+)(?:\|(?P<rest>[^}]+))?\}\}")
@@ -168,36 +244,43 @@ def replace_data_shortcodes(html: str) -> str:
         cat_slug = match.group("slug")
         rest = match.group("rest") or ""
         params = dict(part.split("=", 1) for part in rest.split("|") if "=" in part)
-        year = params.get("year")
+        # ``years=2018,2020`` nebo ``years=2000-2019`` vykreslí srovnávací tabulku
+        try:
+            years = parse_keys(params["years"]) if params.get("years") else []
+        except ValueError:
+            return ""
+        year = params.get("year") or (years[-1] if years else None)
         if not year:
             return ""
+        years = years or [year]
         sort = params.get("sort", "value")
         desc = params.get("desc", "0") == "1"
         limit = int(params.get("limit", "0") or 0) or None
         fmt = params.get("fmt")
         unit = params.get("unit") == "1"
         empty = params.get("empty", "—")
-        cache_key = f"ds-table:{cat_slug}:{year}:{sort}:{desc}:{limit}:{fmt}:{unit}:{empty}"
+        cache_key = f"ds-table:{cat_slug}:{','.join(years)}:{year}:{sort}:{desc}:{limit}:{fmt}:{unit}:{empty}"
         cached = cache.get(cache_key)
         if cached is not None:
             return cached
         rows: list[dict[str, object]] = []
-        for series in get_series_by_category(cat_slug):
-            value = get_value_for_year(series, year)
-            if value is None:
-                display = empty
-                value_sort: Decimal | None = None
-            else:
+        for series, values in get_values_for_keys(get_series_by_category(cat_slug), [*years, year]):
+            displays = []
+            for key in years:
+                value = values[key]
+                if value is None:
+                    displays.append(empty)
+                    continue
                 display = format_number(value, fmt)
                 if unit and series.unit:
                     display = f"{display} {series.unit}"
-                value_sort = value
+                displays.append(display)
             rows.append(
                 {
                     "title": series.title or series.slug,
                     "slug": series.slug,
-                    "display": display,
-                    "value_sort": value_sort,
+                    "displays": displays,
+                    "value_sort": values[year],
                 }
             )
         if sort == "title":
@@ -210,17 +293,19 @@ def replace_data_shortcodes(html: str) -> str:
             rows.reverse()
         if limit:
             rows = rows[:limit]
-        body = "".join(f"<tr><td>{r['title']}</td><td>{r['display']}</td></tr>" for r in rows)
+        body = "".join(
+            f"<tr><td>{r['title']}</td>" + "".join(f"<td>{d}</td>" for d in r["displays"]) + "</tr>"
+            for r in rows
+        )
+        head = "".join(f"<th>Hodnota ({key})</th>" for key in years)
         html_table = (
-            f'<table class="ds-table"><thead><tr><th>Název</th>'
-            f"<th>Hodnota ({year})</th></tr></thead>"
+            f'<table class="ds-table"><thead><tr><th>Název</th>{head}</tr></thead>'
             f"<tbody>{body}</tbody></table>"
         )
         cache.set(cache_key, html_table, CACHE_TTL)
         return html_table
 
-    table_pattern = re.compile(r"\{\{table:(?P<slug>[^|}]+)(?:\|(?P<rest>[^}]+))?\}\}")
-    html = table_pattern.sub(repl_table, html)
+    html = TABLE_PATTERN.sub(repl_table, html)
 
     def repl_map(match: re.Match[str]) -> str:
         category = match.group("slug")
@@ -240,25 +325,104 @@ def replace_data_shortcodes(html: str) -> str:
     return map_pattern.sub(repl_map, html)
 
 
-def import_csv_to_series(series: DataSeries, file_obj: io.TextIOBase) -> tuple[int, int]:
-    """Import CSV data into ``series``.
+IMPORT_CHUNK_SIZE = 2000
+
+
+@dataclass
+class ImportStats:
+    rows: int = 0
+    created: int = 0
+    updated: int = 0
+    series: set[str] = field(default_factory=set)
 
-    Returns a tuple ``(created, updated)``.
-    """
 
-    reader = csv.reader(file_obj, delimiter=";")
-    created = updated = 0
-    for row in reader:
+def _csv_rows(file_obj: io.TextIOBase) -> Iterator[list[str]]:
+    for row in csv.reader(file_obj, delimiter=";"):
         if not row or row[0].startswith("#"):
             continue
-        if row[0].lower() == "key":  # header
+        if row[0].lower() in {"key", "series"}:  # header
             continue
-        key, value = row[0], row[1]
-        dp, was_created = DataPoint.objects.update_or_create(
-            series=series, key=key, defaults={"value": Decimal(value)}
+        yield row
+
+
+def _upsert_chunk(chunk: dict[tuple[int, str], Decimal], stats: ImportStats) -> None:
+    series_ids = {sid for sid, _ in chunk}
+    keys = {key for _, key in chunk}
+    with transaction.atomic():
+        existing = set(
+            DataPoint.objects.filter(series_id__in=series_ids, key__in=keys).values_list(
+                "series_id", "key"
+            )
         )
-        if was_created:
-            created += 1
-        else:
-            updated += 1
-    return created, updated
+        DataPoint.objects.bulk_create(
+            [DataPoint(series_id=sid, key=key, value=value) for (sid, key), value in chunk.items()],
+            update_conflicts=True,
+            unique_fields=["series", "key"],
+            update_fields=["value"],
+        )
+        # bulk_create obchází DataPoint.save
+        bump_points_version(series_ids)
+    updated = len(existing & chunk.keys())
+    stats.updated += updated
+    stats.created += len(chunk) - updated
+
+
+def import_csv(
+    file_obj: io.TextIOBase,
+    series: DataSeries | None = None,
+    *,
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+    progress: Callable[[ImportStats], None] | None = None,
+) -> ImportStats:
+    """Stream CSV rows into DataPoints with chunked bulk upserts.
+
+    With ``series`` the rows are ``key;value``; without it ``series;key;value``
+    and missing series are created.  Every chunk is upserted in its own short
+    transaction; ``progress`` is called after each chunk.  A key repeated in
+    the file keeps its last value.
+    """
+
+    stats = ImportStats()
+    series_ids: dict[str, int] = {}
+    if series is not None:
+        series_ids[series.slug] = series.pk
+    chunk: dict[tuple[int, str], Decimal] = {}
+
+    def flush() -> None:
+        if chunk:
+            _upsert_chunk(chunk, stats)
+            chunk.clear()
+            if progress:
+                progress(stats)
+
+    try:
+        for row in _csv_rows(file_obj):
+            if series is not None:
+                slug, key, value = series.slug, row[0], row[1]
+            else:
+                slug, key, value = row[0], row[1], row[2]
+            if slug not in series_ids:
+                series_ids[slug] = DataSeries.objects.get_or_create(slug=slug)[0].pk
+            stats.rows += 1
+            stats.series.add(slug)
+            # opakovaný klíč v jednom chunku by upsert odmítl (Postgres)
+            chunk_key = (series_ids[slug], key)
+            chunk.pop(chunk_key, None)
+            chunk[chunk_key] = Decimal(value)
+            if len(chunk) >= chunk_size:
+                flush()
+        flush()
+    finally:
+        # i po chybě už zapsané chunky zůstávají – packy přestavět hned
+        refresh_packs(series_ids[slug] for slug in stats.series)
+    return stats
+
+
+def import_csv_to_series(series: DataSeries, file_obj: io.TextIOBase) -> tuple[int, int]:
+    """Import CSV data into ``series``.
+
+    Returns a tuple ``(created, updated)``.
+    """
+
+    stats = import_csv(file_obj, series)
+    return stats.created, stats.updated
@@ -1,5 +1,3 @@
-import difflib
-
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.forms import inlineformset_factory
 from django.http import JsonResponse
@@ -14,8 +12,10 @@ from django.views.generic import (
     View,
 )
 
+from . import links
 from .infoboxes import parser as infobox_parser
 from .models import Article, ArticleRevision, Category, CategoryArticle
+from .revisions import diff_to_current, unified_diff
 
 
 class StaffRequiredMixin(LoginRequiredMixin, UserPassesTestMixin):
@@ -73,6 +73,20 @@ class ArticleDetailView(DetailView):
         return Article.objects.filter(is_deleted=False)
 
 
+class ArticleBacklinksView(ListView):
+    template_name = "wiki/article_backlinks.html"
+    context_object_name = "sources"
+
+    def get_queryset(self):
+        self.article = get_object_or_404(Article, slug=self.kwargs["slug"], is_deleted=False)
+        return links.backlinks(self.article)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["article"] = self.article
+        return context
+
+
 class ArticleCreateView(InfoboxContextMixin, AdminModeRequiredMixin, CreateView):
     model = Article
     fields = ["title", "summary", "content_md", "status", "tags"]
@@ -142,13 +156,19 @@ class ArticleRevisionDiffView(AdminModeRequiredMixin, View):
     def get(self, request, slug, rev_id):
         article = get_object_or_404(Article, slug=slug)
         rev = get_object_or_404(ArticleRevision, pk=rev_id, article=article)
-        diff = difflib.HtmlDiff().make_table(
-            rev.content_md.splitlines(),
-            article.content_md.splitlines(),
-            fromdesc="rev",
-            todesc="current",
+        # bez ``to`` se porovnává s aktuálním textem článku (i po úpravě v adminu)
+        to_id = request.GET.get("to")
+        if to_id:
+            target = get_object_or_404(ArticleRevision, pk=to_id, article=article)
+            diff = unified_diff(rev, target)
+        else:
+            target = None
+            diff = diff_to_current(rev, article)
+        return render(
+            request,
+            "wiki/article_diff.html",
+            {"article": article, "rev": rev, "target": target, "diff": diff},
         )
-        return render(request, "wiki/article_diff.html", {"article": article, "diff": diff})
 
 
 class ArticleRevisionRevertView(AdminModeRequiredMixin, View):